@@ -0,0 +1,40 @@
+"""Hit/miss counters for a cache-aside read path."""
+from libs.common.metrics import cache_requests
+
+
+class CacheStats:
+    def __init__(self, name: str | None = None) -> None:
+        """`name` also exports the counters as cache_requests_total{cache=name}."""
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+        self._exported = None
+        if name is not None:
+            self._exported = {
+                result: cache_requests.labels(name, result)
+                for result in ("hit", "negative_hit", "miss")
+            }
+
+    def record_hit(self, negative: bool = False) -> None:
+        """Count a hit; `negative` marks a cached "does not exist" answer."""
+        if negative:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        if self._exported is not None:
+            self._exported["negative_hit" if negative else "hit"].inc()
+
+    def record_miss(self) -> None:
+        self.misses += 1
+        if self._exported is not None:
+            self._exported["miss"].inc()
+
+    def snapshot(self) -> dict[str, float]:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.hits + self.negative_hits) / lookups, 4) if lookups else 0.0,
+        }
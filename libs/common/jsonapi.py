@@ -7,20 +7,48 @@ def serialize_resource(
     return {"data": {"type": resource_type, "id": resource_id, "attributes": attributes}}
 
 
-def serialize_collection(
-    resource_type: str, items: list[dict[str, Any]], page: int, size: int, total: int
-) -> dict[str, Any]:
+def _resource_objects(resource_type: str, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
     data = []
     for item in items:
         item_id = item.pop("id")
         data.append({"type": resource_type, "id": str(item_id), "attributes": item})
+    return data
+
 
+def serialize_collection(
+    resource_type: str, items: list[dict[str, Any]], page: int, size: int, total: int
+) -> dict[str, Any]:
     return {
-        "data": data,
+        "data": _resource_objects(resource_type, items),
         "meta": {"page": {"number": page, "size": size, "total": total}},
     }
 
 
+def serialize_resources(
+    resource_type: str, items: list[dict[str, Any]], meta: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Non-paginated collection, e.g. the per-item results of a bulk operation."""
+    document: dict[str, Any] = {"data": _resource_objects(resource_type, items)}
+    if meta:
+        document["meta"] = meta
+    return document
+
+
+def serialize_cursor_collection(
+    resource_type: str,
+    items: list[dict[str, Any]],
+    size: int,
+    self_link: str,
+    next_link: str | None,
+) -> dict[str, Any]:
+    """Collection paginated by cursor: no total, `links.next` is null on the last page."""
+    return {
+        "data": _resource_objects(resource_type, items),
+        "links": {"self": self_link, "next": next_link},
+        "meta": {"page": {"size": size}},
+    }
+
+
 def serialize_error(status: str, title: str, detail: str, source: dict[str, Any] | None = None) -> dict[str, Any]:
     error = {"status": status, "title": title, "detail": detail}
     if source:
@@ -1,15 +1,29 @@
+import atexit
+import copy
+import functools
 import logging
+import queue
 import sys
 import time
+from collections.abc import Awaitable, Callable
 from contextvars import ContextVar
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, ParamSpec, TypeVar
 
+import orjson
 from pythonjsonlogger import jsonlogger
 
 # Context variables for request tracking
 request_id_ctx: ContextVar[str] = ContextVar("request_id", default="unknown")
 user_id_ctx: ContextVar[str | None] = ContextVar("user_id", default=None)
 operation_ctx: ContextVar[str | None] = ContextVar("operation", default=None)
+# Per-request time breakdown ({"db": [seconds, calls], ...}); None when not collecting
+server_timings_ctx: ContextVar[dict[str, list[float]] | None] = ContextVar(
+    "server_timings", default=None
+)
+
+P = ParamSpec("P")
+T = TypeVar("T")
 
 
 class StructuredJsonFormatter(jsonlogger.JsonFormatter):
@@ -30,11 +44,12 @@ class StructuredJsonFormatter(jsonlogger.JsonFormatter):
         log_record["function"] = record.funcName
         log_record["line"] = record.lineno
 
-        # Request context from contextvars
-        log_record["request_id"] = request_id_ctx.get()
-        if user_id := user_id_ctx.get():
+        # Request context: captured on the record by ContextQueueHandler in async
+        # mode (the listener thread cannot see the request's contextvars)
+        log_record["request_id"] = getattr(record, "request_id", None) or request_id_ctx.get()
+        if user_id := getattr(record, "user_id", None) or user_id_ctx.get():
             log_record["user_id"] = user_id
-        if operation := operation_ctx.get():
+        if operation := getattr(record, "operation", None) or operation_ctx.get():
             log_record["operation"] = operation
 
         # Additional context from extra
@@ -46,40 +61,212 @@ class StructuredJsonFormatter(jsonlogger.JsonFormatter):
             log_record["error_type"] = record.error_type
 
 
-def setup_logging(service_name: str, log_level: str = "INFO") -> logging.Logger:
+# Attributes every LogRecord has; anything else on a record came from `extra`
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "service"}
+_CONTEXT_FIELDS = ("request_id", "user_id", "operation")
+
+
+class FastJsonFormatter(logging.Formatter):
+    """JSON lines encoded with orjson; same fields as StructuredJsonFormatter.
+
+    The service name is fixed per formatter and the timestamp prefix is rendered
+    once per second, so a record costs one dict build and one orjson.dumps.
+    """
+
+    def __init__(self, service_name: str) -> None:
+        super().__init__()
+        self.service_name = service_name
+        self._second = -1
+        self._second_prefix = ""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_record: dict[str, Any] = {
+            "timestamp": self._timestamp(record.created),
+            "level": record.levelname,
+            "service": self.service_name,
+            "request_id": getattr(record, "request_id", None) or request_id_ctx.get(),
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+        }
+        if user_id := getattr(record, "user_id", None) or user_id_ctx.get():
+            log_record["user_id"] = user_id
+        if operation := getattr(record, "operation", None) or operation_ctx.get():
+            log_record["operation"] = operation
+
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and key not in _CONTEXT_FIELDS:
+                log_record[key] = value
+
+        if record.exc_info:
+            log_record["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_record["exc_info"] = record.exc_text
+        if record.stack_info:
+            log_record["stack_info"] = record.stack_info
+
+        return orjson.dumps(log_record, default=str).decode()
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        if second != self._second:
+            self._second_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second = second
+        return f"{self._second_prefix}.{int((created - second) * 1000):03d}Z"
+
+
+class ContextQueueHandler(QueueHandler):
+    """QueueHandler for a bounded queue that snapshots the request context.
+
+    With the "drop" policy a full queue discards the record (counted in `dropped`)
+    instead of stalling the event loop on a slow stdout; "block" waits for room.
+    """
+
+    def __init__(self, log_queue: queue.Queue, policy: str = "drop") -> None:
+        if policy not in ("drop", "block"):
+            raise ValueError(f"Unsupported log queue policy: {policy}")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Copy so other handlers still see the original record
+        record = copy.copy(record)
+        for name, var in (
+            ("request_id", request_id_ctx),
+            ("user_id", user_id_ctx),
+            ("operation", operation_ctx),
+        ):
+            value = var.get()
+            if value is not None and not hasattr(record, name):
+                setattr(record, name, value)
+
+        # Merge args and render the traceback now: they may not be picklable or
+        # may change before the listener thread formats the record
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_handler: logging.Handler | None = None
+_queue_handler: ContextQueueHandler | None = None
+_queue_listener: QueueListener | None = None
+_base_record_factory: Callable[..., logging.LogRecord] | None = None
+
+
+def setup_logging(
+    service_name: str,
+    log_level: str = "INFO",
+    async_mode: bool = False,
+    queue_size: int = 10_000,
+    queue_policy: str = "drop",
+    fast_formatter: bool = True,
+) -> logging.Logger:
     """Setup structured JSON logging for a service.
 
+    The handler is installed on the root logger, so module loggers
+    (`logging.getLogger(__name__)` in libs.common and the services) go through
+    the same formatter and, in async mode, the same queue as the service logger.
+
     Args:
         service_name: Name of the service (e.g. 'products', 'inventory')
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        async_mode: Format and write records on a background thread; callers
+            only put them on a bounded queue
+        queue_size: Capacity of the queue in async mode
+        queue_policy: "drop" or "block" when the queue is full (async mode)
+        fast_formatter: Encode with FastJsonFormatter (orjson) instead of
+            StructuredJsonFormatter (python-json-logger)
 
     Returns:
         Configured logger instance
     """
+    global _handler, _queue_handler, _queue_listener, _base_record_factory
+
+    level = getattr(logging, log_level.upper())
+    root = logging.getLogger()
+    root.setLevel(level)
     logger = logging.getLogger(service_name)
-    logger.setLevel(getattr(logging, log_level.upper()))
+    logger.setLevel(level)
 
-    if not logger.handlers:
+    if _handler is None:
         handler = logging.StreamHandler(sys.stdout)
-        formatter = StructuredJsonFormatter(
-            "%(timestamp)s %(level)s %(service)s %(request_id)s %(message)s"
-        )
+        if fast_formatter:
+            formatter: logging.Formatter = FastJsonFormatter(service_name)
+        else:
+            formatter = StructuredJsonFormatter(
+                "%(timestamp)s %(level)s %(service)s %(request_id)s %(message)s"
+            )
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
 
-    # Add service name to all records
-    old_factory = logging.getLogRecordFactory()
+        if async_mode:
+            _queue_handler = ContextQueueHandler(queue.Queue(queue_size), queue_policy)
+            _queue_listener = QueueListener(
+                _queue_handler.queue, handler, respect_handler_level=True
+            )
+            _queue_listener.start()
+            atexit.register(shutdown_logging)
+            _handler = _queue_handler
+        else:
+            _handler = handler
+        root.addHandler(_handler)
+
+    # Add service name to all records; wrap the original factory only once
+    if _base_record_factory is None:
+        _base_record_factory = logging.getLogRecordFactory()
+    base_factory = _base_record_factory
 
     def record_factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
-        record = old_factory(*args, **kwargs)
+        record = base_factory(*args, **kwargs)
         record.service = service_name
         return record
 
     logging.setLogRecordFactory(record_factory)
-    logger.propagate = False
     return logger
 
 
+def shutdown_logging() -> None:
+    """Flush the async logging queue, stop its writer thread and detach the handler."""
+    global _handler, _queue_handler, _queue_listener, _base_record_factory
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler = None
+    _queue_handler = None
+    if _base_record_factory is not None:
+        logging.setLogRecordFactory(_base_record_factory)
+        _base_record_factory = None
+
+
+def logging_stats() -> dict[str, Any]:
+    """Queue depth and dropped records of the async mode."""
+    if _queue_handler is None:
+        return {"mode": "sync"}
+    return {
+        "mode": "async",
+        "policy": _queue_handler.policy,
+        "queued": _queue_handler.queue.qsize(),
+        "capacity": _queue_handler.queue.maxsize,
+        "dropped": _queue_handler.dropped,
+    }
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance by name."""
     return logging.getLogger(name)
@@ -113,6 +300,56 @@ class LogContext:
             token.var.reset(token)
 
 
+def add_timing(name: str, seconds: float) -> None:
+    """Add `seconds` to the `name` bucket of the current request's time breakdown."""
+    timings = server_timings_ctx.get()
+    if timings is None:
+        return
+    entry = timings.get(name)
+    if entry is None:
+        timings[name] = [seconds, 1]
+    else:
+        entry[0] += seconds
+        entry[1] += 1
+
+
+def timed(name: str) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Decorator adding an async call's duration to the request breakdown under `name`.
+
+    When no collector is active the only cost is one ContextVar lookup.
+    """
+
+    def decorator(fn: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            if server_timings_ctx.get() is None:
+                return await fn(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                add_timing(name, time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
+def timings_summary(timings: dict[str, list[float]]) -> dict[str, float]:
+    """Milliseconds per bucket, for log lines."""
+    return {name: round(total * 1000, 2) for name, (total, _calls) in timings.items()}
+
+
+def format_server_timing(timings: dict[str, list[float]], total_seconds: float) -> str:
+    """Server-Timing header value: one metric per bucket plus the total."""
+    metrics = [
+        f'{name};dur={total * 1000:.2f};desc="{int(calls)} call(s)"'
+        for name, (total, calls) in timings.items()
+    ]
+    metrics.append(f"total;dur={total_seconds * 1000:.2f}")
+    return ", ".join(metrics)
+
+
 class LogTimer:
     """Context manager for timing operations and logging duration."""
 
@@ -0,0 +1,130 @@
+"""
+Prometheus metrics shared by the services.
+
+With several uvicorn workers, set PROMETHEUS_MULTIPROC_DIR to an empty, writable
+directory before the workers start: every process then writes its samples to
+memory-mapped files there and /metrics aggregates all of them.
+
+Hot-path cost is one histogram observation or counter increment per event; label
+children are resolved once and cached where the label set is fixed.
+"""
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Latency buckets in seconds, from cache hits to slow remote queries
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+http_requests_in_progress = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+grpc_server_call_duration = Histogram(
+    "grpc_server_call_duration_seconds",
+    "gRPC calls handled by this service",
+    ["method", "code"],
+    buckets=LATENCY_BUCKETS,
+)
+grpc_client_call_duration = Histogram(
+    "grpc_client_call_duration_seconds",
+    "gRPC calls made by this service",
+    ["method", "code"],
+    buckets=LATENCY_BUCKETS,
+)
+cache_requests = Counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result (hit, negative_hit, miss)",
+    ["cache", "result"],
+)
+db_pool_checkout_wait = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a database connection from the pool",
+    buckets=LATENCY_BUCKETS,
+)
+db_pool_checkout_timeouts = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout",
+)
+db_pool_checked_out = Gauge(
+    "db_pool_connections_checked_out",
+    "Database connections currently in use",
+    multiprocess_mode="livesum",
+)
+db_pool_capacity = Gauge(
+    "db_pool_connections_capacity",
+    "pool_size + max_overflow",
+    multiprocess_mode="livesum",
+)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Exposition payload and content type for a /metrics endpoint."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead() -> None:
+    """Drop this worker's live gauges from the aggregate; call on shutdown."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(os.getpid())
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording latency by route template and in-flight requests.
+
+    Add it after RequestContextMiddleware so it wraps it and sees the final
+    status of requests that raised.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = http_requests_in_progress.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            # FastAPI stores the matched route in the scope; unmatched paths share
+            # one label so random URLs cannot blow up the series count
+            route = scope.get("route")
+            http_request_duration.labels(
+                method, getattr(route, "path", "unmatched"), str(status_code)
+            ).observe(time.perf_counter() - started)
@@ -1,126 +1,170 @@
+import itertools
 import logging
 import time
 import uuid
-from typing import Callable
 
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from libs.common.errors import BaseAPIError
 from libs.common.jsonapi import serialize_error
-from libs.common.logging import request_id_ctx
+from libs.common.logging import (
+    format_server_timing,
+    request_id_ctx,
+    server_timings_ctx,
+    timings_summary,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to generate and propagate request IDs for distributed tracing."""
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-        request.state.request_id = request_id
-
-        # Set request_id in context for structured logging
+class RequestContextMiddleware:
+    """
+    Pure ASGI middleware for the per-request context: request ID propagation,
+    request logging with timing, and JSON:API error responses.
+
+    One layer instead of three BaseHTTPMiddleware subclasses, which each ran
+    the downstream app in a separate task behind a memory stream and buffered
+    streaming responses.
+
+    Successful request logs can be sampled: with `sample_every=N` only 1 in N
+    requests is logged, plus every error response and every request slower
+    than `slow_request_ms`.
+
+    With `server_timing`, time spent in code decorated with `timed` (database,
+    cache, gRPC) is collected per request and returned in a Server-Timing header
+    and on the request_completed log line. When off, nothing is collected.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_every: int = 1,
+        slow_request_ms: float | None = None,
+        server_timing: bool = False,
+    ) -> None:
+        self.app = app
+        self.sample_every = max(sample_every, 1)
+        self.slow_request_ms = slow_request_ms
+        self.server_timing = server_timing
+        self._requests = itertools.count()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("x-request-id") or str(uuid.uuid4())
+        # Visible to handlers as request.state.request_id
+        scope.setdefault("state", {})["request_id"] = request_id
         token = request_id_ctx.set(request_id)
-
-        try:
-            response = await call_next(request)
-            response.headers["X-Request-ID"] = request_id
-            return response
-        finally:
-            # Reset context
-            request_id_ctx.reset(token)
-
-
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """Middleware to handle errors and return JSON:API compliant error responses."""
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        try:
-            response = await call_next(request)
-            return response
-        except BaseAPIError as e:
-            logger.error(
-                f"API Error: {e.detail}",
+        timings: dict[str, list[float]] | None = {} if self.server_timing else None
+        timings_token = server_timings_ctx.set(timings) if timings is not None else None
+
+        method = scope["method"]
+        path = scope["path"]
+        status_code = 500
+        response_started = False
+        sampled = self.sample_every == 1 or next(self._requests) % self.sample_every == 0
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                if timings is not None:
+                    headers.append(
+                        "Server-Timing",
+                        format_server_timing(timings, time.perf_counter() - start_time),
+                    )
+            await send(message)
+
+        if sampled:
+            logger.info(
+                f"{method} {path}",
                 extra={
-                    "request_id": getattr(request.state, "request_id", "unknown"),
-                    "status_code": e.status,
-                    "title": e.title,
-                    "path": request.url.path,
-                    "method": request.method,
+                    "event": "request_started",
+                    "method": method,
+                    "path": path,
+                    "query_params": scope.get("query_string", b"").decode("latin-1"),
+                    "request_id": request_id,
                 },
             )
-            return JSONResponse(
-                status_code=int(e.status),
-                content=serialize_error(e.status, e.title, e.detail, e.source),
-            )
+        start_time = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
         except Exception as e:
-            logger.exception(
-                "Unhandled exception",
+            logger.error(
+                f"{method} {path} - Error",
                 extra={
-                    "request_id": getattr(request.state, "request_id", "unknown"),
-                    "path": request.url.path,
-                    "method": request.method,
+                    "event": "request_failed",
+                    "method": method,
+                    "path": path,
+                    "duration_ms": round((time.perf_counter() - start_time) * 1000, 2),
                     "error_type": type(e).__name__,
+                    "request_id": request_id,
                 },
             )
-            return JSONResponse(
-                status_code=500,
-                content=serialize_error(
-                    "500", "Internal Server Error", "An unexpected error occurred"
-                ),
-            )
-
-
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all HTTP requests with timing and status."""
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-        request_id = getattr(request.state, "request_id", "unknown")
-
-        # Log incoming request
-        logger.info(
-            f"{request.method} {request.url.path}",
-            extra={
-                "event": "request_started",
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": str(request.query_params),
-                "request_id": request_id,
-            },
-        )
-
-        try:
-            response = await call_next(request)
-            duration_ms = (time.time() - start_time) * 1000
-
-            # Log completed request
-            logger.info(
-                f"{request.method} {request.url.path} - {response.status_code}",
-                extra={
+            if response_started:
+                # Headers are already on the wire; nothing sensible left to send
+                raise
+            response = self._error_response(e, method, path, request_id)
+            await response(scope, receive, send_with_request_id)
+        else:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            slow = self.slow_request_ms is not None and duration_ms >= self.slow_request_ms
+            if sampled or slow or status_code >= 400:
+                extra = {
                     "event": "request_completed",
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
+                    "method": method,
+                    "path": path,
+                    "status_code": status_code,
                     "duration_ms": round(duration_ms, 2),
                     "request_id": request_id,
-                },
-            )
-            return response
-        except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+                    "sample_every": self.sample_every,
+                }
+                if timings is not None:
+                    extra["timings"] = timings_summary(timings)
+                logger.info(f"{method} {path} - {status_code}", extra=extra)
+        finally:
+            if timings_token is not None:
+                server_timings_ctx.reset(timings_token)
+            request_id_ctx.reset(token)
+
+    def _error_response(
+        self, error: Exception, method: str, path: str, request_id: str
+    ) -> JSONResponse:
+        if isinstance(error, BaseAPIError):
             logger.error(
-                f"{request.method} {request.url.path} - Error",
+                f"API Error: {error.detail}",
                 extra={
-                    "event": "request_failed",
-                    "method": request.method,
-                    "path": request.url.path,
-                    "duration_ms": round(duration_ms, 2),
-                    "error_type": type(e).__name__,
                     "request_id": request_id,
+                    "status_code": error.status,
+                    "title": error.title,
+                    "path": path,
+                    "method": method,
                 },
             )
-            raise
+            return JSONResponse(
+                status_code=int(error.status),
+                content=serialize_error(error.status, error.title, error.detail, error.source),
+            )
 
+        logger.error(
+            "Unhandled exception",
+            exc_info=error,
+            extra={
+                "request_id": request_id,
+                "path": path,
+                "method": method,
+                "error_type": type(error).__name__,
+            },
+        )
+        return JSONResponse(
+            status_code=500,
+            content=serialize_error("500", "Internal Server Error", "An unexpected error occurred"),
+        )
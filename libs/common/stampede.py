@@ -0,0 +1,75 @@
+"""
+Cache stampede protection helpers.
+
+- SingleFlight: concurrent loads of the same key inside a process share one call.
+- LoadTimeTracker: moving average of how long a recompute takes.
+- should_refresh_early: probabilistic early expiration (XFetch), so one caller
+  refreshes a hot key shortly before it expires instead of everyone missing at once.
+"""
+import asyncio
+import math
+import random
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future] = {}
+
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run `fn` unless a call for `key` is already in flight, in which case await its result."""
+        future = self._calls.get(key)
+        if future is not None:
+            self.shared += 1
+            return await asyncio.shield(future)
+
+        self.calls += 1
+        future = asyncio.ensure_future(fn())
+        self._calls[key] = future
+        future.add_done_callback(lambda f: self._forget(key, f))
+        # shield: a cancelled caller must not cancel the load the others are awaiting
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict[str, int]:
+        return {"in_flight": len(self._calls), "calls": self.calls, "shared": self.shared}
+
+    def _forget(self, key: str, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved when every waiter was cancelled
+            future.exception()
+
+
+class LoadTimeTracker:
+    """Exponentially weighted moving average of recompute durations, in seconds."""
+
+    def __init__(self, initial: float = 0.05, alpha: float = 0.2) -> None:
+        self.value = initial
+        self.alpha = alpha
+
+    def observe(self, seconds: float) -> None:
+        self.value += self.alpha * (seconds - self.value)
+
+
+def should_refresh_early(
+    ttl_remaining: float,
+    recompute_time: float,
+    beta: float = 1.0,
+    rand: Callable[[], float] = random.random,
+) -> bool:
+    """
+    XFetch: refresh when `recompute_time * beta * -ln(U)` reaches the remaining TTL.
+
+    The probability is negligible for fresh keys and approaches 1 as expiry nears;
+    slower recomputes start refreshing earlier.
+    """
+    if ttl_remaining <= 0:
+        return True
+    return recompute_time * beta * -math.log(1.0 - rand()) >= ttl_remaining
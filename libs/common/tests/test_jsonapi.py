@@ -1,6 +1,8 @@
 from libs.common.jsonapi import (
     serialize_resource,
     serialize_collection,
+    serialize_cursor_collection,
+    serialize_resources,
     serialize_error,
     serialize_errors,
 )
@@ -33,6 +35,17 @@ def test_serialize_collection() -> None:
     assert result["meta"]["page"]["total"] == 2
 
 
+def test_serialize_resources_with_meta() -> None:
+    items = [{"id": "1", "status": "updated"}, {"id": "2", "status": "not_found"}]
+
+    result = serialize_resources("inventory-adjustments", items, meta={"updated": 1})
+
+    assert [r["id"] for r in result["data"]] == ["1", "2"]
+    assert result["data"][1]["attributes"] == {"status": "not_found"}
+    assert result["meta"] == {"updated": 1}
+    assert "meta" not in serialize_resources("inventory-adjustments", [])
+
+
 def test_serialize_error() -> None:
     result = serialize_error("404", "Not Found", "Resource not found")
 
@@ -54,3 +67,19 @@ def test_serialize_errors() -> None:
     assert result["errors"][0]["status"] == "400"
     assert result["errors"][1]["status"] == "422"
 
+
+def test_serialize_cursor_collection() -> None:
+    items = [{"id": "1", "name": "Product 1"}]
+
+    result = serialize_cursor_collection(
+        "products",
+        items,
+        size=1,
+        self_link="/api/v1/products?page%5Bcursor%5D=",
+        next_link="/api/v1/products?page%5Bcursor%5D=abc",
+    )
+
+    assert result["data"][0]["id"] == "1"
+    assert result["data"][0]["attributes"] == {"name": "Product 1"}
+    assert result["links"]["next"] == "/api/v1/products?page%5Bcursor%5D=abc"
+    assert result["meta"]["page"] == {"size": 1}
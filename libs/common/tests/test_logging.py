@@ -0,0 +1,94 @@
+import json
+import logging
+import queue
+import sys
+
+from libs.common.logging import (
+    ContextQueueHandler,
+    FastJsonFormatter,
+    LogContext,
+    StructuredJsonFormatter,
+    add_timing,
+    format_server_timing,
+    server_timings_ctx,
+    timings_summary,
+)
+
+
+def make_record(msg: str, *args: object) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, args, None)
+
+
+def test_context_queue_handler_captures_request_context() -> None:
+    handler = ContextQueueHandler(queue.Queue(10))
+
+    with LogContext(request_id="req-1", operation="get_product"):
+        handler.emit(make_record("loaded %s", "p-1"))
+
+    record = handler.queue.get_nowait()
+    assert record.getMessage() == "loaded p-1"
+    assert record.request_id == "req-1"
+    assert record.operation == "get_product"
+
+    formatted = StructuredJsonFormatter("%(message)s").format(record)
+    assert '"request_id": "req-1"' in formatted
+
+
+def test_context_queue_handler_drops_when_full() -> None:
+    handler = ContextQueueHandler(queue.Queue(1), policy="drop")
+
+    handler.emit(make_record("first"))
+    handler.emit(make_record("second"))
+
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
+
+
+def test_context_queue_handler_renders_tracebacks() -> None:
+    handler = ContextQueueHandler(queue.Queue(1))
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord(
+            "test", logging.ERROR, __file__, 1, "failed", None, exc_info=sys.exc_info()
+        )
+    handler.emit(record)
+
+    queued = handler.queue.get_nowait()
+    assert queued.exc_info is None
+    assert "ValueError: boom" in queued.exc_text
+    assert record.exc_info is not None
+
+
+def test_fast_json_formatter_fields() -> None:
+    formatter = FastJsonFormatter("products")
+    record = make_record("GET %s", "/products")
+    record.created = 1_700_000_000.25
+    record.duration_ms = 1.5
+
+    with LogContext(request_id="req-2"):
+        line = json.loads(formatter.format(record))
+
+    assert line["timestamp"] == "2023-11-14T22:13:20.250Z"
+    assert line["service"] == "products"
+    assert line["request_id"] == "req-2"
+    assert line["message"] == "GET /products"
+    assert line["duration_ms"] == 1.5
+    assert "args" not in line
+
+
+def test_add_timing_accumulates_per_bucket() -> None:
+    timings: dict[str, list[float]] = {}
+    token = server_timings_ctx.set(timings)
+    try:
+        add_timing("db", 0.010)
+        add_timing("db", 0.005)
+        add_timing("grpc", 0.020)
+    finally:
+        server_timings_ctx.reset(token)
+    add_timing("db", 1.0)
+
+    assert timings_summary(timings) == {"db": 15.0, "grpc": 20.0}
+    assert format_server_timing(timings, 0.05) == (
+        'db;dur=15.00;desc="2 call(s)", grpc;dur=20.00;desc="1 call(s)", total;dur=50.00'
+    )
@@ -0,0 +1,65 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from libs.common.cache_stats import CacheStats
+from libs.common.errors import NotFoundError
+from libs.common.metrics import MetricsMiddleware, render_metrics
+from libs.common.middleware import RequestContextMiddleware
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str) -> dict[str, str]:
+        if item_id == "missing":
+            raise NotFoundError("Item not found")
+        return {"id": item_id}
+
+    return app
+
+
+def sample(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_request_latency_is_labelled_by_route_template() -> None:
+    client = TestClient(build_app())
+    ok = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+    not_found = {**ok, "status": "404"}
+    before_ok = sample("http_request_duration_seconds_count", ok)
+    before_not_found = sample("http_request_duration_seconds_count", not_found)
+
+    client.get("/items/a")
+    client.get("/items/b")
+    client.get("/items/missing")
+
+    assert sample("http_request_duration_seconds_count", ok) == before_ok + 2
+    assert sample("http_request_duration_seconds_count", not_found) == before_not_found + 1
+    assert sample("http_requests_in_progress", {"method": "GET"}) == 0
+
+
+def test_unmatched_paths_share_one_label() -> None:
+    client = TestClient(build_app())
+    labels = {"method": "GET", "route": "unmatched", "status": "404"}
+    before = sample("http_request_duration_seconds_count", labels)
+
+    client.get("/random-1")
+    client.get("/random-2")
+
+    assert sample("http_request_duration_seconds_count", labels) == before + 2
+
+
+def test_named_cache_stats_are_exported() -> None:
+    stats = CacheStats("test_cache")
+    stats.record_hit()
+    stats.record_hit(negative=True)
+    stats.record_miss()
+
+    payload, _ = render_metrics()
+
+    assert b'cache_requests_total{cache="test_cache",result="hit"} 1.0' in payload
+    assert sample("cache_requests_total", {"cache": "test_cache", "result": "miss"}) == 1
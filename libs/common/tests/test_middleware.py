@@ -0,0 +1,197 @@
+import json
+import logging
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from libs.common.errors import NotFoundError
+from libs.common.logging import setup_logging, shutdown_logging, timed
+from libs.common.middleware import RequestContextMiddleware
+
+
+@timed("db")
+async def query() -> str:
+    return "row"
+
+
+@pytest.fixture
+def service_logging() -> Iterator[None]:
+    root = logging.getLogger()
+    level = root.level
+    yield
+    shutdown_logging()
+    root.setLevel(level)
+
+
+def service_log_lines(capsys: pytest.CaptureFixture[str]) -> list[dict[str, Any]]:
+    shutdown_logging()
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def build_app(**options: Any) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware, **options)
+
+    @app.get("/ok")
+    async def ok(request: Request) -> dict[str, str]:
+        return {"request_id": request.state.request_id}
+
+    @app.get("/timed")
+    async def timed_route() -> dict[str, str]:
+        await query()
+        await query()
+        return {"result": await query()}
+
+    @app.get("/missing")
+    async def missing() -> None:
+        raise NotFoundError("Product with id x not found")
+
+    @app.get("/boom")
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for i in range(3):
+                yield f"{i}\n"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+def test_request_id_is_propagated() -> None:
+    client = TestClient(build_app())
+
+    response = client.get("/ok", headers={"X-Request-ID": "req-1"})
+
+    assert response.json() == {"request_id": "req-1"}
+    assert response.headers["X-Request-ID"] == "req-1"
+
+
+def test_request_id_is_generated_when_missing() -> None:
+    client = TestClient(build_app())
+
+    response = client.get("/ok")
+
+    assert response.headers["X-Request-ID"] == response.json()["request_id"]
+
+
+def test_api_errors_become_jsonapi_responses() -> None:
+    client = TestClient(build_app())
+
+    response = client.get("/missing", headers={"X-Request-ID": "req-2"})
+
+    assert response.status_code == 404
+    assert response.json()["errors"][0]["detail"] == "Product with id x not found"
+    assert response.headers["X-Request-ID"] == "req-2"
+
+
+def test_unhandled_errors_become_500() -> None:
+    client = TestClient(build_app(), raise_server_exceptions=False)
+
+    response = client.get("/boom")
+
+    assert response.status_code == 500
+    assert response.json()["errors"][0]["title"] == "Internal Server Error"
+
+
+def test_streaming_responses_pass_through() -> None:
+    client = TestClient(build_app())
+
+    response = client.get("/stream")
+
+    assert response.text == "0\n1\n2\n"
+    assert "X-Request-ID" in response.headers
+
+
+def test_request_logs_are_sampled(caplog: pytest.LogCaptureFixture) -> None:
+    client = TestClient(build_app(sample_every=3))
+
+    with caplog.at_level(logging.INFO, logger="libs.common.middleware"):
+        for _ in range(6):
+            client.get("/ok")
+        client.get("/unknown-route")
+        client.get("/missing")
+
+    events = [
+        (r.event, getattr(r, "status_code", None))
+        for r in caplog.records
+        if getattr(r, "event", None) in ("request_completed", "request_failed")
+    ]
+    assert events == [
+        ("request_completed", 200),
+        ("request_completed", 200),
+        ("request_completed", 404),
+        ("request_failed", None),
+    ]
+
+
+def test_server_timing_header_breaks_down_request_time() -> None:
+    client = TestClient(build_app(server_timing=True))
+
+    header = client.get("/timed").headers["Server-Timing"]
+
+    db, total = header.split(", ")
+    assert db.startswith("db;dur=") and db.endswith('desc="3 call(s)"')
+    assert total.startswith("total;dur=")
+
+
+def test_server_timing_is_off_by_default() -> None:
+    client = TestClient(build_app())
+
+    assert "Server-Timing" not in client.get("/timed").headers
+
+
+def test_request_logs_go_through_the_async_queue(
+    service_logging: None, capsys: pytest.CaptureFixture[str]
+) -> None:
+    setup_logging("products", async_mode=True)
+    client = TestClient(build_app())
+
+    client.get("/ok", headers={"X-Request-ID": "req-3"})
+
+    events = [
+        line["event"] for line in service_log_lines(capsys) if line["request_id"] == "req-3"
+    ]
+    assert events == ["request_started", "request_completed"]
+
+
+def test_sampled_request_logs_are_written_by_the_fast_formatter(
+    service_logging: None, capsys: pytest.CaptureFixture[str]
+) -> None:
+    setup_logging("products")
+    client = TestClient(build_app(sample_every=2))
+
+    for i in range(4):
+        client.get("/ok", headers={"X-Request-ID": f"req-{i}"})
+
+    shutdown_logging()
+    completed = [
+        line for line in capsys.readouterr().out.splitlines() if "request_completed" in line
+    ]
+    # orjson writes compact separators; python-json-logger would emit '": "'
+    assert all('"event":"request_completed"' in line for line in completed)
+    assert [json.loads(line)["request_id"] for line in completed] == ["req-0", "req-2"]
+    assert json.loads(completed[0])["sample_every"] == 2
+
+
+def test_request_completed_log_carries_the_timings(
+    service_logging: None, capsys: pytest.CaptureFixture[str]
+) -> None:
+    setup_logging("products", async_mode=True)
+    client = TestClient(build_app(server_timing=True))
+
+    client.get("/timed", headers={"X-Request-ID": "req-4"})
+
+    completed = [
+        line
+        for line in service_log_lines(capsys)
+        if line.get("event") == "request_completed" and line["request_id"] == "req-4"
+    ]
+    assert list(completed[0]["timings"]) == ["db"]
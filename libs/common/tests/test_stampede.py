@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from libs.common.stampede import LoadTimeTracker, SingleFlight, should_refresh_early
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call() -> None:
+    calls = 0
+
+    async def load() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    flight = SingleFlight()
+    results = await asyncio.gather(*(flight.do("key", load) for _ in range(3)))
+
+    assert results == ["value"] * 3
+    assert calls == 1
+    assert flight.stats() == {"in_flight": 0, "calls": 1, "shared": 2}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors_and_forgets_key() -> None:
+    async def fail() -> str:
+        raise RuntimeError("boom")
+
+    flight = SingleFlight()
+
+    with pytest.raises(RuntimeError):
+        await flight.do("key", fail)
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_should_refresh_early() -> None:
+    assert should_refresh_early(0, recompute_time=0.05)
+    assert not should_refresh_early(300, recompute_time=0.05, rand=lambda: 0.5)
+    # Slower recomputes start refreshing earlier
+    assert should_refresh_early(0.5, recompute_time=1.0, rand=lambda: 0.5)
+
+
+def test_load_time_tracker_moves_towards_observations() -> None:
+    tracker = LoadTimeTracker(initial=0.0, alpha=0.5)
+
+    tracker.observe(1.0)
+
+    assert tracker.value == 0.5
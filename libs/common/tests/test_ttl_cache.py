@@ -0,0 +1,59 @@
+from libs.common.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_hit_then_expire() -> None:
+    clock = FakeClock()
+    cache = TTLCache(max_size=10, clock=clock)
+    cache.set("a", 1, ttl=5)
+
+    lookup = cache.get("a")
+    assert lookup is not None and lookup.value == 1 and not lookup.stale
+
+    clock.now = 5
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_cache_serves_stale_within_stale_window() -> None:
+    clock = FakeClock()
+    cache = TTLCache(max_size=10, clock=clock)
+    cache.set("a", 1, ttl=5, stale_ttl=10)
+
+    clock.now = 7
+    lookup = cache.get("a")
+    assert lookup is not None and lookup.stale
+
+    clock.now = 15
+    assert cache.get("a") is None
+    assert cache.stats()["stale_hits"] == 1
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_cache_caches_none_values() -> None:
+    cache = TTLCache(max_size=2)
+    cache.set("missing", None, ttl=60)
+
+    lookup = cache.get("missing")
+    assert lookup is not None and lookup.value is None
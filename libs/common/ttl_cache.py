@@ -0,0 +1,82 @@
+"""
+In-process LRU cache with per-entry TTL.
+
+Entries can outlive their TTL for an extra ``stale_ttl`` window so callers can
+serve a stale value while they refresh it (stale-while-revalidate).
+Not thread-safe: meant to be used from a single asyncio event loop.
+"""
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    expires_at: float
+    stale_until: float
+
+
+@dataclass
+class CacheLookup:
+    value: Any
+    stale: bool
+
+
+class TTLCache:
+    def __init__(self, max_size: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_size = max(1, max_size)
+        self._clock = clock
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheLookup | None:
+        """Return the entry for ``key`` (possibly stale), or None if absent or fully expired."""
+        entry = self._entries.get(key)
+        now = self._clock()
+        if entry is None or now >= entry.stale_until:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        stale = now >= entry.expires_at
+        if stale:
+            self.stale_hits += 1
+        else:
+            self.hits += 1
+        return CacheLookup(entry.value, stale)
+
+    def set(self, key: str, value: Any, ttl: float, stale_ttl: float = 0) -> None:
+        now = self._clock()
+        self._entries[key] = CacheEntry(value, now + ttl, now + ttl + stale_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,108 @@
+"""
+Tamaño y coste de los formatos de la caché de productos.
+
+Codifica productos con descripciones de distinto tamaño como JSON de
+to_dict() (formato anterior) y con CacheCodec sobre to_cache_dict() (msgpack,
+msgpack+zlib, msgpack+lz4) y muestra bytes guardados en Redis y microsegundos
+por encode/decode. El decode incluye Product.from_dict, que es lo que paga
+cada acierto de caché. Las descripciones son texto generado con un
+vocabulario amplio y semilla fija: el texto muy repetitivo comprime mucho
+mejor y daría cifras engañosas. Si comprimir no reduce el tamaño, CacheCodec
+guarda el msgpack sin comprimir.
+
+Usage:
+    poetry run python scripts/bench_cache_codec.py
+    poetry run python scripts/bench_cache_codec.py --sizes 200 1000 3000 --iterations 20000
+"""
+import argparse
+import json
+import random
+import sys
+import timeit
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.products.domain.entities import Product
+from services.products.infrastructure.cache_codec import CacheCodec
+
+VOCABULARY_SIZE = 5000
+
+
+def build_product(description_size: int, rng: random.Random) -> Product:
+    vocabulary = [
+        "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(3, 10)))
+        for _ in range(VOCABULARY_SIZE)
+    ]
+    words: list[str] = []
+    while sum(len(w) + 1 for w in words) < description_size:
+        words.append(rng.choice(vocabulary))
+    return Product(
+        id="0b7c6d3e-2f4a-4c1e-9a55-7d8e9f0a1b2c",
+        name="Wireless noise-cancelling headphones",
+        description=" ".join(words)[:description_size],
+        price=Decimal("249.99"),
+        images=[f"https://i.imgur.com/{rng.randrange(16**7):07x}.png" for _ in range(3)],
+        created_at=datetime(2024, 1, 1, 12, 0, 0),
+        updated_at=datetime(2024, 6, 1, 8, 30, 0),
+    )
+
+
+def measure(
+    label: str, encode, decode, value: dict, iterations: int
+) -> tuple[str, int, float, float]:
+    data = encode(value)
+    encode_us = timeit.timeit(lambda: encode(value), number=iterations) / iterations * 1e6
+    decode_us = timeit.timeit(lambda: decode(data), number=iterations) / iterations * 1e6
+    return label, len(data), encode_us, decode_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Product cache encoding size and speed")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 3000])
+    parser.add_argument("--iterations", type=int, default=10000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    codecs = {
+        "msgpack": CacheCodec(compression="none"),
+        "msgpack+zlib": CacheCodec(compression="zlib", compress_threshold=0),
+        "msgpack+lz4": CacheCodec(compression="lz4", compress_threshold=0),
+    }
+
+    for size in args.sizes:
+        product = build_product(size, rng)
+        rows = [
+            measure(
+                "json",
+                lambda v: json.dumps(v).encode(),
+                lambda d: Product.from_dict(json.loads(d)),
+                product.to_dict(),
+                args.iterations,
+            )
+        ]
+        rows += [
+            measure(
+                name,
+                codec.encode,
+                lambda d, codec=codec: Product.from_dict(codec.decode(d)),
+                product.to_cache_dict(),
+                args.iterations,
+            )
+            for name, codec in codecs.items()
+        ]
+
+        json_bytes = rows[0][1]
+        print(f"\ndescription of {size} chars")
+        print(f"{'format':<14}{'bytes':>8}{'vs json':>10}{'encode us':>12}{'decode us':>12}")
+        for label, length, encode_us, decode_us in rows:
+            print(
+                f"{label:<14}{length:>8}{length / json_bytes:>10.0%}"
+                f"{encode_us:>12.1f}{decode_us:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark del stack de middleware HTTP: BaseHTTPMiddleware vs ASGI puro.
+
+Monta la misma ruta trivial con el stack anterior (RequestLogging + RequestID +
+ErrorHandler como BaseHTTPMiddleware, reproducido aquí) y con
+RequestContextMiddleware, y mide peticiones/segundo en proceso con
+httpx.ASGITransport, sin red ni servidor de por medio.
+
+Usage:
+    poetry run python scripts/bench_middleware.py
+    poetry run python scripts/bench_middleware.py --requests 20000 --concurrency 100
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Callable
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from libs.common.errors import BaseAPIError
+from libs.common.jsonapi import serialize_error
+from libs.common.logging import request_id_ctx
+from libs.common.middleware import RequestContextMiddleware
+
+logger = logging.getLogger("bench")
+
+
+class LegacyRequestIDMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        request.state.request_id = request_id
+        token = request_id_ctx.set(request_id)
+        try:
+            response = await call_next(request)
+            response.headers["X-Request-ID"] = request_id
+            return response
+        finally:
+            request_id_ctx.reset(token)
+
+
+class LegacyErrorHandlerMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        try:
+            return await call_next(request)
+        except BaseAPIError as e:
+            return JSONResponse(
+                status_code=int(e.status),
+                content=serialize_error(e.status, e.title, e.detail, e.source),
+            )
+
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        start_time = time.time()
+        logger.info(f"{request.method} {request.url.path}")
+        response = await call_next(request)
+        logger.info(
+            f"{request.method} {request.url.path} - {response.status_code}",
+            extra={"duration_ms": round((time.time() - start_time) * 1000, 2)},
+        )
+        return response
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    if stack == "base_http":
+        app.add_middleware(LegacyRequestLoggingMiddleware)
+        app.add_middleware(LegacyRequestIDMiddleware)
+        app.add_middleware(LegacyErrorHandlerMiddleware)
+    elif stack == "asgi":
+        app.add_middleware(RequestContextMiddleware)
+    return app
+
+
+async def run(stack: str, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=build_app(stack))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Calentamiento: construcción del stack y primeras asignaciones
+        await asyncio.gather(*(client.get("/ping") for _ in range(concurrency)))
+
+        remaining = total
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                response = await client.get("/ping")
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return total / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Middleware stack throughput")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    # Los mensajes de log se descartan: se mide el middleware, no el handler de logging
+    logging.disable(logging.CRITICAL)
+
+    results = {
+        stack: asyncio.run(run(stack, args.requests, args.concurrency))
+        for stack in ("none", "base_http", "asgi")
+    }
+    print(f"{'stack':<12}{'req/s':>12}")
+    for stack, rps in results.items():
+        print(f"{stack:<12}{rps:>12.0f}")
+    speedup = results["asgi"] / results["base_http"]
+    print(f"\nRequestContextMiddleware vs BaseHTTPMiddleware stack: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
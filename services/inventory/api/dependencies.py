@@ -4,6 +4,7 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from services.inventory.domain.ports import InventoryRepository, ProductServicePort
+from services.inventory.infrastructure.cached_product_service import CachedProductService
 from services.inventory.infrastructure.grpc.products_grpc_client import ProductsGrpcClient
 from services.inventory.infrastructure.mongodb_repository import MongoDBInventoryRepository
 
@@ -15,6 +16,33 @@ load_dotenv(env_path, override=True)
 PRODUCTS_GRPC_URL = os.getenv("PRODUCTS_GRPC_URL", "localhost:50051")
 PRODUCTS_GRPC_USE_SSL = os.getenv("PRODUCTS_GRPC_USE_SSL", "false").lower() == "true"
 PRODUCTS_GRPC_TIMEOUT = int(os.getenv("PRODUCTS_GRPC_TIMEOUT", "30"))
+PRODUCTS_GRPC_POOL_SIZE = int(os.getenv("PRODUCTS_GRPC_POOL_SIZE", "2"))
+# Agrupación de get_product en BatchGetProducts (0 = desactivado)
+PRODUCTS_GRPC_BATCH_WINDOW_MS = float(os.getenv("PRODUCTS_GRPC_BATCH_WINDOW_MS", "0"))
+PRODUCTS_GRPC_MAX_BATCH_SIZE = int(os.getenv("PRODUCTS_GRPC_MAX_BATCH_SIZE", "100"))
+
+# Caché local de productos (LRU + TTL)
+PRODUCTS_CACHE_MAX_SIZE = int(os.getenv("PRODUCTS_CACHE_MAX_SIZE", "10000"))
+PRODUCTS_CACHE_TTL = float(os.getenv("PRODUCTS_CACHE_TTL", "60"))
+PRODUCTS_CACHE_NEGATIVE_TTL = float(os.getenv("PRODUCTS_CACHE_NEGATIVE_TTL", "5"))
+PRODUCTS_CACHE_STALE_TTL = float(os.getenv("PRODUCTS_CACHE_STALE_TTL", "300"))
+
+# Cliente compartido por todo el proceso: se conecta en el lifespan y se cierra al apagar
+products_grpc_client = ProductsGrpcClient(
+    grpc_url=PRODUCTS_GRPC_URL,
+    use_ssl=PRODUCTS_GRPC_USE_SSL,
+    timeout=PRODUCTS_GRPC_TIMEOUT,
+    pool_size=PRODUCTS_GRPC_POOL_SIZE,
+    batch_window_ms=PRODUCTS_GRPC_BATCH_WINDOW_MS,
+    max_batch_size=PRODUCTS_GRPC_MAX_BATCH_SIZE,
+)
+cached_product_service = CachedProductService(
+    products_grpc_client,
+    max_size=PRODUCTS_CACHE_MAX_SIZE,
+    ttl=PRODUCTS_CACHE_TTL,
+    negative_ttl=PRODUCTS_CACHE_NEGATIVE_TTL,
+    stale_ttl=PRODUCTS_CACHE_STALE_TTL,
+)
 
 
 async def get_inventory_repository() -> InventoryRepository:
@@ -26,14 +54,22 @@ async def get_product_service() -> ProductServicePort:
     Factory para obtener el cliente de Products Service.
     Ahora usa gRPC en lugar de HTTP para comunicación inter-service.
 
+    Devuelve el cliente compartido del proceso: los canales se reutilizan
+    entre peticiones en lugar de abrir una conexión nueva cada vez. Va
+    envuelto en una caché local, así que los productos consultados
+    recientemente no generan tráfico gRPC.
+
     Configuración:
     - PRODUCTS_GRPC_URL: URL del servidor gRPC
     - PRODUCTS_GRPC_USE_SSL: "true" para usar SSL/TLS (auto-detecta puerto 443)
     - PRODUCTS_GRPC_TIMEOUT: Timeout en segundos (default: 30)
+    - PRODUCTS_GRPC_POOL_SIZE: Canales HTTP/2 en el pool (default: 2)
+    - PRODUCTS_GRPC_BATCH_WINDOW_MS: Ventana para agrupar get_product (default: 0, desactivado)
+    - PRODUCTS_GRPC_MAX_BATCH_SIZE: Máximo de IDs por lote agrupado (default: 100, tope: 500)
+    - PRODUCTS_CACHE_MAX_SIZE: Productos en la caché local (default: 10000)
+    - PRODUCTS_CACHE_TTL: Segundos que un producto se considera fresco (default: 60)
+    - PRODUCTS_CACHE_NEGATIVE_TTL: Segundos que se recuerda un NOT_FOUND (default: 5)
+    - PRODUCTS_CACHE_STALE_TTL: Segundos que se sirve caducado mientras se refresca (default: 300)
     """
-    return ProductsGrpcClient(
-        grpc_url=PRODUCTS_GRPC_URL,
-        use_ssl=PRODUCTS_GRPC_USE_SSL,
-        timeout=PRODUCTS_GRPC_TIMEOUT,
-    )
+    return cached_product_service
 
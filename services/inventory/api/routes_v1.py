@@ -5,9 +5,13 @@ from fastapi import APIRouter, Depends, Request
 
 from libs.auth.api_key import verify_api_key
 from services.inventory.api.dependencies import get_inventory_repository, get_product_service
-from services.inventory.api.schemas import InventoryCreate, InventoryUpdate
-from services.inventory.api.serializers import serialize_inventory
+from services.inventory.api.schemas import InventoryBulkAdjust, InventoryCreate, InventoryUpdate
+from services.inventory.api.serializers import (
+    serialize_inventory,
+    serialize_inventory_adjustments,
+)
 from services.inventory.api.versioning import APIVersion
+from services.inventory.application.bulk_adjust_inventory import BulkAdjustInventory
 from services.inventory.application.get_inventory import GetInventory
 from services.inventory.application.update_inventory import UpdateInventory
 from services.inventory.domain.ports import InventoryRepository, ProductServicePort
@@ -37,6 +41,26 @@ async def create_inventory(
     return serialize_inventory(created_inventory)
 
 
+@router.post(
+    "/bulk-adjust",
+    dependencies=[Depends(verify_api_key)],
+    summary="[v1] Adjust inventory quantities in bulk",
+)
+async def bulk_adjust_inventory(
+    bulk_adjust: InventoryBulkAdjust,
+    request: Request,
+    repository: InventoryRepository = Depends(get_inventory_repository),
+) -> dict[str, Any]:
+    request_id = getattr(request.state, "request_id", "unknown")
+    use_case = BulkAdjustInventory(repository)
+    adjustments = await use_case.execute(
+        [(item.product_id, item.quantity_delta) for item in bulk_adjust.adjustments],
+        bulk_adjust.atomic,
+        request_id,
+    )
+    return serialize_inventory_adjustments(adjustments, bulk_adjust.atomic)
+
+
 @router.get(
     "/{product_id}",
     dependencies=[Depends(verify_api_key)],
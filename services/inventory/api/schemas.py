@@ -44,3 +44,37 @@ class InventoryCreate(BaseModel):
         examples=[100, 0],
     )
 
+
+class InventoryAdjustmentItem(BaseModel):
+    """A single quantity delta inside a bulk adjustment."""
+
+    product_id: str = Field(..., min_length=1, description="UUID of the product")
+    quantity_delta: int = Field(
+        ...,
+        description="Quantity change (positive to add, negative to subtract)",
+    )
+
+
+class InventoryBulkAdjust(BaseModel):
+    """Schema for applying many inventory deltas in one request."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "adjustments": [
+                    {"product_id": "550e8400-e29b-41d4-a716-446655440000", "quantity_delta": -2},
+                    {"product_id": "6ba7b810-9dad-11d1-80b4-00c04fd430c8", "quantity_delta": 30},
+                ],
+                "atomic": False,
+            }
+        }
+    )
+
+    adjustments: list[InventoryAdjustmentItem] = Field(
+        ...,
+        description="Deltas to apply; each product_id may appear only once",
+    )
+    atomic: bool = Field(
+        default=False,
+        description="Apply all deltas or none of them",
+    )
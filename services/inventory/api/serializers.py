@@ -1,7 +1,8 @@
+from collections import Counter
 from typing import Any
 
-from libs.common.jsonapi import serialize_resource
-from services.inventory.domain.entities import Inventory
+from libs.common.jsonapi import serialize_resource, serialize_resources
+from services.inventory.domain.entities import Inventory, InventoryAdjustment
 
 
 def serialize_inventory(inventory: Inventory, product: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -27,3 +28,19 @@ def serialize_inventory(inventory: Inventory, product: dict[str, Any] | None = N
 
     return serialize_resource("inventory", product_id, attributes)
 
+
+def serialize_inventory_adjustments(
+    adjustments: list[InventoryAdjustment], atomic: bool
+) -> dict[str, Any]:
+    """Serializa el resultado por producto de un ajuste masivo."""
+    items = []
+    for adjustment in adjustments:
+        attributes = adjustment.to_dict()
+        attributes["id"] = attributes.pop("product_id")
+        items.append(attributes)
+
+    meta = {
+        "atomic": atomic,
+        "statuses": dict(Counter(adjustment.status.value for adjustment in adjustments)),
+    }
+    return serialize_resources("inventory-adjustments", items, meta=meta)
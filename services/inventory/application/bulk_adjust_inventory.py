@@ -0,0 +1,55 @@
+import logging
+from collections import Counter
+
+from libs.common.errors import ValidationError
+from services.inventory.domain.entities import InventoryAdjustment
+from services.inventory.domain.ports import InventoryRepository
+
+logger = logging.getLogger(__name__)
+
+MAX_BULK_ADJUSTMENTS = 5000
+
+
+class BulkAdjustInventory:
+    def __init__(self, repository: InventoryRepository) -> None:
+        self.repository = repository
+
+    async def execute(
+        self, adjustments: list[tuple[str, int]], atomic: bool, request_id: str
+    ) -> list[InventoryAdjustment]:
+        """
+        Aplica varios deltas de cantidad en una sola operación.
+
+        Cada producto obtiene su propio resultado (actualizado, stock
+        insuficiente, no existe o revertido en modo atómico).
+        """
+        if not adjustments:
+            raise ValidationError(
+                "At least one adjustment is required", source={"pointer": "/adjustments"}
+            )
+        if len(adjustments) > MAX_BULK_ADJUSTMENTS:
+            raise ValidationError(
+                f"At most {MAX_BULK_ADJUSTMENTS} adjustments are allowed per request",
+                source={"pointer": "/adjustments"},
+            )
+
+        occurrences = Counter(product_id for product_id, _ in adjustments)
+        duplicates = [product_id for product_id, count in occurrences.items() if count > 1]
+        if duplicates:
+            raise ValidationError(
+                f"Duplicate product_id in adjustments: {', '.join(duplicates[:10])}",
+                source={"pointer": "/adjustments"},
+            )
+
+        results = await self.repository.bulk_update_quantities(dict(adjustments), atomic=atomic)
+
+        logger.info(
+            f"Bulk adjusted inventory for {len(results)} products",
+            extra={
+                "request_id": request_id,
+                "atomic": atomic,
+                "statuses": dict(Counter(result.status.value for result in results)),
+            },
+        )
+
+        return results
@@ -1,7 +1,7 @@
 import logging
 
 from libs.common.errors import NotFoundError, ValidationError
-from services.inventory.domain.entities import Inventory
+from services.inventory.domain.entities import AdjustmentStatus, Inventory
 from services.inventory.domain.ports import InventoryRepository
 
 logger = logging.getLogger(__name__)
@@ -14,29 +14,24 @@ class UpdateInventory:
     async def execute(
         self, product_id: str, quantity_delta: int, request_id: str
     ) -> Inventory:
-        inventory = await self.repository.get_by_product_id(product_id)
-        if not inventory:
-            raise NotFoundError(f"Inventory for product {product_id} not found")
+        adjustment = await self.repository.update_quantity(product_id, quantity_delta)
 
-        new_quantity = inventory.quantity + quantity_delta
-        if new_quantity < 0:
+        if adjustment.status == AdjustmentStatus.NOT_FOUND:
+            raise NotFoundError(f"Inventory for product {product_id} not found")
+        if adjustment.status == AdjustmentStatus.INSUFFICIENT:
             raise ValidationError("Insufficient inventory quantity")
 
-        updated_inventory = await self.repository.update_quantity(product_id, quantity_delta)
-        if not updated_inventory:
-            raise NotFoundError(f"Failed to update inventory for product {product_id}")
-
+        updated_inventory = adjustment.inventory
         logger.info(
             f"Updated inventory for product {product_id}: "
-            f"{inventory.quantity} -> {updated_inventory.quantity}",
+            f"{adjustment.previous_quantity} -> {updated_inventory.quantity}",
             extra={
                 "request_id": request_id,
                 "product_id": product_id,
-                "old_quantity": inventory.quantity,
+                "old_quantity": adjustment.previous_quantity,
                 "new_quantity": updated_inventory.quantity,
                 "delta": quantity_delta,
             },
         )
 
         return updated_inventory
-
@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import Enum
 
 
 class Inventory:
@@ -19,3 +20,34 @@ class Inventory:
             "last_updated": self.last_updated.isoformat(),
         }
 
+
+class AdjustmentStatus(str, Enum):
+    UPDATED = "updated"
+    NOT_FOUND = "not_found"
+    INSUFFICIENT = "insufficient"
+    # Se podía aplicar, pero otro ajuste del mismo lote atómico falló
+    ROLLED_BACK = "rolled_back"
+
+
+class InventoryAdjustment:
+    """Resultado de aplicar un delta de cantidad a un producto."""
+
+    def __init__(
+        self,
+        product_id: str,
+        status: AdjustmentStatus,
+        previous_quantity: int | None = None,
+        inventory: Inventory | None = None,
+    ) -> None:
+        self.product_id = product_id
+        self.status = status
+        self.previous_quantity = previous_quantity
+        self.inventory = inventory
+
+    def to_dict(self) -> dict:
+        return {
+            "product_id": self.product_id,
+            "status": self.status.value,
+            "previous_quantity": self.previous_quantity,
+            "quantity": self.inventory.quantity if self.inventory else None,
+        }
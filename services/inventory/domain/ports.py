@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
-from services.inventory.domain.entities import Inventory
+from services.inventory.domain.entities import Inventory, InventoryAdjustment
 
 
 class InventoryRepository(ABC):
@@ -14,7 +14,19 @@ class InventoryRepository(ABC):
         pass
 
     @abstractmethod
-    async def update_quantity(self, product_id: str, quantity_delta: int) -> Inventory | None:
+    async def update_quantity(self, product_id: str, quantity_delta: int) -> InventoryAdjustment:
+        """Apply the delta atomically unless the resulting quantity would be negative."""
+        pass
+
+    @abstractmethod
+    async def bulk_update_quantities(
+        self, deltas: dict[str, int], atomic: bool = False
+    ) -> list[InventoryAdjustment]:
+        """
+        Apply many deltas in one batched write, one result per product in input order.
+
+        With atomic=True either every delta is applied or none is.
+        """
         pass
 
 
@@ -23,3 +35,10 @@ class ProductServicePort(ABC):
     async def get_product(self, product_id: str, request_id: str) -> dict[str, Any] | None:
         pass
 
+    @abstractmethod
+    async def get_products(
+        self, product_ids: list[str], request_id: str
+    ) -> dict[str, dict[str, Any]]:
+        """Products keyed by ID; IDs that do not exist are absent from the result."""
+        pass
+
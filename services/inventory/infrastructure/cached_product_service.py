@@ -0,0 +1,143 @@
+"""
+Caché en proceso delante de ProductServicePort.
+
+Los datos de producto (nombre, precio, imágenes) cambian poco, así que el
+inventario los guarda en una caché LRU+TTL local en lugar de llamar al
+servicio de productos por gRPC en cada petición.
+"""
+import asyncio
+import logging
+from typing import Any
+
+from libs.common.ttl_cache import TTLCache
+from services.inventory.domain.ports import ProductServicePort
+
+logger = logging.getLogger(__name__)
+
+
+class CachedProductService(ProductServicePort):
+    def __init__(
+        self,
+        inner: ProductServicePort,
+        max_size: int = 10_000,
+        ttl: float = 60,
+        negative_ttl: float = 5,
+        stale_ttl: float = 300,
+    ) -> None:
+        """
+        Args:
+            inner: Servicio de productos real (normalmente el cliente gRPC)
+            max_size: Número máximo de productos en caché (LRU)
+            ttl: Segundos que un producto se considera fresco
+            negative_ttl: Segundos que se recuerda un NOT_FOUND
+            stale_ttl: Segundos extra en los que se sirve un valor caducado
+                mientras se refresca en segundo plano (0 = desactivado)
+        """
+        self.inner = inner
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        self._cache = TTLCache(max_size)
+        self._refreshing: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+        self.negative_hits = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    async def get_product(self, product_id: str, request_id: str) -> dict[str, Any] | None:
+        lookup = self._cache.get(product_id)
+        if lookup is not None:
+            if lookup.value is None:
+                self.negative_hits += 1
+            if lookup.stale:
+                self._schedule_refresh([product_id], request_id)
+            return lookup.value
+
+        product = await self.inner.get_product(product_id, request_id)
+        self._store(product_id, product)
+        return product
+
+    async def get_products(
+        self, product_ids: list[str], request_id: str
+    ) -> dict[str, dict[str, Any]]:
+        products: dict[str, dict[str, Any]] = {}
+        misses: list[str] = []
+        stale: list[str] = []
+
+        for product_id in dict.fromkeys(product_ids):
+            lookup = self._cache.get(product_id)
+            if lookup is None:
+                misses.append(product_id)
+                continue
+            if lookup.stale:
+                stale.append(product_id)
+            if lookup.value is None:
+                self.negative_hits += 1
+            else:
+                products[product_id] = lookup.value
+
+        if stale:
+            self._schedule_refresh(stale, request_id)
+        if misses:
+            loaded = await self.inner.get_products(misses, request_id)
+            for product_id in misses:
+                self._store(product_id, loaded.get(product_id))
+            products.update(loaded)
+
+        return products
+
+    def invalidate(self, product_id: str) -> None:
+        self._cache.delete(product_id)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self._cache.stats(),
+            "negative_hits": self.negative_hits,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+            "refreshing": len(self._refreshing),
+        }
+
+    async def close(self) -> None:
+        """Cancelar los refrescos en segundo plano pendientes."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _store(self, product_id: str, product: dict[str, Any] | None) -> None:
+        if product is None:
+            # Los NOT_FOUND no se sirven caducados: un producto recién creado
+            # debe aparecer en cuanto vence negative_ttl
+            self._cache.set(product_id, None, self.negative_ttl)
+        else:
+            self._cache.set(product_id, product, self.ttl, self.stale_ttl)
+
+    def _schedule_refresh(self, product_ids: list[str], request_id: str) -> None:
+        pending = [pid for pid in product_ids if pid not in self._refreshing]
+        if not pending:
+            return
+        self._refreshing.update(pending)
+        task = asyncio.create_task(self._refresh(pending, request_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, product_ids: list[str], request_id: str) -> None:
+        try:
+            if len(product_ids) == 1:
+                product = await self.inner.get_product(product_ids[0], request_id)
+                loaded = {product_ids[0]: product} if product else {}
+            else:
+                loaded = await self.inner.get_products(product_ids, request_id)
+            for product_id in product_ids:
+                self._store(product_id, loaded.get(product_id))
+            self.refreshes += 1
+        except Exception as e:
+            # Se sigue sirviendo el valor caducado hasta que venza stale_ttl
+            self.refresh_errors += 1
+            logger.warning(
+                f"Background refresh of {len(product_ids)} product(s) failed: {e}",
+                extra={"request_id": request_id},
+            )
+        finally:
+            self._refreshing.difference_update(product_ids)
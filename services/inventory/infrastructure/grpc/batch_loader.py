@@ -0,0 +1,107 @@
+"""
+Coalescing de llamadas al estilo DataLoader.
+
+Las llamadas `load(key)` que llegan dentro de una ventana corta se agrupan en
+una sola llamada `load_many(keys)`. Las claves repetidas (en cola o ya en
+vuelo) comparten el mismo resultado en lugar de disparar otra petición.
+"""
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+LoadMany = Callable[[list[str], list[str]], Awaitable[dict[str, Any]]]
+
+
+class BatchLoader:
+    def __init__(self, load_many: LoadMany, window_ms: float, max_batch_size: int) -> None:
+        """
+        Args:
+            load_many: Corrutina (keys, request_ids) -> {key: valor}; las claves
+                ausentes del resultado se resuelven como None
+            window_ms: Tiempo máximo que espera una clave antes de despachar el lote
+            max_batch_size: Tamaño de lote que fuerza el despacho inmediato
+        """
+        self._load_many = load_many
+        self.window = window_ms / 1000
+        self.max_batch_size = max(1, max_batch_size)
+
+        self._queue: dict[str, asyncio.Future] = {}
+        self._queued_request_ids: list[str] = []
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+        self.batches_dispatched = 0
+        self.keys_dispatched = 0
+        self.coalesced_loads = 0
+
+    async def load(self, key: str, request_id: str) -> Any:
+        future = self._queue.get(key) or self._in_flight.get(key)
+        if future is not None:
+            self.coalesced_loads += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            # Evita "exception was never retrieved" si todos los que esperaban se cancelan
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._queue[key] = future
+            self._queued_request_ids.append(request_id)
+
+            if len(self._queue) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._dispatch)
+
+        # shield: cancelar a un llamador no cancela el resultado compartido
+        return await asyncio.shield(future)
+
+    async def close(self) -> None:
+        """Despacha las claves en cola y espera a los lotes en vuelo."""
+        self._dispatch()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "batches_dispatched": self.batches_dispatched,
+            "keys_dispatched": self.keys_dispatched,
+            "coalesced_loads": self.coalesced_loads,
+            "queued": len(self._queue),
+            "in_flight": len(self._in_flight),
+        }
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._queue:
+            return
+
+        batch, self._queue = self._queue, {}
+        request_ids, self._queued_request_ids = self._queued_request_ids, []
+        self._in_flight.update(batch)
+        self.batches_dispatched += 1
+        self.keys_dispatched += len(batch)
+
+        task = asyncio.ensure_future(self._run(batch, request_ids))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[str, asyncio.Future], request_ids: list[str]) -> None:
+        try:
+            results = await self._load_many(list(batch), request_ids)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for key, future in batch.items():
+                if not future.done():
+                    future.set_result(results.get(key))
+        finally:
+            for key, future in batch.items():
+                if not future.done():
+                    # La tarea fue cancelada (p. ej. al cerrar el cliente)
+                    future.cancel()
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
@@ -4,13 +4,21 @@ gRPC Client - Puerto de salida (Driven Adapter)
 Este adaptador implementa el puerto ProductServicePort
 usando gRPC para comunicación con Products Service.
 """
+import asyncio
 import logging
+import time
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
 from decimal import Decimal
 from typing import Any
 
 import grpc
 
+from libs.common.logging import add_timing
+from libs.common.metrics import grpc_client_call_duration
 from services.inventory.domain.ports import ProductServicePort
+from services.inventory.infrastructure.grpc.batch_loader import BatchLoader
 from services.inventory.infrastructure.grpc.products import (
     products_pb2,
     products_pb2_grpc,
@@ -18,6 +26,23 @@ from services.inventory.infrastructure.grpc.products import (
 
 logger = logging.getLogger(__name__)
 
+# Máximo de IDs por BatchGetProducts que acepta Products Service (MAX_BATCH_SIZE);
+# los lotes más grandes los rechaza enteros con INVALID_ARGUMENT
+SERVER_MAX_BATCH_SIZE = 500
+
+
+def _product_to_dict(product: products_pb2.Product) -> dict[str, Any]:
+    """Convertir un mensaje Product de gRPC a diccionario."""
+    return {
+        "id": product.id,
+        "name": product.name,
+        "description": product.description,
+        "price": Decimal(product.price),
+        "images": list(product.images) if product.images else [],
+        "created_at": product.created_at,
+        "updated_at": product.updated_at,
+    }
+
 
 class ProductsGrpcClient(ProductServicePort):
     """
@@ -27,6 +52,10 @@ class ProductsGrpcClient(ProductServicePort):
     - Es un adaptador de salida (driven adapter)
     - Implementa el puerto ProductServicePort
     - Traduce llamadas del dominio a peticiones gRPC
+
+    Está pensado para vivir durante todo el proceso (se conecta en el lifespan):
+    mantiene un pool de `pool_size` canales, cada uno con su propia conexión
+    HTTP/2, y reparte las llamadas entre ellos en round-robin.
     """
 
     def __init__(
@@ -34,16 +63,39 @@ class ProductsGrpcClient(ProductServicePort):
         grpc_url: str,
         use_ssl: bool = False,
         timeout: int = 30,
+        pool_size: int = 1,
+        batch_window_ms: float = 0,
+        max_batch_size: int = 100,
     ) -> None:
         """
         Args:
             grpc_url: URL del servidor gRPC (ej: "localhost:50051")
             use_ssl: Si debe usar canal seguro (SSL/TLS). Auto-detecta si el puerto es 443
             timeout: Timeout en segundos para operaciones gRPC
+            pool_size: Número de canales (conexiones HTTP/2) a mantener abiertos
+            batch_window_ms: Si es > 0, agrupa las llamadas a get_product que llegan
+                dentro de esta ventana en un único BatchGetProducts (opt-in)
+            max_batch_size: Tamaño de lote que fuerza el envío antes de la ventana
+                (como mucho SERVER_MAX_BATCH_SIZE)
         """
         self.grpc_url = grpc_url
-        self._channel: grpc.aio.Channel | None = None
-        self._stub: products_pb2_grpc.ProductsServiceStub | None = None
+        self.pool_size = max(1, pool_size)
+        self._channels: list[grpc.aio.Channel] = []
+        self._stubs: list[products_pb2_grpc.ProductsServiceStub] = []
+        self._next_stub = 0
+        self._in_flight = 0
+        self._calls_total = 0
+        if max_batch_size > SERVER_MAX_BATCH_SIZE:
+            logger.warning(
+                f"max_batch_size {max_batch_size} exceeds the server limit, "
+                f"using {SERVER_MAX_BATCH_SIZE}"
+            )
+            max_batch_size = SERVER_MAX_BATCH_SIZE
+        self._batch_loader = (
+            BatchLoader(self._load_batch, batch_window_ms, max_batch_size)
+            if batch_window_ms > 0
+            else None
+        )
 
         # Auto-detectar SSL si el puerto es 443
         if not use_ssl and ":443" in grpc_url:
@@ -60,7 +112,7 @@ class ProductsGrpcClient(ProductServicePort):
         Returns:
             Lista de opciones del canal
         """
-        return [
+        options: list[tuple[str, Any]] = [
             # Keep-alive settings - previenen que el canal se cierre
             ("grpc.keepalive_time_ms", 30000),  # 30 segundos
             ("grpc.keepalive_timeout_ms", 10000),  # 10 segundos
@@ -80,37 +132,96 @@ class ProductsGrpcClient(ProductServicePort):
             ("grpc.dns_min_time_between_resolutions_ms", 10000),
         ]
 
+        if self.pool_size > 1:
+            # Sin esto, los canales con el mismo target y opciones comparten
+            # subchannel (una sola conexión TCP) y el pool no reparte carga
+            options.append(("grpc.use_local_subchannel_pool", 1))
+
+        return options
+
+    def _create_channel(self) -> grpc.aio.Channel:
+        options = self._get_channel_options()
+
+        if self.use_ssl:
+            # Canal seguro con SSL/TLS para producción
+            credentials = grpc.ssl_channel_credentials()
+            return grpc.aio.secure_channel(self.grpc_url, credentials, options=options)
+
+        # Canal inseguro para desarrollo local
+        return grpc.aio.insecure_channel(self.grpc_url, options=options)
+
     async def _ensure_connection(self) -> None:
-        """Asegurar que hay una conexión gRPC abierta."""
-        if self._channel is None:
-            options = self._get_channel_options()
-
-            if self.use_ssl:
-                # Canal seguro con SSL/TLS para producción
-                credentials = grpc.ssl_channel_credentials()
-                self._channel = grpc.aio.secure_channel(
-                    self.grpc_url,
-                    credentials,
-                    options=options,
-                )
-                logger.info(f"gRPC secure channel created to {self.grpc_url}")
-            else:
-                # Canal inseguro para desarrollo local
-                self._channel = grpc.aio.insecure_channel(
-                    self.grpc_url,
-                    options=options,
-                )
-                logger.info(f"gRPC insecure channel created to {self.grpc_url}")
+        """Asegurar que el pool de canales gRPC está creado."""
+        if not self._channels:
+            self._channels = [self._create_channel() for _ in range(self.pool_size)]
+            self._stubs = [
+                products_pb2_grpc.ProductsServiceStub(channel) for channel in self._channels
+            ]
+            logger.info(
+                f"gRPC {'secure' if self.use_ssl else 'insecure'} channel pool "
+                f"({self.pool_size}) created to {self.grpc_url}"
+            )
 
-            self._stub = products_pb2_grpc.ProductsServiceStub(self._channel)
+    async def _get_stub(self) -> products_pb2_grpc.ProductsServiceStub:
+        """Siguiente stub del pool (round-robin)."""
+        await self._ensure_connection()
+        stub = self._stubs[self._next_stub % len(self._stubs)]
+        self._next_stub += 1
+        return stub
+
+    @contextmanager
+    def _track_call(self, method: str) -> Iterator[None]:
+        self._in_flight += 1
+        self._calls_total += 1
+        started = time.perf_counter()
+        code = "UNKNOWN"
+        try:
+            yield
+            code = "OK"
+        except grpc.RpcError as e:
+            code = e.code().name
+            raise
+        except (GeneratorExit, asyncio.CancelledError):
+            # Petición cancelada o consumidor que dejó de iterar un stream a medias
+            code = "CANCELLED"
+            raise
+        finally:
+            self._in_flight -= 1
+            elapsed = time.perf_counter() - started
+            grpc_client_call_duration.labels(method, code).observe(elapsed)
+            add_timing("grpc", elapsed)
+
+    async def connect(self) -> None:
+        """Crear el pool y empezar a conectar sin esperar a la primera petición."""
+        await self._ensure_connection()
+        for channel in self._channels:
+            channel.get_state(try_to_connect=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Estado de los canales y llamadas en curso (para health/métricas)."""
+        return {
+            "target": self.grpc_url,
+            "pool_size": self.pool_size,
+            "channel_states": [
+                channel.get_state(try_to_connect=False).name for channel in self._channels
+            ],
+            "in_flight_calls": self._in_flight,
+            "calls_total": self._calls_total,
+            "batching": self._batch_loader.stats() if self._batch_loader else None,
+        }
 
     async def close(self) -> None:
-        """Cerrar la conexión gRPC."""
-        if self._channel:
-            await self._channel.close()
-            self._channel = None
-            self._stub = None
-            logger.info("gRPC channel closed")
+        """Despachar los lotes pendientes y cerrar todos los canales del pool."""
+        if self._batch_loader is not None:
+            # Sin esto, quien espera un lote aún en cola no recibiría respuesta
+            await self._batch_loader.close()
+        if self._channels:
+            channels = self._channels
+            self._channels = []
+            self._stubs = []
+            for channel in channels:
+                await channel.close()
+            logger.info("gRPC channel pool closed")
 
     async def get_product(
         self, product_id: str, request_id: str
@@ -125,33 +236,25 @@ class ProductsGrpcClient(ProductServicePort):
         Returns:
             Diccionario con datos del producto o None si no existe
         """
-        try:
-            await self._ensure_connection()
+        if self._batch_loader is not None:
+            return await self._batch_loader.load(product_id, request_id)
 
-            if self._stub is None:
-                raise RuntimeError("gRPC stub not initialized")
+        try:
+            stub = await self._get_stub()
 
             # Crear metadata para tracing
             metadata = (("x-request-id", request_id),)
 
             # Llamar al servicio gRPC con timeout
-            response = await self._stub.GetProduct(
-                products_pb2.GetProductRequest(product_id=product_id),
-                metadata=metadata,
-                timeout=self.timeout,
-            )
+            with self._track_call("GetProduct"):
+                response = await stub.GetProduct(
+                    products_pb2.GetProductRequest(product_id=product_id),
+                    metadata=metadata,
+                    timeout=self.timeout,
+                )
 
             # Convertir respuesta gRPC a diccionario
-            product = response.product
-            return {
-                "id": product.id,
-                "name": product.name,
-                "description": product.description,
-                "price": Decimal(product.price),
-                "images": list(product.images) if product.images else [],
-                "created_at": product.created_at,
-                "updated_at": product.updated_at,
-            }
+            return _product_to_dict(response.product)
 
         except grpc.RpcError as e:
             if e.code() == grpc.StatusCode.NOT_FOUND:
@@ -173,6 +276,130 @@ class ProductsGrpcClient(ProductServicePort):
             )
             raise
 
+    async def get_products(
+        self, product_ids: list[str], request_id: str
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Obtener varios productos vía BatchGetProducts.
+
+        Las listas de más de SERVER_MAX_BATCH_SIZE IDs se parten en varias
+        llamadas concurrentes, repartidas entre los canales del pool.
+
+        Args:
+            product_ids: IDs de los productos
+            request_id: ID de la petición (para tracing)
+
+        Returns:
+            Diccionario product_id -> datos del producto (los inexistentes no aparecen)
+        """
+        product_ids = list(dict.fromkeys(product_ids))
+        if len(product_ids) <= SERVER_MAX_BATCH_SIZE:
+            return await self._batch_get_products(product_ids, request_id)
+
+        chunks = await asyncio.gather(
+            *(
+                self._batch_get_products(
+                    product_ids[start : start + SERVER_MAX_BATCH_SIZE], request_id
+                )
+                for start in range(0, len(product_ids), SERVER_MAX_BATCH_SIZE)
+            )
+        )
+        return {pid: product for chunk in chunks for pid, product in chunk.items()}
+
+    async def _batch_get_products(
+        self, product_ids: list[str], request_id: str
+    ) -> dict[str, dict[str, Any]]:
+        """Una llamada BatchGetProducts (como mucho SERVER_MAX_BATCH_SIZE IDs)."""
+        if not product_ids:
+            return {}
+
+        try:
+            stub = await self._get_stub()
+
+            with self._track_call("BatchGetProducts"):
+                response = await stub.BatchGetProducts(
+                    products_pb2.BatchGetProductsRequest(product_ids=product_ids),
+                    metadata=(("x-request-id", request_id),),
+                    timeout=self.timeout,
+                )
+
+            if response.missing_ids:
+                logger.warning(
+                    f"{len(response.missing_ids)} products not found via gRPC "
+                    f"(request_id: {request_id})"
+                )
+            return {p.id: _product_to_dict(p) for p in response.products}
+
+        except grpc.RpcError as e:
+            logger.error(
+                f"gRPC error getting {len(product_ids)} products: {e.code()} - "
+                f"{e.details()} (request_id: {request_id})"
+            )
+            raise
+
+    async def _load_batch(
+        self, product_ids: list[str], request_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Despachar un lote agrupado por BatchLoader como un único BatchGetProducts.
+
+        La llamada lleva un request ID propio del lote (Products Service trata
+        x-request-id como un único ID); la relación con las peticiones que
+        agrupa queda en el log.
+        """
+        batch_request_id = f"batch-{uuid.uuid4()}"
+        logger.info(
+            f"Dispatching batched GetProduct for {len(product_ids)} products",
+            extra={
+                "request_id": batch_request_id,
+                "batched_request_ids": list(dict.fromkeys(request_ids)),
+            },
+        )
+        return await self.get_products(product_ids, batch_request_id)
+
+    async def stream_products(
+        self,
+        chunk_size: int = 500,
+        cursor: str = "",
+        request_id: str = "unknown",
+        timeout: float | None = None,
+    ) -> AsyncIterator[tuple[list[dict[str, Any]], str]]:
+        """
+        Recorrer el catálogo completo vía StreamProducts (server streaming).
+
+        Los mensajes se leen de a uno, así que el servidor solo avanza cuando
+        este consumidor procesa el bloque anterior.
+
+        Args:
+            chunk_size: Productos por mensaje
+            cursor: Cursor desde el cual reanudar ("" desde el inicio)
+            request_id: ID de la petición (para tracing)
+            timeout: Deadline total del stream en segundos (None = sin límite)
+
+        Yields:
+            Tuplas (productos, cursor) donde cursor permite reanudar tras ese bloque
+        """
+        stub = await self._get_stub()
+
+        call = stub.StreamProducts(
+            products_pb2.StreamProductsRequest(chunk_size=chunk_size, cursor=cursor),
+            metadata=(("x-request-id", request_id),),
+            timeout=timeout,
+        )
+        try:
+            with self._track_call("StreamProducts"):
+                async for response in call:
+                    yield [_product_to_dict(p) for p in response.products], response.cursor
+        except grpc.RpcError as e:
+            logger.error(
+                f"gRPC error streaming products (cursor={cursor!r}): {e.code()} - "
+                f"{e.details()} (request_id: {request_id})"
+            )
+            raise
+        finally:
+            # Cancela el stream si el consumidor deja de iterar antes de terminar
+            call.cancel()
+
     async def product_exists(self, product_id: str) -> bool:
         """
         Verificar si un producto existe.
@@ -184,15 +411,13 @@ class ProductsGrpcClient(ProductServicePort):
             True si existe, False si no
         """
         try:
-            await self._ensure_connection()
+            stub = await self._get_stub()
 
-            if self._stub is None:
-                raise RuntimeError("gRPC stub not initialized")
-
-            response = await self._stub.ProductExists(
-                products_pb2.ProductExistsRequest(product_id=product_id),
-                timeout=self.timeout,
-            )
+            with self._track_call("ProductExists"):
+                response = await stub.ProductExists(
+                    products_pb2.ProductExistsRequest(product_id=product_id),
+                    timeout=self.timeout,
+                )
 
             return response.exists
 
@@ -209,11 +434,49 @@ class ProductsGrpcClient(ProductServicePort):
             )
             raise
 
+    async def list_products(
+        self, cursor: str = "", size: int = 100, request_id: str = "unknown"
+    ) -> tuple[list[dict[str, Any]], str]:
+        """
+        Obtener una página del catálogo con paginación por cursor (keyset).
+
+        El costo por página es constante sin importar la profundidad, por lo que
+        sirve para recorrer el catálogo completo.
+
+        Args:
+            cursor: Cursor devuelto por la página anterior ("" para la primera)
+            size: Productos por página
+            request_id: ID de la petición (para tracing)
+
+        Returns:
+            Tupla (productos, next_cursor); next_cursor es "" en la última página
+        """
+        try:
+            stub = await self._get_stub()
+
+            with self._track_call("ListProducts"):
+                response = await stub.ListProducts(
+                    products_pb2.ListProductsRequest(size=size, cursor=cursor),
+                    metadata=(("x-request-id", request_id),),
+                    timeout=self.timeout,
+                )
+
+            return [_product_to_dict(p) for p in response.products], response.next_cursor
+
+        except grpc.RpcError as e:
+            logger.error(
+                f"gRPC error listing products (cursor={cursor!r}): {e.code()} - "
+                f"{e.details()} (request_id: {request_id})"
+            )
+            raise
+
 
 def get_products_grpc_client(
     grpc_url: str,
     use_ssl: bool = False,
     timeout: int = 30,
+    pool_size: int = 1,
+    batch_window_ms: float = 0,
 ) -> ProductsGrpcClient:
     """
     Factory function para crear el cliente gRPC.
@@ -222,8 +485,16 @@ def get_products_grpc_client(
         grpc_url: URL del servidor gRPC
         use_ssl: Si debe usar SSL/TLS (auto-detecta puerto 443)
         timeout: Timeout en segundos para operaciones gRPC
+        pool_size: Número de canales del pool
+        batch_window_ms: Ventana de agrupación de get_product (0 = desactivado)
 
     Returns:
         Cliente gRPC configurado
     """
-    return ProductsGrpcClient(grpc_url, use_ssl=use_ssl, timeout=timeout)
+    return ProductsGrpcClient(
+        grpc_url,
+        use_ssl=use_ssl,
+        timeout=timeout,
+        pool_size=pool_size,
+        batch_window_ms=batch_window_ms,
+    )
@@ -1,12 +1,24 @@
 from datetime import datetime
 from typing import Any
 
-from services.inventory.domain.entities import Inventory
+from pymongo import ReturnDocument, UpdateOne
+
+from libs.common.logging import timed
+from services.inventory.domain.entities import AdjustmentStatus, Inventory, InventoryAdjustment
 from services.inventory.domain.ports import InventoryRepository
 from services.inventory.infrastructure.database.models import InventoryModel
 
 
+class _AdjustmentsRejected(Exception):
+    """Aborta la transacción del modo atómico llevando los resultados por producto."""
+
+    def __init__(self, adjustments: list[InventoryAdjustment]) -> None:
+        super().__init__("Atomic bulk adjustment rejected")
+        self.adjustments = adjustments
+
+
 class MongoDBInventoryRepository(InventoryRepository):
+    @timed("db")
     async def get_by_product_id(self, product_id: str) -> Inventory | None:
         inventory_model = await InventoryModel.find_one(InventoryModel.product_id == product_id)
 
@@ -15,6 +27,7 @@ class MongoDBInventoryRepository(InventoryRepository):
 
         return self._to_entity(inventory_model)
 
+    @timed("db")
     async def create(self, inventory_data: dict[str, Any]) -> Inventory:
         inventory_model = InventoryModel(
             product_id=inventory_data["product_id"],
@@ -25,17 +38,152 @@ class MongoDBInventoryRepository(InventoryRepository):
         await inventory_model.insert()
         return self._to_entity(inventory_model)
 
-    async def update_quantity(self, product_id: str, quantity_delta: int) -> Inventory | None:
-        inventory_model = await InventoryModel.find_one(InventoryModel.product_id == product_id)
+    @timed("db")
+    async def update_quantity(self, product_id: str, quantity_delta: int) -> InventoryAdjustment:
+        return await self._adjust(
+            InventoryModel.get_motor_collection(), product_id, quantity_delta
+        )
 
-        if not inventory_model:
-            return None
+    @timed("db")
+    async def bulk_update_quantities(
+        self, deltas: dict[str, int], atomic: bool = False
+    ) -> list[InventoryAdjustment]:
+        """
+        Aplica todos los deltas y devuelve un resultado por producto.
 
-        inventory_model.quantity += quantity_delta
-        inventory_model.last_updated = datetime.utcnow()
+        Ambos modos hacen una lectura y un único bulk_write dentro de una
+        transacción (requiere replica set), así que el coste no crece en round
+        trips con el tamaño del lote. La lectura ve una instantánea: si otro
+        escritor modifica uno de los documentos antes del commit, MongoDB aborta
+        con TransientTransactionError y with_transaction reintenta el lote, de
+        modo que el resultado de cada producto es exacto.
 
-        await inventory_model.save()
-        return self._to_entity(inventory_model)
+        En modo no atómico se escriben los deltas aplicables y el resto se
+        informa; en modo atómico basta un fallo para no escribir ninguno.
+        """
+        return await self._apply_in_transaction(
+            InventoryModel.get_motor_collection(), deltas, atomic
+        )
+
+    async def _adjust(
+        self, collection: Any, product_id: str, quantity_delta: int
+    ) -> InventoryAdjustment:
+        """
+        Aplica el delta en un único find_one_and_update.
+
+        El filtro solo usa product_id y la condición de stock va dentro de un
+        update por pipeline: así el documento previo devuelto permite distinguir
+        "no existe" (None) de "stock insuficiente" (el $cond no cambió nada)
+        sin una segunda lectura.
+        """
+        now = datetime.utcnow()
+        new_quantity = {"$add": ["$quantity", quantity_delta]}
+        applies = {"$gte": [new_quantity, 0]}
+        previous = await collection.find_one_and_update(
+            {"product_id": product_id},
+            [
+                {
+                    "$set": {
+                        "quantity": {"$cond": [applies, new_quantity, "$quantity"]},
+                        "last_updated": {
+                            "$cond": [applies, now, "$last_updated"]
+                        },
+                    }
+                },
+            ],
+            return_document=ReturnDocument.BEFORE,
+        )
+
+        if previous is None:
+            return InventoryAdjustment(product_id, AdjustmentStatus.NOT_FOUND)
+
+        previous_quantity = previous["quantity"]
+        if previous_quantity + quantity_delta < 0:
+            return InventoryAdjustment(
+                product_id, AdjustmentStatus.INSUFFICIENT, previous_quantity
+            )
+
+        # Reconstruye el estado posterior a partir del documento previo
+        inventory = Inventory(
+            product_id=product_id,
+            quantity=previous_quantity + quantity_delta,
+            last_updated=now,
+        )
+        return InventoryAdjustment(
+            product_id, AdjustmentStatus.UPDATED, previous_quantity, inventory
+        )
+
+    async def _apply_in_transaction(
+        self, collection: Any, deltas: dict[str, int], atomic: bool
+    ) -> list[InventoryAdjustment]:
+        """Clasifica el lote contra una instantánea y escribe lo aplicable."""
+
+        async def apply(session: Any) -> list[InventoryAdjustment]:
+            documents = {
+                doc["product_id"]: doc
+                async for doc in collection.find(
+                    {"product_id": {"$in": list(deltas)}},
+                    {"product_id": 1, "quantity": 1},
+                    session=session,
+                )
+            }
+
+            now = datetime.utcnow()
+            adjustments = []
+            for product_id, delta in deltas.items():
+                doc = documents.get(product_id)
+                if doc is None:
+                    adjustments.append(InventoryAdjustment(product_id, AdjustmentStatus.NOT_FOUND))
+                elif doc["quantity"] + delta < 0:
+                    adjustments.append(
+                        InventoryAdjustment(
+                            product_id, AdjustmentStatus.INSUFFICIENT, doc["quantity"]
+                        )
+                    )
+                else:
+                    inventory = Inventory(
+                        product_id=product_id,
+                        quantity=doc["quantity"] + delta,
+                        last_updated=now,
+                    )
+                    adjustments.append(
+                        InventoryAdjustment(
+                            product_id, AdjustmentStatus.UPDATED, doc["quantity"], inventory
+                        )
+                    )
+
+            updated = [a for a in adjustments if a.status == AdjustmentStatus.UPDATED]
+            if atomic and len(updated) < len(adjustments):
+                raise _AdjustmentsRejected(adjustments)
+
+            if updated:
+                await collection.bulk_write(
+                    [
+                        UpdateOne(
+                            {"product_id": adjustment.product_id},
+                            {
+                                "$inc": {"quantity": deltas[adjustment.product_id]},
+                                "$set": {"last_updated": now},
+                            },
+                        )
+                        for adjustment in updated
+                    ],
+                    ordered=False,
+                    session=session,
+                )
+            return adjustments
+
+        async with await collection.database.client.start_session() as session:
+            try:
+                return await session.with_transaction(apply)
+            except _AdjustmentsRejected as rejected:
+                adjustments = rejected.adjustments
+
+        for adjustment in adjustments:
+            if adjustment.status == AdjustmentStatus.UPDATED:
+                adjustment.status = AdjustmentStatus.ROLLED_BACK
+                adjustment.inventory = None
+        return adjustments
 
     def _to_entity(self, model: InventoryModel) -> Inventory:
         return Inventory(
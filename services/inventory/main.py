@@ -1,19 +1,18 @@
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 
 from beanie import init_beanie
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 
-from libs.common.logging import setup_logging
-from libs.common.middleware import (
-    ErrorHandlerMiddleware,
-    RequestIDMiddleware,
-    RequestLoggingMiddleware,
-)
+from libs.common.logging import logging_stats, setup_logging
+from libs.common.metrics import MetricsMiddleware, mark_worker_dead, render_metrics
+from libs.common.middleware import RequestContextMiddleware
+from services.inventory.api.dependencies import cached_product_service, products_grpc_client
 from services.inventory.api.routes_v1 import router as inventory_router_v1
 from services.inventory.infrastructure.database.models import InventoryModel
 
@@ -23,10 +22,25 @@ load_dotenv(env_path, override=True)
 
 SERVICE_NAME = "inventory"
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# Logging asíncrono: los registros se escriben en un hilo aparte vía una cola acotada
+LOG_ASYNC = os.getenv("LOG_ASYNC", "false").lower() == "true"
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_QUEUE_POLICY = os.getenv("LOG_QUEUE_POLICY", "drop")
+# Muestreo de logs de peticiones: 1 de cada N correctas, más errores y peticiones lentas
+LOG_REQUEST_SAMPLE_EVERY = int(os.getenv("LOG_REQUEST_SAMPLE_EVERY", "1"))
+LOG_SLOW_REQUEST_MS = float(os.getenv("LOG_SLOW_REQUEST_MS", "500"))
+# Desglose de tiempos (BD, caché, gRPC) en la cabecera Server-Timing y en el log
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "false").lower() == "true"
 MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
 MONGODB_DATABASE = os.getenv("MONGODB_DATABASE", "inventory_db")
 
-logger = setup_logging(SERVICE_NAME, LOG_LEVEL)
+logger = setup_logging(
+    SERVICE_NAME,
+    LOG_LEVEL,
+    async_mode=LOG_ASYNC,
+    queue_size=LOG_QUEUE_SIZE,
+    queue_policy=LOG_QUEUE_POLICY,
+)
 
 
 @asynccontextmanager
@@ -37,11 +51,15 @@ async def lifespan(_app: FastAPI):
     client = AsyncIOMotorClient(MONGODB_URI)
     database = client[MONGODB_DATABASE]
     await init_beanie(database=database, document_models=[InventoryModel])
+    await products_grpc_client.connect()
 
     yield
 
     # Shutdown
     logger.info(f"{SERVICE_NAME} service shutting down")
+    await cached_product_service.close()
+    await products_grpc_client.close()
+    mark_worker_dead()
 
 
 app = FastAPI(
@@ -60,20 +78,37 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["X-Request-ID"],
+    expose_headers=["X-Request-ID", "Server-Timing"],
     max_age=3600,
 )
-app.add_middleware(RequestLoggingMiddleware)
-app.add_middleware(RequestIDMiddleware)
-app.add_middleware(ErrorHandlerMiddleware)
+app.add_middleware(
+    RequestContextMiddleware,
+    sample_every=LOG_REQUEST_SAMPLE_EVERY,
+    slow_request_ms=LOG_SLOW_REQUEST_MS,
+    server_timing=SERVER_TIMING_ENABLED,
+)
+# Por fuera de RequestContextMiddleware: registra el estado final de cada respuesta
+app.add_middleware(MetricsMiddleware)
 
 # API v1 routes
 app.include_router(inventory_router_v1)
 
 
 @app.get("/health")
-async def health_check() -> dict[str, str]:
-    return {"status": "healthy", "service": SERVICE_NAME}
+async def health_check() -> dict[str, Any]:
+    return {
+        "status": "healthy",
+        "service": SERVICE_NAME,
+        "logging": logging_stats(),
+        "products_grpc": products_grpc_client.stats(),
+        "products_cache": cached_product_service.stats(),
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    payload, content_type = render_metrics()
+    return Response(payload, media_type=content_type)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,33 @@
+from collections.abc import Iterator
+from types import ModuleType
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from libs.common.logging import shutdown_logging
+
+
+@pytest.fixture
+def main(monkeypatch: pytest.MonkeyPatch) -> Iterator[ModuleType]:
+    from services.inventory import main
+
+    monkeypatch.setattr(main, "AsyncIOMotorClient", MagicMock())
+    monkeypatch.setattr(main, "init_beanie", AsyncMock())
+    monkeypatch.setattr(main, "products_grpc_client", AsyncMock())
+    monkeypatch.setattr(main, "cached_product_service", AsyncMock())
+    monkeypatch.setattr(main, "mark_worker_dead", MagicMock())
+    yield main
+    # Importing main configures logging for the whole process
+    shutdown_logging()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_connects_and_closes_the_products_client(main: ModuleType) -> None:
+    client = main.products_grpc_client
+
+    async with main.lifespan(main.app):
+        client.connect.assert_awaited_once()
+        client.close.assert_not_awaited()
+
+    client.close.assert_awaited_once()
+    main.cached_product_service.close.assert_awaited_once()
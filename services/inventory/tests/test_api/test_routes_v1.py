@@ -0,0 +1,89 @@
+from datetime import datetime
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from libs.auth.api_key import verify_api_key
+from libs.common.middleware import RequestContextMiddleware
+from services.inventory.api.dependencies import get_inventory_repository
+from services.inventory.api.routes_v1 import router
+from services.inventory.domain.entities import AdjustmentStatus, Inventory, InventoryAdjustment
+
+
+@pytest.fixture
+def client(mock_repository: AsyncMock) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+    app.include_router(router)
+    app.dependency_overrides[get_inventory_repository] = lambda: mock_repository
+    app.dependency_overrides[verify_api_key] = lambda: "test-key"
+    return TestClient(app)
+
+
+def bulk_adjust(client: TestClient, atomic: bool) -> dict[str, Any]:
+    response = client.post(
+        "/api/v1/inventory/bulk-adjust",
+        json={
+            "adjustments": [
+                {"product_id": "in-stock", "quantity_delta": -4},
+                {"product_id": "low-stock", "quantity_delta": -2},
+                {"product_id": "missing", "quantity_delta": 5},
+            ],
+            "atomic": atomic,
+        },
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_bulk_adjust_returns_a_result_per_product(
+    client: TestClient, mock_repository: AsyncMock
+) -> None:
+    mock_repository.bulk_update_quantities.return_value = [
+        InventoryAdjustment(
+            "in-stock",
+            AdjustmentStatus.UPDATED,
+            10,
+            Inventory("in-stock", 6, datetime(2024, 1, 1)),
+        ),
+        InventoryAdjustment("low-stock", AdjustmentStatus.INSUFFICIENT, 1),
+        InventoryAdjustment("missing", AdjustmentStatus.NOT_FOUND),
+    ]
+
+    body = bulk_adjust(client, atomic=False)
+
+    assert [(item["id"], item["attributes"]["status"]) for item in body["data"]] == [
+        ("in-stock", "updated"),
+        ("low-stock", "insufficient"),
+        ("missing", "not_found"),
+    ]
+    assert body["data"][0]["attributes"]["quantity"] == 6
+    assert body["meta"]["statuses"] == {"updated": 1, "insufficient": 1, "not_found": 1}
+    mock_repository.bulk_update_quantities.assert_awaited_once_with(
+        {"in-stock": -4, "low-stock": -2, "missing": 5}, atomic=False
+    )
+
+
+def test_atomic_bulk_adjust_reports_rolled_back_items(
+    client: TestClient, mock_repository: AsyncMock
+) -> None:
+    mock_repository.bulk_update_quantities.return_value = [
+        InventoryAdjustment("in-stock", AdjustmentStatus.ROLLED_BACK, 10),
+        InventoryAdjustment("low-stock", AdjustmentStatus.INSUFFICIENT, 1),
+        InventoryAdjustment("missing", AdjustmentStatus.NOT_FOUND),
+    ]
+
+    body = bulk_adjust(client, atomic=True)
+
+    assert body["data"][0]["attributes"] == {
+        "status": "rolled_back",
+        "previous_quantity": 10,
+        "quantity": None,
+    }
+    assert body["meta"] == {
+        "atomic": True,
+        "statuses": {"rolled_back": 1, "insufficient": 1, "not_found": 1},
+    }
@@ -0,0 +1,55 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from libs.common.errors import ValidationError
+from services.inventory.application.bulk_adjust_inventory import (
+    MAX_BULK_ADJUSTMENTS,
+    BulkAdjustInventory,
+)
+from services.inventory.domain.entities import (
+    AdjustmentStatus,
+    Inventory,
+    InventoryAdjustment,
+)
+
+
+@pytest.mark.asyncio
+async def test_bulk_adjust_inventory_returns_per_item_results(
+    mock_repository: AsyncMock, sample_inventory: Inventory
+) -> None:
+    results = [
+        InventoryAdjustment("test-123", AdjustmentStatus.UPDATED, 110, sample_inventory),
+        InventoryAdjustment("missing", AdjustmentStatus.NOT_FOUND),
+    ]
+    mock_repository.bulk_update_quantities.return_value = results
+    use_case = BulkAdjustInventory(mock_repository)
+
+    adjustments = await use_case.execute(
+        [("test-123", -10), ("missing", 5)], atomic=False, request_id="request-123"
+    )
+
+    assert adjustments == results
+    mock_repository.bulk_update_quantities.assert_called_once_with(
+        {"test-123": -10, "missing": 5}, atomic=False
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "adjustments",
+    [
+        [],
+        [("test-123", 1), ("test-123", 2)],
+        [(f"id-{i}", 1) for i in range(MAX_BULK_ADJUSTMENTS + 1)],
+    ],
+)
+async def test_bulk_adjust_inventory_rejects_invalid_batches(
+    mock_repository: AsyncMock, adjustments: list[tuple[str, int]]
+) -> None:
+    use_case = BulkAdjustInventory(mock_repository)
+
+    with pytest.raises(ValidationError):
+        await use_case.execute(adjustments, atomic=True, request_id="request-123")
+
+    mock_repository.bulk_update_quantities.assert_not_called()
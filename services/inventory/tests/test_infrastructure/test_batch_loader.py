@@ -0,0 +1,83 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.inventory.infrastructure.grpc.batch_loader import BatchLoader
+
+
+def _echo_loader() -> AsyncMock:
+    async def load_many(keys: list[str], request_ids: list[str]) -> dict[str, dict]:
+        return {key: {"id": key} for key in keys if key != "missing"}
+
+    return AsyncMock(side_effect=load_many)
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_coalesces_calls_within_window() -> None:
+    load_many = _echo_loader()
+    loader = BatchLoader(load_many, window_ms=5, max_batch_size=100)
+
+    results = await asyncio.gather(
+        loader.load("a", "req-1"), loader.load("b", "req-2"), loader.load("a", "req-3")
+    )
+
+    assert results == [{"id": "a"}, {"id": "b"}, {"id": "a"}]
+    load_many.assert_called_once_with(["a", "b"], ["req-1", "req-2"])
+    assert loader.stats()["coalesced_loads"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_dispatches_when_batch_is_full() -> None:
+    load_many = _echo_loader()
+    loader = BatchLoader(load_many, window_ms=10_000, max_batch_size=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(loader.load("a", "req"), loader.load("b", "req")), timeout=1
+    )
+
+    assert [r["id"] for r in results] == ["a", "b"]
+    assert loader.stats()["batches_dispatched"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_missing_key_resolves_to_none() -> None:
+    loader = BatchLoader(_echo_loader(), window_ms=1, max_batch_size=100)
+
+    assert await loader.load("missing", "req") is None
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_propagates_errors_to_every_caller() -> None:
+    loader = BatchLoader(AsyncMock(side_effect=RuntimeError("boom")), 1, 100)
+
+    results = await asyncio.gather(
+        loader.load("a", "req"), loader.load("b", "req"), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert loader.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_cancelled_caller_does_not_cancel_others() -> None:
+    loader = BatchLoader(_echo_loader(), window_ms=5, max_batch_size=100)
+
+    first = asyncio.create_task(loader.load("a", "req-1"))
+    second = asyncio.create_task(loader.load("a", "req-2"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == {"id": "a"}
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_close_flushes_queued_keys() -> None:
+    loader = BatchLoader(_echo_loader(), window_ms=10_000, max_batch_size=100)
+
+    pending = asyncio.create_task(loader.load("a", "req"))
+    await asyncio.sleep(0)
+    await loader.close()
+
+    assert await asyncio.wait_for(pending, timeout=1) == {"id": "a"}
@@ -0,0 +1,83 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.inventory.infrastructure.cached_product_service import CachedProductService
+
+PRODUCT = {"id": "test-123", "name": "Test Product", "price": 99.99}
+
+
+@pytest.mark.asyncio
+async def test_cached_product_service_hits_after_first_call(
+    mock_product_service: AsyncMock,
+) -> None:
+    mock_product_service.get_product.return_value = PRODUCT
+    service = CachedProductService(mock_product_service)
+
+    assert await service.get_product("test-123", "req-1") == PRODUCT
+    assert await service.get_product("test-123", "req-2") == PRODUCT
+
+    mock_product_service.get_product.assert_called_once_with("test-123", "req-1")
+    assert service.stats()["hits"] == 1
+    assert service.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_product_service_caches_not_found(mock_product_service: AsyncMock) -> None:
+    mock_product_service.get_product.return_value = None
+    service = CachedProductService(mock_product_service, negative_ttl=60)
+
+    assert await service.get_product("missing", "req") is None
+    assert await service.get_product("missing", "req") is None
+
+    mock_product_service.get_product.assert_called_once()
+    assert service.stats()["negative_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_product_service_serves_stale_and_refreshes(
+    mock_product_service: AsyncMock,
+) -> None:
+    updated = {**PRODUCT, "price": 10.0}
+    mock_product_service.get_product.side_effect = [PRODUCT, updated]
+    service = CachedProductService(mock_product_service, ttl=0, stale_ttl=60)
+
+    await service.get_product("test-123", "req")
+    assert await service.get_product("test-123", "req") == PRODUCT
+    await asyncio.sleep(0)
+
+    assert service.stats()["refreshes"] == 1
+    assert service._cache.get("test-123").value == updated
+
+
+@pytest.mark.asyncio
+async def test_cached_product_service_keeps_stale_value_when_refresh_fails(
+    mock_product_service: AsyncMock,
+) -> None:
+    mock_product_service.get_product.side_effect = [PRODUCT, RuntimeError("unavailable")]
+    service = CachedProductService(mock_product_service, ttl=0, stale_ttl=60)
+
+    await service.get_product("test-123", "req")
+    assert await service.get_product("test-123", "req") == PRODUCT
+    await asyncio.sleep(0)
+
+    assert service.stats()["refresh_errors"] == 1
+    assert await service.get_product("test-123", "req") == PRODUCT
+
+
+@pytest.mark.asyncio
+async def test_cached_product_service_batches_only_misses(
+    mock_product_service: AsyncMock,
+) -> None:
+    mock_product_service.get_product.return_value = PRODUCT
+    mock_product_service.get_products.return_value = {"other": {"id": "other"}}
+    service = CachedProductService(mock_product_service)
+    await service.get_product("test-123", "req")
+
+    result = await service.get_products(["test-123", "other", "missing"], "req")
+
+    assert set(result) == {"test-123", "other"}
+    mock_product_service.get_products.assert_called_once_with(["other", "missing"], "req")
+    assert await service.get_product("missing", "req") is None
+    mock_product_service.get_product.assert_called_once()
@@ -0,0 +1,218 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+import mongomock
+import pytest
+from pymongo import UpdateOne
+
+from services.inventory.domain.entities import AdjustmentStatus
+from services.inventory.infrastructure.database.models import InventoryModel
+from services.inventory.infrastructure.mongodb_repository import MongoDBInventoryRepository
+
+LAST_UPDATED = datetime(2024, 1, 1)
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.committed = False
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    async def with_transaction(self, callback: Any) -> Any:
+        result = await callback(self)
+        self.committed = True
+        return result
+
+
+class AsyncCollection:
+    """A mongomock collection behind motor's async interface."""
+
+    def __init__(self, collection: mongomock.Collection) -> None:
+        self.collection = collection
+        self.session = FakeSession()
+        self.calls: list[str] = []
+
+    @property
+    def database(self) -> Any:
+        collection = self
+
+        class Client:
+            async def start_session(self) -> FakeSession:
+                return collection.session
+
+        class Database:
+            client = Client()
+
+        return Database()
+
+    async def find_one_and_update(self, *args: Any, **kwargs: Any) -> dict[str, Any] | None:
+        self.calls.append("find_one_and_update")
+        return self.collection.find_one_and_update(*args, **kwargs)
+
+    async def find(
+        self, query: dict[str, Any], projection: dict[str, int], session: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        self.calls.append("find")
+        for doc in self.collection.find(query, projection):
+            yield doc
+
+    async def bulk_write(
+        self, operations: list[UpdateOne], ordered: bool, session: Any
+    ) -> None:
+        self.calls.append("bulk_write")
+        # mongomock's bulk_write breaks on newer pymongo UpdateOne objects
+        for operation in operations:
+            self.collection.update_one(operation._filter, operation._doc)
+
+
+@pytest.fixture
+def collection(monkeypatch: pytest.MonkeyPatch) -> AsyncCollection:
+    collection = AsyncCollection(mongomock.MongoClient().db.inventory)
+    collection.collection.insert_many(
+        [
+            {"product_id": "in-stock", "quantity": 10, "last_updated": LAST_UPDATED},
+            {"product_id": "low-stock", "quantity": 1, "last_updated": LAST_UPDATED},
+        ]
+    )
+    monkeypatch.setattr(
+        InventoryModel, "get_motor_collection", lambda: collection, raising=False
+    )
+    return collection
+
+
+def stored(collection: AsyncCollection, product_id: str) -> dict[str, Any]:
+    return collection.collection.find_one({"product_id": product_id}, {"_id": 0})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("product_id", "delta", "status", "previous_quantity", "quantity"),
+    [
+        ("in-stock", -4, AdjustmentStatus.UPDATED, 10, 6),
+        ("low-stock", -2, AdjustmentStatus.INSUFFICIENT, 1, None),
+        ("missing", 5, AdjustmentStatus.NOT_FOUND, None, None),
+    ],
+)
+async def test_update_quantity_classifies_from_the_previous_document(
+    collection: AsyncCollection,
+    product_id: str,
+    delta: int,
+    status: AdjustmentStatus,
+    previous_quantity: int | None,
+    quantity: int | None,
+) -> None:
+    adjustment = await MongoDBInventoryRepository().update_quantity(product_id, delta)
+
+    assert adjustment.to_dict() == {
+        "product_id": product_id,
+        "status": status.value,
+        "previous_quantity": previous_quantity,
+        "quantity": quantity,
+    }
+    assert collection.calls == ["find_one_and_update"]
+
+
+@pytest.mark.asyncio
+async def test_update_quantity_pipeline_only_writes_when_stock_suffices(
+    collection: AsyncCollection,
+) -> None:
+    repository = MongoDBInventoryRepository()
+
+    await repository.update_quantity("in-stock", -4)
+    await repository.update_quantity("low-stock", -2)
+
+    in_stock = stored(collection, "in-stock")
+    assert in_stock["quantity"] == 6
+    assert in_stock["last_updated"] > LAST_UPDATED
+    assert stored(collection, "low-stock") == {
+        "product_id": "low-stock",
+        "quantity": 1,
+        "last_updated": LAST_UPDATED,
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_quantities_reports_each_product(
+    collection: AsyncCollection,
+) -> None:
+    adjustments = await MongoDBInventoryRepository().bulk_update_quantities(
+        {"in-stock": -4, "low-stock": -2, "missing": 5}
+    )
+
+    assert [a.to_dict() for a in adjustments] == [
+        {"product_id": "in-stock", "status": "updated", "previous_quantity": 10, "quantity": 6},
+        {
+            "product_id": "low-stock",
+            "status": "insufficient",
+            "previous_quantity": 1,
+            "quantity": None,
+        },
+        {
+            "product_id": "missing",
+            "status": "not_found",
+            "previous_quantity": None,
+            "quantity": None,
+        },
+    ]
+    assert stored(collection, "in-stock")["quantity"] == 6
+    assert stored(collection, "low-stock")["quantity"] == 1
+    assert collection.session.committed
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_quantities_uses_one_read_and_one_write(
+    collection: AsyncCollection,
+) -> None:
+    collection.collection.insert_many(
+        [
+            {"product_id": f"sku-{i}", "quantity": 5, "last_updated": LAST_UPDATED}
+            for i in range(200)
+        ]
+    )
+
+    adjustments = await MongoDBInventoryRepository().bulk_update_quantities(
+        {f"sku-{i}": 1 for i in range(200)}
+    )
+
+    assert all(a.status == AdjustmentStatus.UPDATED for a in adjustments)
+    assert collection.calls == ["find", "bulk_write"]
+
+
+@pytest.mark.asyncio
+async def test_atomic_bulk_update_commits_when_every_delta_applies(
+    collection: AsyncCollection,
+) -> None:
+    adjustments = await MongoDBInventoryRepository().bulk_update_quantities(
+        {"in-stock": -4, "low-stock": 3}, atomic=True
+    )
+
+    assert [(a.status, a.previous_quantity, a.inventory.quantity) for a in adjustments] == [
+        (AdjustmentStatus.UPDATED, 10, 6),
+        (AdjustmentStatus.UPDATED, 1, 4),
+    ]
+    assert collection.session.committed
+    assert stored(collection, "in-stock")["quantity"] == 6
+    assert stored(collection, "low-stock")["quantity"] == 4
+
+
+@pytest.mark.asyncio
+async def test_atomic_bulk_update_rolls_back_when_any_delta_fails(
+    collection: AsyncCollection,
+) -> None:
+    adjustments = await MongoDBInventoryRepository().bulk_update_quantities(
+        {"in-stock": -4, "low-stock": -2, "missing": 5}, atomic=True
+    )
+
+    assert [(a.status, a.inventory) for a in adjustments] == [
+        (AdjustmentStatus.ROLLED_BACK, None),
+        (AdjustmentStatus.INSUFFICIENT, None),
+        (AdjustmentStatus.NOT_FOUND, None),
+    ]
+    assert not collection.session.committed
+    assert collection.calls == ["find"]
+    assert stored(collection, "in-stock")["quantity"] == 10
@@ -0,0 +1,183 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import grpc
+import pytest
+
+from services.inventory.infrastructure.grpc.products import products_pb2, products_pb2_grpc
+from services.inventory.infrastructure.grpc.products_grpc_client import (
+    SERVER_MAX_BATCH_SIZE,
+    ProductsGrpcClient,
+)
+
+
+def _batching_client(max_batch_size: int = 100) -> ProductsGrpcClient:
+    client = ProductsGrpcClient(
+        "localhost:50051", batch_window_ms=10_000, max_batch_size=max_batch_size
+    )
+    client.get_products = AsyncMock(
+        side_effect=lambda ids, request_id: {i: {"id": i} for i in ids}
+    )
+    return client
+
+
+def test_max_batch_size_is_capped_at_the_server_limit() -> None:
+    client = _batching_client(max_batch_size=SERVER_MAX_BATCH_SIZE * 2)
+
+    assert client._batch_loader.max_batch_size == SERVER_MAX_BATCH_SIZE
+
+
+@pytest.mark.asyncio
+async def test_batched_call_sends_a_single_request_id() -> None:
+    client = _batching_client(max_batch_size=2)
+
+    await asyncio.gather(client.get_product("a", "req-1"), client.get_product("b", "req-2"))
+
+    request_id = client.get_products.await_args.args[1]
+    assert request_id.startswith("batch-")
+    assert "," not in request_id
+
+
+@pytest.mark.asyncio
+async def test_close_answers_callers_waiting_on_a_queued_batch() -> None:
+    client = _batching_client()
+
+    pending = asyncio.create_task(client.get_product("a", "req-1"))
+    await asyncio.sleep(0)
+    await client.close()
+
+    assert await asyncio.wait_for(pending, timeout=1) == {"id": "a"}
+
+
+class FakeChannel:
+    def __init__(self, target: str, options: list[tuple[str, Any]]) -> None:
+        self.target = target
+        self.options = dict(options)
+        self.connect_requested = False
+        self.closed = False
+
+    def get_state(self, try_to_connect: bool = False) -> grpc.ChannelConnectivity:
+        self.connect_requested |= try_to_connect
+        return grpc.ChannelConnectivity.READY
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeStub:
+    def __init__(self, channel: FakeChannel) -> None:
+        self.channel = channel
+        self.release = asyncio.Event()
+        self.batches: list[list[str]] = []
+
+    async def GetProduct(
+        self, request: products_pb2.GetProductRequest, **kwargs: Any
+    ) -> products_pb2.GetProductResponse:
+        await self.release.wait()
+        return products_pb2.GetProductResponse(
+            product=products_pb2.Product(id=request.product_id, price="1.00")
+        )
+
+    async def BatchGetProducts(
+        self, request: products_pb2.BatchGetProductsRequest, **kwargs: Any
+    ) -> products_pb2.BatchGetProductsResponse:
+        self.batches.append(list(request.product_ids))
+        return products_pb2.BatchGetProductsResponse(
+            products=[products_pb2.Product(id=pid, price="1.00") for pid in request.product_ids]
+        )
+
+
+@pytest.fixture
+def channels(monkeypatch: pytest.MonkeyPatch) -> list[FakeChannel]:
+    created: list[FakeChannel] = []
+
+    def insecure_channel(target: str, options: list[tuple[str, Any]]) -> FakeChannel:
+        created.append(FakeChannel(target, options))
+        return created[-1]
+
+    monkeypatch.setattr(grpc.aio, "insecure_channel", insecure_channel)
+    monkeypatch.setattr(products_pb2_grpc, "ProductsServiceStub", FakeStub)
+    return created
+
+
+@pytest.mark.asyncio
+async def test_get_stub_round_robins_over_the_pool(channels: list[FakeChannel]) -> None:
+    client = ProductsGrpcClient("localhost:50051", pool_size=3)
+
+    stubs = [await client._get_stub() for _ in range(4)]
+
+    assert [stub.channel for stub in stubs] == [*channels, channels[0]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("pool_size", "local_pool"), [(1, False), (3, True)])
+async def test_pooled_channels_use_a_local_subchannel_pool(
+    channels: list[FakeChannel], pool_size: int, local_pool: bool
+) -> None:
+    await ProductsGrpcClient("localhost:50051", pool_size=pool_size).connect()
+
+    assert len(channels) == pool_size
+    assert all(
+        ("grpc.use_local_subchannel_pool" in channel.options) == local_pool
+        for channel in channels
+    )
+
+
+@pytest.mark.asyncio
+async def test_connect_and_close_manage_every_channel(channels: list[FakeChannel]) -> None:
+    client = ProductsGrpcClient("localhost:50051", pool_size=2)
+
+    await client.connect()
+    assert all(channel.connect_requested for channel in channels)
+
+    await client.close()
+    assert all(channel.closed for channel in channels)
+    assert client.stats()["channel_states"] == []
+
+
+@pytest.mark.asyncio
+async def test_stats_track_channel_states_and_in_flight_calls(
+    channels: list[FakeChannel],
+) -> None:
+    client = ProductsGrpcClient("localhost:50051", pool_size=2)
+    await client.connect()
+
+    calls = [asyncio.create_task(client.get_product(pid, "req-1")) for pid in ("a", "b")]
+    await asyncio.sleep(0)
+    stats = client.stats()
+
+    assert stats["channel_states"] == ["READY", "READY"]
+    assert stats["in_flight_calls"] == 2
+    assert stats["calls_total"] == 2
+
+    for stub in client._stubs:
+        stub.release.set()
+    assert [product["id"] for product in await asyncio.gather(*calls)] == ["a", "b"]
+    assert client.stats()["in_flight_calls"] == 0
+    assert client.stats()["calls_total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_products_splits_large_lists_into_server_sized_batches(
+    channels: list[FakeChannel],
+) -> None:
+    client = ProductsGrpcClient("localhost:50051", pool_size=2)
+    product_ids = [f"p-{i}" for i in range(SERVER_MAX_BATCH_SIZE * 2 + 1)]
+
+    products = await client.get_products(product_ids, "req-1")
+
+    assert list(products) == product_ids
+    sizes = sorted(len(batch) for stub in client._stubs for batch in stub.batches)
+    assert sizes == [1, SERVER_MAX_BATCH_SIZE, SERVER_MAX_BATCH_SIZE]
+    assert all(stub.batches for stub in client._stubs)
+
+
+@pytest.mark.asyncio
+async def test_get_products_sends_small_lists_in_one_call(channels: list[FakeChannel]) -> None:
+    client = ProductsGrpcClient("localhost:50051")
+
+    products = await client.get_products(["a", "b", "a"], "req-1")
+
+    assert list(products) == ["a", "b"]
+    assert client._stubs[0].batches == [["a", "b"]]
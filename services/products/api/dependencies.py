@@ -1,19 +1,79 @@
 import os
-from collections.abc import AsyncGenerator
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 
 from dotenv import load_dotenv
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from services.products.application.warm_product_cache import (
+    DecayProductAccessRanking,
+    WarmProductCache,
+)
 from services.products.domain.ports import CachePort, ProductRepository
+from services.products.infrastructure.cache_codec import CacheCodec
+from services.products.infrastructure.database.pool import InstrumentedAsyncQueuePool
+from services.products.infrastructure.layered_cache import LayeredCache
 from services.products.infrastructure.redis_cache import RedisCache
-from services.products.infrastructure.supabase_repository import SupabaseProductRepository
+from services.products.infrastructure.supabase_repository import (
+    COUNT_MODES,
+    SupabaseProductRepository,
+)
 
 # Load environment variables from .env file
 env_path = Path(__file__).resolve().parent.parent.parent.parent / ".env"
 load_dotenv(env_path, override=True)
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+# Compresión de valores en Redis: "lz4", "zlib" o "none"
+PRODUCTS_CACHE_COMPRESSION = os.getenv("PRODUCTS_CACHE_COMPRESSION", "lz4")
+PRODUCTS_CACHE_COMPRESS_THRESHOLD = int(os.getenv("PRODUCTS_CACHE_COMPRESS_THRESHOLD", "1024"))
+# Pool de conexiones a Redis
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+
+# Caché L1 en memoria (por worker) delante de Redis; TTL 0 la desactiva
+PRODUCTS_L1_CACHE_SIZE = int(os.getenv("PRODUCTS_L1_CACHE_SIZE", "1000"))
+PRODUCTS_L1_CACHE_TTL = float(os.getenv("PRODUCTS_L1_CACHE_TTL", "5"))
+# Segundos que se recuerda un producto inexistente; 0 desactiva la caché negativa
+PRODUCTS_NEGATIVE_CACHE_TTL = int(os.getenv("PRODUCTS_NEGATIVE_CACHE_TTL", "30"))
+# Fracción de lecturas que alimenta el ranking de productos más consultados
+PRODUCTS_ACCESS_SAMPLE_RATE = float(os.getenv("PRODUCTS_ACCESS_SAMPLE_RATE", "0.01"))
+# Warm-up de la caché al arrancar: top N del ranking más una lista fija de IDs
+PRODUCTS_CACHE_WARMUP_TOP_N = int(os.getenv("PRODUCTS_CACHE_WARMUP_TOP_N", "100"))
+PRODUCTS_CACHE_WARMUP_IDS = [
+    pid.strip() for pid in os.getenv("PRODUCTS_CACHE_WARMUP_IDS", "").split(",") if pid.strip()
+]
+PRODUCTS_CACHE_WARMUP_TIMEOUT = float(os.getenv("PRODUCTS_CACHE_WARMUP_TIMEOUT", "10"))
+# Decaimiento del ranking: cada intervalo los puntos se multiplican por el factor
+# y solo se conservan los N mejores (0 desactiva el decaimiento)
+PRODUCTS_ACCESS_DECAY_INTERVAL = float(os.getenv("PRODUCTS_ACCESS_DECAY_INTERVAL", "3600"))
+PRODUCTS_ACCESS_DECAY_FACTOR = float(os.getenv("PRODUCTS_ACCESS_DECAY_FACTOR", "0.5"))
+PRODUCTS_ACCESS_RANKING_SIZE = max(
+    int(os.getenv("PRODUCTS_ACCESS_RANKING_SIZE", "1000")), PRODUCTS_CACHE_WARMUP_TOP_N
+)
+
+# Pool de conexiones a Postgres
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+# pgbouncer en modo transaction (pooler de Supabase en el puerto 6543): cada
+# transacción puede ir a otro backend, así que no se cachean sentencias preparadas
+DB_PGBOUNCER_MODE = os.getenv("DB_PGBOUNCER_MODE", "false").lower() == "true"
+
+# Listado de productos: "exact" (SELECT count(*)) o "approximate" (pg_class.reltuples)
+PRODUCTS_COUNT_MODE = os.getenv("PRODUCTS_COUNT_MODE", "exact")
+if PRODUCTS_COUNT_MODE not in COUNT_MODES:
+    # Falla al arrancar en lugar de en cada listado
+    raise ValueError(f"Unsupported PRODUCTS_COUNT_MODE: {PRODUCTS_COUNT_MODE}")
+PRODUCTS_TOTAL_CACHE_TTL = float(os.getenv("PRODUCTS_TOTAL_CACHE_TTL", "5"))
 
 
 def get_database_url(async_driver: bool = True) -> str:
@@ -42,12 +102,53 @@ def get_database_url(async_driver: bool = True) -> str:
     return f"postgresql{driver}://postgres:postgres@localhost:54321/products_db"
 
 
-DATABASE_URL = get_database_url()
-
-engine = create_async_engine(DATABASE_URL, echo=False)
+def build_engine_options(pgbouncer_mode: bool = DB_PGBOUNCER_MODE) -> dict[str, Any]:
+    """Opciones de create_async_engine: tamaño del pool y caché de sentencias de asyncpg."""
+    options: dict[str, Any] = {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "connect_args": {"statement_cache_size": DB_STATEMENT_CACHE_SIZE},
+    }
+    if pgbouncer_mode:
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            # Nombres únicos: un backend de pgbouncer puede conservar sentencias
+            # preparadas por otro cliente con el mismo nombre
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    return options
+
+
+def build_database_url(pgbouncer_mode: bool = DB_PGBOUNCER_MODE) -> str:
+    url = make_url(get_database_url())
+    if pgbouncer_mode:
+        # Caché de sentencias preparadas del dialecto asyncpg de SQLAlchemy
+        url = url.update_query_dict({"prepared_statement_cache_size": "0"})
+    return url.render_as_string(hide_password=False)
+
+
+DATABASE_URL = build_database_url()
+
+engine = create_async_engine(DATABASE_URL, echo=False, **build_engine_options())
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-redis_cache = RedisCache(REDIS_URL)
+redis_cache = RedisCache(
+    REDIS_URL,
+    codec=CacheCodec(
+        compression=PRODUCTS_CACHE_COMPRESSION,
+        compress_threshold=PRODUCTS_CACHE_COMPRESS_THRESHOLD,
+    ),
+    max_connections=REDIS_MAX_CONNECTIONS,
+    pool_timeout=REDIS_POOL_TIMEOUT,
+    health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+)
+product_cache = LayeredCache(
+    redis_cache, max_size=PRODUCTS_L1_CACHE_SIZE, l1_ttl=PRODUCTS_L1_CACHE_TTL
+)
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -55,22 +156,51 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def build_product_repository(session: AsyncSession) -> SupabaseProductRepository:
+    return SupabaseProductRepository(
+        session,
+        count_mode=PRODUCTS_COUNT_MODE,
+        total_cache_ttl=PRODUCTS_TOTAL_CACHE_TTL,
+    )
+
+
+@asynccontextmanager
+async def open_product_repository() -> AsyncIterator[ProductRepository]:
+    """Repositorio sobre una sesión propia, para cargas compartidas entre peticiones."""
+    async with async_session_maker() as session:
+        yield build_product_repository(session)
+
+
 async def get_product_repository(
     session: AsyncSession = None,
 ) -> ProductRepository:
     if session is None:
         async with async_session_maker() as session:
-            return SupabaseProductRepository(session)
-    return SupabaseProductRepository(session)
+            return build_product_repository(session)
+    return build_product_repository(session)
 
 
 async def get_cache() -> CachePort:
-    return redis_cache
+    return product_cache
 
 
-async def get_repository_async() -> ProductRepository:
-    """Factory para obtener repositorio asíncrono (para gRPC server)."""
-    # Reusar el async session maker existente
+async def warm_product_cache(
+    top_n: int = PRODUCTS_CACHE_WARMUP_TOP_N,
+    product_ids: list[str] | None = None,
+) -> int:
+    """Precargar en caché los productos más consultados y los de PRODUCTS_CACHE_WARMUP_IDS."""
+    if product_ids is None:
+        product_ids = PRODUCTS_CACHE_WARMUP_IDS
     async with async_session_maker() as session:
-        return SupabaseProductRepository(session)
-
+        use_case = WarmProductCache(build_product_repository(session), product_cache)
+        return await use_case.execute(top_n=top_n, product_ids=product_ids)
+
+
+async def decay_product_access_ranking() -> bool:
+    """Decaer y recortar el ranking de accesos si ningún otro worker lo hizo en este intervalo."""
+    use_case = DecayProductAccessRanking(product_cache)
+    return await use_case.execute(
+        PRODUCTS_ACCESS_DECAY_INTERVAL,
+        factor=PRODUCTS_ACCESS_DECAY_FACTOR,
+        keep=PRODUCTS_ACCESS_RANKING_SIZE,
+    )
@@ -1,13 +1,24 @@
 """API v1 routes for Products service."""
 from typing import Any
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from libs.auth.api_key import verify_api_key
-from services.products.api.dependencies import get_cache, get_db_session, get_product_repository
+from services.products.api.dependencies import (
+    PRODUCTS_ACCESS_SAMPLE_RATE,
+    PRODUCTS_NEGATIVE_CACHE_TTL,
+    get_cache,
+    get_db_session,
+    get_product_repository,
+    open_product_repository,
+)
 from services.products.api.schemas import ProductCreate, ProductUpdate
-from services.products.api.serializers import serialize_product, serialize_products
+from services.products.api.serializers import (
+    serialize_product,
+    serialize_products,
+    serialize_products_cursor_page,
+)
 from services.products.api.versioning import APIVersion
 from services.products.application.create_product import CreateProduct
 from services.products.application.delete_product import DeleteProduct
@@ -37,9 +48,10 @@ router = APIRouter(
 async def create_product(
     product: ProductCreate,
     db: AsyncSession = Depends(get_db_session),
+    cache: CachePort = Depends(get_cache),
 ) -> dict[str, Any]:
     repository = await get_product_repository(db)
-    use_case = CreateProduct(repository)
+    use_case = CreateProduct(repository, cache)
     created = await use_case.execute(product.model_dump())
     return serialize_product(created)
 
@@ -55,7 +67,13 @@ async def get_product(
     cache: CachePort = Depends(get_cache),
 ) -> dict[str, Any]:
     repository = await get_product_repository(db)
-    use_case = GetProduct(repository, cache)
+    use_case = GetProduct(
+        repository,
+        cache,
+        negative_ttl=PRODUCTS_NEGATIVE_CACHE_TTL,
+        access_sample_rate=PRODUCTS_ACCESS_SAMPLE_RATE,
+        open_repository=open_product_repository,
+    )
     product = await use_case.execute(product_id)
     return serialize_product(product)
 
@@ -64,14 +82,35 @@ async def get_product(
     "/",
     dependencies=[Depends(verify_api_key)],
     summary="[v1] List all products",
+    description=(
+        "Offset pagination with `page`/`size`, or keyset pagination with `page[cursor]` "
+        "(send it empty for the first page and follow `links.next`)."
+    ),
 )
 async def list_products(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(
+        None,
+        alias="page[cursor]",
+        description="Opaque cursor from links.next (empty string for the first page)",
+    ),
     db: AsyncSession = Depends(get_db_session),
+    cache: CachePort = Depends(get_cache),
 ) -> dict[str, Any]:
     repository = await get_product_repository(db)
-    use_case = ListProducts(repository)
+    use_case = ListProducts(repository, cache)
+
+    if cursor is not None:
+        products, next_cursor = await use_case.execute_cursor(cursor, size)
+        next_link = (
+            str(request.url.include_query_params(**{"page[cursor]": next_cursor}))
+            if next_cursor
+            else None
+        )
+        return serialize_products_cursor_page(products, size, str(request.url), next_link)
+
     products, total = await use_case.execute(page, size)
     return serialize_products(products, page, size, total)
 
@@ -1,6 +1,10 @@
 from typing import Any
 
-from libs.common.jsonapi import serialize_collection, serialize_resource
+from libs.common.jsonapi import (
+    serialize_collection,
+    serialize_cursor_collection,
+    serialize_resource,
+)
 from services.products.domain.entities import Product
 
 
@@ -16,3 +20,9 @@ def serialize_products(
     items = [product.to_dict() for product in products]
     return serialize_collection("products", items, page, size, total)
 
+
+def serialize_products_cursor_page(
+    products: list[Product], size: int, self_link: str, next_link: str | None
+) -> dict[str, Any]:
+    items = [product.to_dict() for product in products]
+    return serialize_cursor_collection("products", items, size, self_link, next_link)
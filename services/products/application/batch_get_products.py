@@ -0,0 +1,87 @@
+from libs.common.cache_stats import CacheStats
+from libs.common.errors import ValidationError
+from services.products.application.get_product import (
+    PRODUCT_CACHE_TTL,
+    PRODUCT_NEGATIVE_CACHE_TTL,
+    PRODUCT_NOT_FOUND_MARKER,
+    product_cache_key,
+)
+from services.products.domain.entities import Product
+from services.products.domain.ports import CachePort, ProductRepository
+
+MAX_BATCH_SIZE = 500
+
+
+class BatchGetProducts:
+    """Fetch many products at once: one MGET for cached entries, one query for the misses."""
+
+    def __init__(
+        self,
+        repository: ProductRepository,
+        cache: CachePort | None = None,
+        negative_ttl: int = PRODUCT_NEGATIVE_CACHE_TTL,
+        stats: CacheStats | None = None,
+    ) -> None:
+        self.repository = repository
+        self.cache = cache
+        self.negative_ttl = negative_ttl
+        self.stats = stats
+
+    async def execute(self, product_ids: list[str]) -> list[Product]:
+        """
+        Returns the products found, in request order (duplicates collapsed).
+        Missing IDs are omitted; callers compare against the requested IDs.
+        """
+        unique_ids = list(dict.fromkeys(product_ids))
+        if len(unique_ids) > MAX_BATCH_SIZE:
+            raise ValidationError(
+                f"Cannot fetch more than {MAX_BATCH_SIZE} products per batch",
+                source={"parameter": "product_ids"},
+            )
+        if not unique_ids:
+            return []
+
+        found: dict[str, Product] = {}
+        misses = unique_ids
+
+        if self.cache:
+            cached = await self.cache.get_many([product_cache_key(pid) for pid in unique_ids])
+            misses = []
+            for product_id, value in zip(unique_ids, cached):
+                if value == PRODUCT_NOT_FOUND_MARKER:
+                    self._record(hit=True, negative=True)
+                    continue
+                if value:
+                    self._record(hit=True)
+                    found[product_id] = Product.from_dict(value)
+                else:
+                    self._record(hit=False)
+                    misses.append(product_id)
+
+        if misses:
+            loaded = await self.repository.get_many(misses)
+            for product in loaded:
+                found[product.id] = product
+
+            if self.cache and loaded:
+                await self.cache.set_many(
+                    {product_cache_key(p.id): p.to_cache_dict() for p in loaded},
+                    ttl=PRODUCT_CACHE_TTL,
+                )
+            missing = [pid for pid in misses if pid not in found]
+            if self.cache and missing and self.negative_ttl > 0:
+                # Sin pisar productos creados mientras tanto (ver GetProduct)
+                await self.cache.set_many_if_absent(
+                    {product_cache_key(pid): PRODUCT_NOT_FOUND_MARKER for pid in missing},
+                    ttl=self.negative_ttl,
+                )
+
+        return [found[pid] for pid in unique_ids if pid in found]
+
+    def _record(self, hit: bool, negative: bool = False) -> None:
+        if self.stats is None:
+            return
+        if hit:
+            self.stats.record_hit(negative=negative)
+        else:
+            self.stats.record_miss()
@@ -1,13 +1,27 @@
 from typing import Any
 
+from services.products.application.get_product import PRODUCT_CACHE_TTL, product_cache_key
+from services.products.application.list_products import bump_product_list_generation
 from services.products.domain.entities import Product
-from services.products.domain.ports import ProductRepository
+from services.products.domain.ports import CachePort, ProductRepository
 
 
 class CreateProduct:
-    def __init__(self, repository: ProductRepository) -> None:
+    def __init__(self, repository: ProductRepository, cache: CachePort | None = None) -> None:
         self.repository = repository
+        self.cache = cache
 
     async def execute(self, product_data: dict[str, Any]) -> Product:
-        return await self.repository.create(product_data)
+        product = await self.repository.create(product_data)
 
+        if self.cache:
+            cache_key = product_cache_key(product.id)
+            # El borrado quita una posible marca de "no existe" también de la L1
+            # de cada worker; escribir el producto después cierra la carrera con
+            # una lectura que falló antes del create, porque la marca solo se
+            # escribe si la clave no existe
+            await self.cache.delete(cache_key)
+            await self.cache.set(cache_key, product.to_cache_dict(), ttl=PRODUCT_CACHE_TTL)
+            await bump_product_list_generation(self.cache)
+
+        return product
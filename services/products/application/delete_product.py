@@ -1,4 +1,5 @@
 from libs.common.errors import NotFoundError
+from services.products.application.list_products import bump_product_list_generation
 from services.products.domain.ports import CachePort, ProductRepository
 
 
@@ -14,4 +15,5 @@ class DeleteProduct:
 
         cache_key = f"product:{product_id}"
         await self.cache.delete(cache_key)
+        await bump_product_list_generation(self.cache)
 
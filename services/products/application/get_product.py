@@ -1,33 +1,171 @@
-import json
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
 
+from libs.common.cache_stats import CacheStats
 from libs.common.errors import NotFoundError
+from libs.common.stampede import LoadTimeTracker, SingleFlight, should_refresh_early
 from services.products.domain.entities import Product
 from services.products.domain.ports import CachePort, ProductRepository
 
+PRODUCT_CACHE_TTL = 300
+# Marca guardada en product:{id} cuando el producto no existe (caché negativa)
+PRODUCT_NOT_FOUND_MARKER = "__not_found__"
+PRODUCT_NEGATIVE_CACHE_TTL = 30
+
+# Protección contra estampidas al expirar una clave caliente
+LOCK_TTL_MS = 2000
+LOCK_WAIT_TIMEOUT = 1.0
+LOCK_POLL_INTERVAL = 0.05
+XFETCH_BETA = 1.0
+
+# Ranking de productos más consultados (lo usa el warm-up de la caché)
+PRODUCT_ACCESS_RANKING_KEY = "products:access"
+
+# Compartidos por todo el proceso: las cargas concurrentes de un mismo producto
+# se agrupan aunque lleguen por peticiones distintas
+product_loads = SingleFlight()
+product_load_time = LoadTimeTracker()
+product_cache_stats = CacheStats("product")
+
+
+def product_cache_key(product_id: str) -> str:
+    return f"product:{product_id}"
+
+
+def product_lock_key(product_id: str) -> str:
+    return f"lock:product:{product_id}"
+
 
 class GetProduct:
-    def __init__(self, repository: ProductRepository, cache: CachePort | None = None) -> None:
+    def __init__(
+        self,
+        repository: ProductRepository,
+        cache: CachePort | None = None,
+        negative_ttl: int = PRODUCT_NEGATIVE_CACHE_TTL,
+        stats: CacheStats = product_cache_stats,
+        access_sample_rate: float = 0.0,
+        open_repository: Callable[[], AbstractAsyncContextManager[ProductRepository]]
+        | None = None,
+    ) -> None:
+        """
+        Args:
+            access_sample_rate: Fracción de lecturas que se anotan en el ranking
+                de accesos (0 = no se anota). Se muestrea para no añadir una
+                escritura a Redis en cada petición
+            open_repository: Abre un repositorio con sesión propia para las
+                cargas compartidas entre peticiones (product_loads). Esas cargas
+                pueden seguir en curso cuando la petición que las inició ya
+                terminó o fue cancelada y cerró su sesión. Sin él se usa
+                `repository`
+        """
         self.repository = repository
         self.cache = cache
+        self.negative_ttl = negative_ttl
+        self.stats = stats
+        self.access_sample_rate = access_sample_rate
+        self.open_repository = open_repository
 
     async def execute(self, product_id: str) -> Product:
-        # Try cache if available
-        if self.cache:
-            cache_key = f"product:{product_id}"
-            cached = await self.cache.get(cache_key)
+        if not self.cache:
+            return await self._load(product_id, self.repository)
+
+        if self.access_sample_rate > 0 and random.random() < self.access_sample_rate:
+            # Cada muestra cuenta por 1/rate accesos para estimar el total
+            await self.cache.increment_score(
+                PRODUCT_ACCESS_RANKING_KEY, product_id, 1 / self.access_sample_rate
+            )
+
+        cache_key = product_cache_key(product_id)
+        cached, ttl_remaining = await self.cache.get_with_ttl(cache_key)
+        if cached == PRODUCT_NOT_FOUND_MARKER:
+            self.stats.record_hit(negative=True)
+            raise _not_found(product_id)
+        if cached:
+            self.stats.record_hit()
+            # XFetch: de vez en cuando una petición refresca la clave antes de que
+            # expire, así no fallan todas a la vez cuando vence el TTL
+            if ttl_remaining is None or not should_refresh_early(
+                ttl_remaining, product_load_time.value, XFETCH_BETA
+            ):
+                return Product.from_dict(cached)
+            return await product_loads.do(
+                cache_key, lambda: self._shared_load(self._load_and_cache, product_id)
+            )
 
+        self.stats.record_miss()
+        return await product_loads.do(
+            cache_key, lambda: self._shared_load(self._load_with_lock, product_id)
+        )
+
+    async def _shared_load(
+        self,
+        load: Callable[[str, ProductRepository], Awaitable[Product]],
+        product_id: str,
+    ) -> Product:
+        """Ejecuta una carga de product_loads sobre su propio repositorio."""
+        repository_context = (
+            self.open_repository() if self.open_repository else nullcontext(self.repository)
+        )
+        async with repository_context as repository:
+            return await load(product_id, repository)
+
+    async def _load_with_lock(self, product_id: str, repository: ProductRepository) -> Product:
+        """
+        Carga tras un fallo de caché coordinada entre procesos.
+
+        Solo quien obtiene el lock en Redis consulta la base de datos; el resto
+        espera a que la clave aparezca en caché y, si tarda demasiado, carga
+        por su cuenta.
+        """
+        lock_key = product_lock_key(product_id)
+        token = await self.cache.acquire_lock(lock_key, LOCK_TTL_MS)
+        if token:
+            try:
+                return await self._load_and_cache(product_id, repository)
+            finally:
+                await self.cache.release_lock(lock_key, token)
+
+        cache_key = product_cache_key(product_id)
+        deadline = time.monotonic() + LOCK_WAIT_TIMEOUT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            cached = await self.cache.get(cache_key)
+            if cached == PRODUCT_NOT_FOUND_MARKER:
+                raise _not_found(product_id)
             if cached:
-                product_dict = json.loads(cached)
-                return Product(**product_dict)
+                return Product.from_dict(cached)
 
-        product = await self.repository.get_by_id(product_id)
-        if not product:
-            raise NotFoundError(f"Product with id {product_id} not found")
+        return await self._load_and_cache(product_id, repository)
 
-        # Set cache if available
-        if self.cache:
-            cache_key = f"product:{product_id}"
-            await self.cache.set(cache_key, json.dumps(product.to_dict()), ttl=300)
+    async def _load_and_cache(self, product_id: str, repository: ProductRepository) -> Product:
+        try:
+            product = await self._load(product_id, repository)
+        except NotFoundError:
+            if self.negative_ttl > 0:
+                # Solo si la clave no existe: un create que llegó después de la
+                # consulta ya escribió el producto y la marca no debe pisarlo
+                await self.cache.set_many_if_absent(
+                    {product_cache_key(product_id): PRODUCT_NOT_FOUND_MARKER},
+                    ttl=self.negative_ttl,
+                )
+            raise
 
+        await self.cache.set(
+            product_cache_key(product_id), product.to_cache_dict(), ttl=PRODUCT_CACHE_TTL
+        )
         return product
 
+    async def _load(self, product_id: str, repository: ProductRepository) -> Product:
+        started = time.perf_counter()
+        product = await repository.get_by_id(product_id)
+        product_load_time.observe(time.perf_counter() - started)
+        if not product:
+            raise _not_found(product_id)
+        return product
+
+
+def _not_found(product_id: str) -> NotFoundError:
+    return NotFoundError(f"Product with id {product_id} not found")
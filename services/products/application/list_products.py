@@ -1,11 +1,84 @@
+from libs.common.errors import ValidationError
 from services.products.domain.entities import Product
-from services.products.domain.ports import ProductRepository
+from services.products.domain.pagination import decode_cursor, encode_cursor
+from services.products.domain.ports import CachePort, ProductRepository
+
+PRODUCT_LIST_CACHE_TTL = 60
+# Contador que forma parte de la clave de cada página cacheada: al incrementarlo
+# todas las páginas anteriores quedan huérfanas y expiran solas por TTL
+PRODUCT_LIST_GENERATION_KEY = "products:list:generation"
+
+
+def product_list_cache_key(generation: int, kind: str, *params: object) -> str:
+    return ":".join(["products:list", f"v{generation}", kind, *(str(p) for p in params)])
+
+
+async def bump_product_list_generation(cache: CachePort) -> None:
+    """Invalidar de golpe todas las páginas del listado cacheadas."""
+    await cache.incr(PRODUCT_LIST_GENERATION_KEY)
 
 
 class ListProducts:
-    def __init__(self, repository: ProductRepository) -> None:
+    def __init__(self, repository: ProductRepository, cache: CachePort | None = None) -> None:
         self.repository = repository
+        self.cache = cache
 
     async def execute(self, page: int, size: int) -> tuple[list[Product], int]:
-        return await self.repository.list_products(page, size)
+        if not self.cache:
+            return await self.repository.list_products(page, size)
+
+        cache_key = product_list_cache_key(await self._generation(), "offset", page, size)
+        cached = await self.cache.get(cache_key)
+        if cached:
+            return [Product.from_dict(p) for p in cached["products"]], cached["total"]
+
+        products, total = await self.repository.list_products(page, size)
+        await self.cache.set(
+            cache_key,
+            {"products": [p.to_cache_dict() for p in products], "total": total},
+            ttl=PRODUCT_LIST_CACHE_TTL,
+        )
+        return products, total
+
+    async def execute_cursor(
+        self, cursor: str | None, size: int
+    ) -> tuple[list[Product], str | None]:
+        """
+        Keyset pagination: returns the page after `cursor` (first page if None)
+        and the cursor for the next page, or None when the catalog is exhausted.
+        """
+        after = None
+        if cursor:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError as e:
+                raise ValidationError(
+                    "Invalid pagination cursor", source={"parameter": "page[cursor]"}
+                ) from e
+
+        cache_key = None
+        if self.cache:
+            cache_key = product_list_cache_key(
+                await self._generation(), "cursor", cursor or "", size
+            )
+            cached = await self.cache.get(cache_key)
+            if cached:
+                return [Product.from_dict(p) for p in cached["products"]], cached["next_cursor"]
+
+        products, has_more = await self.repository.list_products_after(after, size)
+
+        next_cursor = None
+        if has_more and products:
+            last = products[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        if cache_key:
+            await self.cache.set(
+                cache_key,
+                {"products": [p.to_cache_dict() for p in products], "next_cursor": next_cursor},
+                ttl=PRODUCT_LIST_CACHE_TTL,
+            )
+        return products, next_cursor
 
+    async def _generation(self) -> int:
+        return await self.cache.get(PRODUCT_LIST_GENERATION_KEY) or 0
@@ -0,0 +1,45 @@
+from collections.abc import AsyncIterator
+
+from libs.common.errors import ValidationError
+from services.products.domain.entities import Product
+from services.products.domain.pagination import decode_cursor, encode_cursor
+from services.products.domain.ports import ProductRepository
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_CHUNK_SIZE = 1000
+
+
+class StreamProducts:
+    def __init__(self, repository: ProductRepository) -> None:
+        self.repository = repository
+
+    async def execute(
+        self, chunk_size: int | None = None, cursor: str | None = None
+    ) -> AsyncIterator[tuple[list[Product], str]]:
+        """
+        Recorre el catálogo completo en bloques ordenados por (created_at, id).
+
+        Cada bloque va acompañado del cursor de su último producto, de modo que
+        un consumidor interrumpido puede reanudar desde ese punto.
+        """
+        chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        if not 1 <= chunk_size <= MAX_CHUNK_SIZE:
+            raise ValidationError(
+                f"chunk_size must be between 1 and {MAX_CHUNK_SIZE}",
+                source={"parameter": "chunk_size"},
+            )
+
+        after = None
+        if cursor:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError as e:
+                raise ValidationError(
+                    "Invalid pagination cursor", source={"parameter": "cursor"}
+                ) from e
+
+        async for products in self.repository.stream_products(chunk_size, after):
+            if not products:
+                continue
+            last = products[-1]
+            yield products, encode_cursor(last.created_at, last.id)
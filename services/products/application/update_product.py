@@ -1,6 +1,7 @@
 from typing import Any
 
 from libs.common.errors import NotFoundError
+from services.products.application.list_products import bump_product_list_generation
 from services.products.domain.entities import Product
 from services.products.domain.ports import CachePort, ProductRepository
 
@@ -17,6 +18,7 @@ class UpdateProduct:
 
         cache_key = f"product:{product_id}"
         await self.cache.delete(cache_key)
+        await bump_product_list_generation(self.cache)
 
         return product
 
@@ -0,0 +1,81 @@
+import logging
+
+from services.products.application.batch_get_products import MAX_BATCH_SIZE
+from services.products.application.get_product import (
+    PRODUCT_ACCESS_RANKING_KEY,
+    PRODUCT_CACHE_TTL,
+    product_cache_key,
+)
+from services.products.domain.ports import CachePort, ProductRepository
+
+logger = logging.getLogger(__name__)
+
+# Marca (con TTL = intervalo) que impide que otro worker vuelva a decaer el ranking
+PRODUCT_ACCESS_DECAY_LOCK_KEY = "lock:products:access:decay"
+
+
+class WarmProductCache:
+    """Precarga en Redis los productos más consultados (arranque, tras un deploy o flush)."""
+
+    def __init__(self, repository: ProductRepository, cache: CachePort) -> None:
+        self.repository = repository
+        self.cache = cache
+
+    async def execute(self, top_n: int = 0, product_ids: list[str] | None = None) -> int:
+        """
+        Args:
+            top_n: Cuántos productos tomar del ranking de accesos de GetProduct
+            product_ids: Lista fija de productos; se cargan antes que el ranking
+
+        Returns:
+            Número de productos escritos en caché
+        """
+        ids = list(product_ids or [])
+        if top_n > 0:
+            ids += await self.cache.top_scored(PRODUCT_ACCESS_RANKING_KEY, top_n)
+        ids = list(dict.fromkeys(ids))
+
+        warmed = 0
+        for start in range(0, len(ids), MAX_BATCH_SIZE):
+            products = await self.repository.get_many(ids[start:start + MAX_BATCH_SIZE])
+            if products:
+                # Un solo pipeline por lote en lugar de un SET por producto
+                await self.cache.set_many(
+                    {product_cache_key(p.id): p.to_cache_dict() for p in products},
+                    ttl=PRODUCT_CACHE_TTL,
+                )
+                warmed += len(products)
+
+        logger.info(f"Product cache warm-up: {warmed} of {len(ids)} product(s) cached")
+        return warmed
+
+
+class DecayProductAccessRanking:
+    """
+    Envejece el ranking de accesos que usa el warm-up.
+
+    GetProduct solo suma puntos, así que sin esto el ranking mide popularidad
+    histórica y crece con cada producto leído alguna vez. Cada intervalo los
+    puntos se multiplican por `factor` y se descarta todo salvo los `keep` mejores.
+    """
+
+    def __init__(self, cache: CachePort) -> None:
+        self.cache = cache
+
+    async def execute(self, interval: float, factor: float = 0.5, keep: int = 1000) -> bool:
+        """
+        Args:
+            interval: Segundos entre decaimientos; solo un worker lo aplica por intervalo
+            factor: Multiplicador de los puntos (0.5 = vida media de un intervalo)
+            keep: Productos que se conservan en el ranking
+
+        Returns:
+            True si este worker aplicó el decaimiento
+        """
+        # El lock no se libera: caduca solo y hace de marca "ya hecho en este intervalo"
+        if not await self.cache.acquire_lock(PRODUCT_ACCESS_DECAY_LOCK_KEY, int(interval * 1000)):
+            return False
+
+        await self.cache.decay_scores(PRODUCT_ACCESS_RANKING_KEY, factor, keep)
+        logger.info(f"Product access ranking decayed by {factor}, kept top {keep}")
+        return True
@@ -43,6 +43,18 @@ class Product:
             "updated_at": self.updated_at.isoformat(),
         }
 
+    def to_cache_dict(self) -> dict:
+        """Like to_dict, but keeps Decimal and datetime values for the binary cache codec."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "price": self.price,
+            "images": self.images,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
     @classmethod
     def from_dict(cls, data: dict) -> "Product":
         """Create a Product from a dictionary (useful for cache deserialization)."""
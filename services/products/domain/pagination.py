@@ -0,0 +1,27 @@
+"""Opaque cursors for keyset pagination over (created_at, id)."""
+import base64
+import binascii
+from datetime import datetime
+
+CURSOR_SEPARATOR = "|"
+
+
+def encode_cursor(created_at: datetime, product_id: str) -> str:
+    """Encode the sort key of the last returned product as an opaque, URL-safe token."""
+    raw = f"{created_at.isoformat()}{CURSOR_SEPARATOR}{product_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_at, product_id = raw.split(CURSOR_SEPARATOR, 1)
+        return datetime.fromisoformat(created_at), product_id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
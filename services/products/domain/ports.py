@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
 
 from services.products.domain.entities import Product
@@ -13,6 +15,11 @@ class ProductRepository(ABC):
     async def get_by_id(self, product_id: str) -> Product | None:
         pass
 
+    @abstractmethod
+    async def get_many(self, product_ids: list[str]) -> list[Product]:
+        """Fetch several products in one query; missing IDs are simply absent."""
+        pass
+
     @abstractmethod
     async def update(self, product_id: str, product_data: dict[str, Any]) -> Product | None:
         pass
@@ -27,17 +34,90 @@ class ProductRepository(ABC):
     ) -> tuple[list[Product], int]:
         pass
 
+    @abstractmethod
+    async def list_products_after(
+        self, after: tuple[datetime, str] | None, size: int
+    ) -> tuple[list[Product], bool]:
+        """Keyset page ordered by (created_at, id); returns the page and whether more follow."""
+        pass
+
+    @abstractmethod
+    def stream_products(
+        self, chunk_size: int, after: tuple[datetime, str] | None = None
+    ) -> AsyncIterator[list[Product]]:
+        """Yield the whole catalog in (created_at, id) order, `chunk_size` products at a time."""
+        pass
+
 
 class CachePort(ABC):
+    """
+    Key/value cache. Values are plain data (dicts, lists, strings, numbers);
+    how they are serialized is up to the implementation.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        pass
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        """Values in the same order as `keys`, None for misses."""
+        pass
+
+    @abstractmethod
+    async def set_many(self, items: dict[str, Any], ttl: int) -> None:
+        pass
+
     @abstractmethod
-    async def get(self, key: str) -> str | None:
+    async def set_many_if_absent(self, items: dict[str, Any], ttl: int) -> list[str]:
+        """Like set_many, but skip keys that already exist; returns the keys written."""
         pass
 
     @abstractmethod
-    async def set(self, key: str, value: str, ttl: int) -> None:
+    async def get_with_ttl(self, key: str) -> tuple[Any | None, float | None]:
+        """Value and remaining TTL in seconds (None when missing or without expiry)."""
         pass
 
     @abstractmethod
     async def delete(self, key: str) -> None:
         pass
 
+    @abstractmethod
+    async def delete_many(self, keys: list[str]) -> None:
+        """Delete several keys in a single round trip."""
+        pass
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        """Atomically increment an integer counter, creating it at 0; returns the new value."""
+        pass
+
+    @abstractmethod
+    async def increment_score(self, key: str, member: str, amount: float = 1.0) -> None:
+        """Add `amount` to `member`'s score in the ranking stored at `key`."""
+        pass
+
+    @abstractmethod
+    async def top_scored(self, key: str, limit: int) -> list[str]:
+        """Members of the ranking at `key` with the highest scores, best first."""
+        pass
+
+    @abstractmethod
+    async def decay_scores(self, key: str, factor: float, keep: int) -> None:
+        """Multiply every score at `key` by `factor` and keep only the `keep` best members."""
+        pass
+
+    @abstractmethod
+    async def acquire_lock(self, key: str, ttl_ms: int) -> str | None:
+        """Take a short-lived lock shared by all processes; returns its token or None if held."""
+        pass
+
+    @abstractmethod
+    async def release_lock(self, key: str, token: str) -> None:
+        """Release the lock only if it is still held with `token`."""
+        pass
+
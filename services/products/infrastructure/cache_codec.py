@@ -0,0 +1,105 @@
+"""
+Codificación binaria de los valores guardados en Redis.
+
+Formato: un byte de versión seguido del payload. Así el formato puede
+evolucionar sin invalidar la caché: cada versión sabe leerse a sí misma y las
+entradas antiguas en JSON (texto) se siguen entendiendo.
+
+    0x01  msgpack
+    0x02  msgpack comprimido con zlib
+    0x03  msgpack comprimido con lz4 (frame)
+    0x04  msgpack con tipos (Decimal y datetime como extensiones)
+    0x05  0x04 comprimido con zlib
+    0x06  0x04 comprimido con lz4 (frame)
+
+Se escriben solo las versiones con tipos; 0x01-0x03 se siguen leyendo.
+"""
+import json
+import zlib
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+import lz4.frame
+import msgpack
+
+FORMAT_MSGPACK = 0x01
+FORMAT_MSGPACK_ZLIB = 0x02
+FORMAT_MSGPACK_LZ4 = 0x03
+FORMAT_TYPED = 0x04
+FORMAT_TYPED_ZLIB = 0x05
+FORMAT_TYPED_LZ4 = 0x06
+
+# Extensiones msgpack: el payload es la forma canónica en texto, que
+# Decimal() y datetime.fromisoformat() leen directamente en C
+EXT_DECIMAL = 1
+EXT_DATETIME = 2
+
+COMPRESSIONS = {
+    "zlib": (FORMAT_TYPED_ZLIB, zlib.compress),
+    "lz4": (FORMAT_TYPED_LZ4, lz4.frame.compress),
+}
+DECOMPRESSORS = {
+    FORMAT_MSGPACK: lambda payload: payload,
+    FORMAT_MSGPACK_ZLIB: zlib.decompress,
+    FORMAT_MSGPACK_LZ4: lz4.frame.decompress,
+    FORMAT_TYPED: lambda payload: payload,
+    FORMAT_TYPED_ZLIB: zlib.decompress,
+    FORMAT_TYPED_LZ4: lz4.frame.decompress,
+}
+EXT_DECODERS = {
+    EXT_DECIMAL: lambda data: Decimal(data.decode()),
+    EXT_DATETIME: lambda data: datetime.fromisoformat(data.decode()),
+}
+
+
+class CacheCodec:
+    def __init__(self, compression: str = "lz4", compress_threshold: int = 1024) -> None:
+        """
+        Args:
+            compression: "lz4", "zlib" o "none". lz4 descomprime casi gratis;
+                zlib ahorra más memoria pero cuesta más CPU en cada lectura
+            compress_threshold: Tamaño en bytes a partir del cual se comprime;
+                los valores pequeños no compensan el coste de comprimir
+        """
+        if compression != "none" and compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported cache compression: {compression}")
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+
+    def encode(self, value: Any) -> bytes:
+        payload = msgpack.packb(value, default=_encode_ext, use_bin_type=True)
+        if self.compression != "none" and len(payload) >= self.compress_threshold:
+            fmt, compress = COMPRESSIONS[self.compression]
+            compressed = compress(payload)
+            if len(compressed) < len(payload):
+                return bytes([fmt]) + compressed
+        return bytes([FORMAT_TYPED]) + payload
+
+    def decode(self, data: bytes) -> Any:
+        decompress = DECOMPRESSORS.get(data[0]) if data else None
+        if decompress is None:
+            return _decode_legacy(data)
+        return msgpack.unpackb(decompress(data[1:]), ext_hook=_decode_ext, raw=False)
+
+
+def _encode_ext(value: Any) -> msgpack.ExtType:
+    if isinstance(value, Decimal):
+        return msgpack.ExtType(EXT_DECIMAL, str(value).encode())
+    if isinstance(value, datetime):
+        return msgpack.ExtType(EXT_DATETIME, value.isoformat().encode())
+    raise TypeError(f"Cannot encode {type(value).__name__} for the cache")
+
+
+def _decode_ext(code: int, data: bytes) -> Any:
+    decoder = EXT_DECODERS.get(code)
+    return decoder(data) if decoder else msgpack.ExtType(code, data)
+
+
+def _decode_legacy(data: bytes) -> Any:
+    """Entradas escritas antes del codec: JSON o texto plano."""
+    text = data.decode()
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
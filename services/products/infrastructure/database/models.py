@@ -2,7 +2,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import List
 
-from sqlalchemy import DECIMAL, DateTime, String
+from sqlalchemy import DECIMAL, DateTime, Index, String
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -13,6 +13,10 @@ class Base(DeclarativeBase):
 
 class ProductModel(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at, id / WHERE (created_at, id) > (...)
+        Index("ix_products_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
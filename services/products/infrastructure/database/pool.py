@@ -0,0 +1,64 @@
+"""
+Pool de conexiones instrumentado.
+
+Mide cuánto espera cada checkout (incluida la apertura de conexiones nuevas) y
+cuántos agotan pool_timeout, para saber si pool_size/max_overflow se quedan cortos.
+"""
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from libs.common.metrics import (
+    db_pool_capacity,
+    db_pool_checked_out,
+    db_pool_checkout_timeouts,
+    db_pool_checkout_wait,
+)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        db_pool_capacity.set(self.size() + max(self._max_overflow, 0))
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            db_pool_checkout_timeouts.inc()
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+            db_pool_checkout_wait.observe(waited)
+            db_pool_checked_out.set(self.checkedout())
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        super()._do_return_conn(record)
+        db_pool_checked_out.set(self.checkedout())
+
+    def stats(self) -> dict[str, Any]:
+        capacity = self.size() + max(self._max_overflow, 0)
+        checked_out = self.checkedout()
+        return {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": checked_out,
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "utilization": round(checked_out / capacity, 4) if capacity else 0.0,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 3),
+        }
@@ -5,13 +5,21 @@ Este adaptador expone la funcionalidad del dominio vía gRPC
 para comunicación inter-service.
 """
 import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 
 import grpc
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from libs.common.errors import NotFoundError
-from services.products.application.get_product import GetProduct
+from libs.common.cache_stats import CacheStats
+from libs.common.errors import NotFoundError, ValidationError
+from services.products.application.batch_get_products import BatchGetProducts
+from services.products.application.get_product import PRODUCT_NEGATIVE_CACHE_TTL, GetProduct
 from services.products.application.list_products import ListProducts
-from services.products.domain.ports import ProductRepository
+from services.products.application.stream_products import StreamProducts
+from services.products.domain.entities import Product
+from services.products.domain.ports import CachePort, ProductRepository
+from services.products.infrastructure.grpc.interceptors import MetricsServerInterceptor
 from services.products.infrastructure.grpc.products import (
     products_pb2,
     products_pb2_grpc,
@@ -19,6 +27,23 @@ from services.products.infrastructure.grpc.products import (
 
 logger = logging.getLogger(__name__)
 
+# Aciertos de caché por RPC, separados de los de la API HTTP
+grpc_cache_stats = {
+    rpc: CacheStats(f"grpc_{rpc}") for rpc in ("GetProduct", "ProductExists", "BatchGetProducts")
+}
+
+
+def _to_proto_product(product: Product) -> products_pb2.Product:
+    return products_pb2.Product(
+        id=product.id,
+        name=product.name,
+        description=product.description or "",
+        price=str(product.price),
+        images=product.images if product.images else [],
+        created_at=product.created_at.isoformat(),
+        updated_at=product.updated_at.isoformat(),
+    )
+
 
 class ProductsServicer(products_pb2_grpc.ProductsServiceServicer):
     """
@@ -30,10 +55,44 @@ class ProductsServicer(products_pb2_grpc.ProductsServiceServicer):
     - No contiene lógica de negocio
     """
 
-    def __init__(self, repository: ProductRepository) -> None:
-        self.repository = repository
-        self.get_product_use_case = GetProduct(repository)
-        self.list_products_use_case = ListProducts(repository)
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        build_repository: Callable[[AsyncSession], ProductRepository],
+        cache: CachePort | None = None,
+        negative_ttl: int = PRODUCT_NEGATIVE_CACHE_TTL,
+        access_sample_rate: float = 0.0,
+    ) -> None:
+        """
+        Args:
+            session_factory: Fábrica de sesiones; cada RPC abre la suya porque
+                AsyncSession no admite uso concurrente
+            build_repository: Construye el repositorio sobre una sesión
+            cache: La misma caché que usan las rutas HTTP
+            negative_ttl: Segundos que se recuerda un producto inexistente
+            access_sample_rate: Fracción de lecturas anotadas en el ranking de accesos
+        """
+        self.session_factory = session_factory
+        self.build_repository = build_repository
+        self.cache = cache
+        self.negative_ttl = negative_ttl
+        self.access_sample_rate = access_sample_rate
+
+    def _get_product(self, repository: ProductRepository, rpc: str) -> GetProduct:
+        return GetProduct(
+            repository,
+            self.cache,
+            negative_ttl=self.negative_ttl,
+            stats=grpc_cache_stats[rpc],
+            access_sample_rate=self.access_sample_rate,
+            open_repository=self._repository,
+        )
+
+    @asynccontextmanager
+    async def _repository(self) -> AsyncIterator[ProductRepository]:
+        """Repositorio sobre una sesión de vida corta, igual que get_db_session en HTTP."""
+        async with self.session_factory() as session:
+            yield self.build_repository(session)
 
     async def GetProduct(
         self,
@@ -44,21 +103,14 @@ class ProductsServicer(products_pb2_grpc.ProductsServiceServicer):
         Obtener un producto por ID.
         """
         try:
-            product = await self.get_product_use_case.execute(request.product_id)
+            async with self._repository() as repository:
+                product = await self._get_product(repository, "GetProduct").execute(
+                    request.product_id
+                )
 
             logger.info(f"GetProduct called from Inventory for product_id={request.product_id}")
 
-            return products_pb2.GetProductResponse(
-                product=products_pb2.Product(
-                    id=product.id,
-                    name=product.name,
-                    description=product.description or "",
-                    price=str(product.price),
-                    images=product.images if product.images else [],
-                    created_at=product.created_at.isoformat(),
-                    updated_at=product.updated_at.isoformat(),
-                )
-            )
+            return products_pb2.GetProductResponse(product=_to_proto_product(product))
         except NotFoundError as e:
             await context.abort(grpc.StatusCode.NOT_FOUND, str(e))
         except Exception as e:
@@ -67,6 +119,38 @@ class ProductsServicer(products_pb2_grpc.ProductsServiceServicer):
                 grpc.StatusCode.INTERNAL, "Internal server error"
             )
 
+    async def BatchGetProducts(
+        self,
+        request: products_pb2.BatchGetProductsRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> products_pb2.BatchGetProductsResponse:
+        """
+        Obtener varios productos por ID en una sola llamada.
+        """
+        try:
+            async with self._repository() as repository:
+                products = await BatchGetProducts(
+                    repository,
+                    self.cache,
+                    negative_ttl=self.negative_ttl,
+                    stats=grpc_cache_stats["BatchGetProducts"],
+                ).execute(list(request.product_ids))
+            found_ids = {p.id for p in products}
+
+            return products_pb2.BatchGetProductsResponse(
+                products=[_to_proto_product(p) for p in products],
+                missing_ids=[
+                    pid for pid in dict.fromkeys(request.product_ids) if pid not in found_ids
+                ],
+            )
+        except ValidationError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, e.detail)
+        except Exception as e:
+            logger.error(f"Error in BatchGetProducts: {e}")
+            await context.abort(
+                grpc.StatusCode.INTERNAL, "Internal server error"
+            )
+
     async def ProductExists(
         self,
         request: products_pb2.ProductExistsRequest,
@@ -76,23 +160,17 @@ class ProductsServicer(products_pb2_grpc.ProductsServiceServicer):
         Verificar si un producto existe.
         """
         try:
-            product = await self.repository.get_by_id(request.product_id)
-
-            if product:
-                return products_pb2.ProductExistsResponse(
-                    exists=True,
-                    product=products_pb2.Product(
-                        id=product.id,
-                        name=product.name,
-                        description=product.description or "",
-                        price=str(product.price),
-                        images=product.images if product.images else [],
-                        created_at=product.created_at.isoformat(),
-                        updated_at=product.updated_at.isoformat(),
-                    ),
+            # Mismo camino que GetProduct, así también aprovecha la caché negativa
+            async with self._repository() as repository:
+                product = await self._get_product(repository, "ProductExists").execute(
+                    request.product_id
                 )
-            return products_pb2.ProductExistsResponse(exists=False)
 
+            return products_pb2.ProductExistsResponse(
+                exists=True, product=_to_proto_product(product)
+            )
+        except NotFoundError:
+            return products_pb2.ProductExistsResponse(exists=False)
         except Exception as e:
             logger.error(f"Error in ProductExists: {e}")
             await context.abort(
@@ -105,49 +183,101 @@ class ProductsServicer(products_pb2_grpc.ProductsServiceServicer):
         context: grpc.aio.ServicerContext,
     ) -> products_pb2.ListProductsResponse:
         """
-        Listar productos con paginación.
+        Listar productos con paginación por offset (page/size) o por cursor.
         """
         try:
-            products, total = await self.list_products_use_case.execute(
-                page=request.page or 1, size=request.size or 10
-            )
+            size = request.size or 10
 
-            return products_pb2.ListProductsResponse(
-                products=[
-                    products_pb2.Product(
-                        id=p.id,
-                        name=p.name,
-                        description=p.description or "",
-                        price=str(p.price),
-                        images=p.images if p.images else [],
-                        created_at=p.created_at.isoformat(),
-                        updated_at=p.updated_at.isoformat(),
+            if request.HasField("cursor"):
+                async with self._repository() as repository:
+                    products, next_cursor = await ListProducts(repository, self.cache).execute_cursor(
+                        request.cursor or None, size
                     )
-                    for p in products
-                ],
+                return products_pb2.ListProductsResponse(
+                    products=[_to_proto_product(p) for p in products],
+                    size=size,
+                    next_cursor=next_cursor or "",
+                )
+
+            async with self._repository() as repository:
+                products, total = await ListProducts(repository, self.cache).execute(
+                    page=request.page or 1, size=size
+                )
+
+            return products_pb2.ListProductsResponse(
+                products=[_to_proto_product(p) for p in products],
                 total=total,
                 page=request.page or 1,
-                size=request.size or 10,
+                size=size,
             )
 
+        except ValidationError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, e.detail)
         except Exception as e:
             logger.error(f"Error in ListProducts: {e}")
             await context.abort(
                 grpc.StatusCode.INTERNAL, "Internal server error"
             )
 
+    async def StreamProducts(
+        self,
+        request: products_pb2.StreamProductsRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[products_pb2.StreamProductsResponse]:
+        """
+        Transmitir el catálogo completo en bloques (server streaming).
+
+        Cada `yield` espera a que el cliente consuma el mensaje (control de flujo
+        HTTP/2), así que la memoria se mantiene plana en ambos extremos.
+        """
+        try:
+            # La sesión vive mientras dure el stream (cursor de servidor)
+            async with self._repository() as repository:
+                async for products, cursor in StreamProducts(repository).execute(
+                    chunk_size=request.chunk_size, cursor=request.cursor or None
+                ):
+                    yield products_pb2.StreamProductsResponse(
+                        products=[_to_proto_product(p) for p in products],
+                        cursor=cursor,
+                    )
+        except ValidationError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, e.detail)
+        except Exception as e:
+            logger.error(f"Error in StreamProducts: {e}")
+            await context.abort(
+                grpc.StatusCode.INTERNAL, "Internal server error"
+            )
+
 
-async def serve_grpc(repository: ProductRepository, port: int = 50051) -> None:
+async def serve_grpc(
+    session_factory: async_sessionmaker[AsyncSession],
+    build_repository: Callable[[AsyncSession], ProductRepository],
+    port: int = 50051,
+    cache: CachePort | None = None,
+    negative_ttl: int = PRODUCT_NEGATIVE_CACHE_TTL,
+    access_sample_rate: float = 0.0,
+) -> None:
     """
     Iniciar el servidor gRPC.
     
     Args:
-        repository: Repositorio de productos
+        session_factory: Fábrica de sesiones de base de datos (una por RPC)
+        build_repository: Construye el repositorio de productos sobre una sesión
         port: Puerto donde escuchará el servidor gRPC
+        cache: Caché de productos compartida con la API HTTP
+        negative_ttl: Segundos que se recuerda un producto inexistente
+        access_sample_rate: Fracción de lecturas anotadas en el ranking de accesos
     """
-    server = grpc.aio.server()
+    server = grpc.aio.server(interceptors=[MetricsServerInterceptor()])
     products_pb2_grpc.add_ProductsServiceServicer_to_server(
-        ProductsServicer(repository), server
+        ProductsServicer(
+            session_factory,
+            build_repository,
+            cache=cache,
+            negative_ttl=negative_ttl,
+            access_sample_rate=access_sample_rate,
+        ),
+        server,
     )
     server.add_insecure_port(f"[::]:{port}")
 
@@ -0,0 +1,84 @@
+"""Interceptores del servidor gRPC."""
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import grpc
+
+from libs.common.metrics import grpc_server_call_duration
+
+
+def _status(context: grpc.aio.ServicerContext, outcome: str) -> str:
+    """Código fijado con abort()/set_code() o, si no hay, el desenlace observado."""
+    code = context.code()
+    if isinstance(code, grpc.StatusCode):
+        return code.name
+    return outcome
+
+
+class MetricsServerInterceptor(grpc.aio.ServerInterceptor):
+    """Latencia de cada RPC por método y código de estado (grpc_server_call_duration_seconds)."""
+
+    async def intercept_service(
+        self,
+        continuation: Callable[[grpc.HandlerCallDetails], Awaitable[grpc.RpcMethodHandler]],
+        handler_call_details: grpc.HandlerCallDetails,
+    ) -> grpc.RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return handler
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+
+        if handler.unary_unary:
+            inner = handler.unary_unary
+
+            async def unary_unary(request: Any, context: grpc.aio.ServicerContext) -> Any:
+                started = time.perf_counter()
+                outcome = "UNKNOWN"
+                try:
+                    response = await inner(request, context)
+                    outcome = "OK"
+                    return response
+                except asyncio.CancelledError:
+                    outcome = "CANCELLED"
+                    raise
+                finally:
+                    grpc_server_call_duration.labels(method, _status(context, outcome)).observe(
+                        time.perf_counter() - started
+                    )
+
+            return grpc.unary_unary_rpc_method_handler(
+                unary_unary,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+
+        if handler.unary_stream:
+            inner_stream = handler.unary_stream
+
+            async def unary_stream(
+                request: Any, context: grpc.aio.ServicerContext
+            ) -> AsyncIterator[Any]:
+                started = time.perf_counter()
+                outcome = "UNKNOWN"
+                try:
+                    async for response in inner_stream(request, context):
+                        yield response
+                    outcome = "OK"
+                except (GeneratorExit, asyncio.CancelledError):
+                    # El cliente cortó el stream antes del final
+                    outcome = "CANCELLED"
+                    raise
+                finally:
+                    grpc_server_call_duration.labels(method, _status(context, outcome)).observe(
+                        time.perf_counter() - started
+                    )
+
+            return grpc.unary_stream_rpc_method_handler(
+                unary_stream,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+
+        return handler
@@ -0,0 +1,179 @@
+"""
+Caché de dos niveles: LRU en memoria (L1, por worker) delante de Redis (L2).
+
+Un acierto en L1 evita el round trip a Redis. Como cada worker tiene su propia
+L1, los borrados se difunden por pub/sub de Redis para que el resto de workers
+descarten su copia; el TTL corto de L1 acota la ventana de inconsistencia si
+algún mensaje se pierde.
+
+L1 guarda los valores ya decodificados, así que un acierto tampoco paga la
+deserialización; quien los lea no debe modificarlos.
+"""
+import asyncio
+import logging
+import time
+from typing import Any
+
+from libs.common.ttl_cache import TTLCache
+from services.products.domain.ports import CachePort
+from services.products.infrastructure.redis_cache import RedisCache
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "products:cache-invalidation"
+LISTENER_RETRY_DELAY = 1.0
+
+
+class LayeredCache(CachePort):
+    def __init__(
+        self,
+        remote: RedisCache,
+        max_size: int = 1000,
+        l1_ttl: float = 5,
+        channel: str = INVALIDATION_CHANNEL,
+    ) -> None:
+        """
+        Args:
+            remote: Caché Redis compartida entre workers
+            max_size: Número máximo de claves en L1
+            l1_ttl: Segundos que una clave vive en L1
+            channel: Canal pub/sub por el que se difunden los borrados
+        """
+        self.remote = remote
+        self.l1_ttl = l1_ttl
+        self.channel = channel
+        # Cada entrada de L1 es (valor, instante en que expira en Redis o None)
+        self._local = TTLCache(max_size)
+        # Se incrementa con cada invalidación: una lectura a Redis que empezó
+        # antes de un borrado no debe repoblar L1 con el valor antiguo
+        self._generation = 0
+
+        self.invalidations_received = 0
+
+    async def get(self, key: str) -> Any | None:
+        value, _ = await self.get_with_ttl(key)
+        return value
+
+    async def get_with_ttl(self, key: str) -> tuple[Any | None, float | None]:
+        lookup = self._local.get(key)
+        if lookup is not None:
+            value, remote_deadline = lookup.value
+            return value, _remaining(remote_deadline)
+
+        generation = self._generation
+        value, ttl = await self.remote.get_with_ttl(key)
+        if value is not None:
+            self._set_local(key, value, ttl, generation)
+        return value, ttl
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        await self.remote.set(key, value, ttl)
+        self._set_local(key, value, ttl)
+
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        values: dict[str, Any | None] = {}
+        misses = []
+        for key in keys:
+            lookup = self._local.get(key)
+            if lookup is not None:
+                values[key] = lookup.value[0]
+            else:
+                misses.append(key)
+
+        if misses:
+            generation = self._generation
+            for key, value in zip(misses, await self.remote.get_many(misses)):
+                values[key] = value
+                if value is not None:
+                    self._set_local(key, value, None, generation)
+
+        return [values[key] for key in keys]
+
+    async def set_many(self, items: dict[str, Any], ttl: int) -> None:
+        await self.remote.set_many(items, ttl)
+        for key, value in items.items():
+            self._set_local(key, value, ttl)
+
+    async def set_many_if_absent(self, items: dict[str, Any], ttl: int) -> list[str]:
+        # No se guarda en L1: si otro proceso escribió la clave antes, el valor
+        # que vale es el suyo y se leerá de Redis
+        return await self.remote.set_many_if_absent(items, ttl)
+
+    async def delete(self, key: str) -> None:
+        self.invalidate_local(key)
+        await self.remote.delete(key)
+        await self.remote.publish(self.channel, key)
+
+    async def delete_many(self, keys: list[str]) -> None:
+        if not keys:
+            return
+        for key in keys:
+            self.invalidate_local(key)
+        await self.remote.delete_many(keys)
+        # Un único mensaje con todas las claves, una por línea
+        await self.remote.publish(self.channel, "\n".join(keys))
+
+    async def incr(self, key: str) -> int:
+        value = await self.remote.incr(key)
+        # Los contadores se leen vía get(): el resto de workers debe soltar su copia
+        self.invalidate_local(key)
+        await self.remote.publish(self.channel, key)
+        return value
+
+    async def increment_score(self, key: str, member: str, amount: float = 1.0) -> None:
+        await self.remote.increment_score(key, member, amount)
+
+    async def top_scored(self, key: str, limit: int) -> list[str]:
+        return await self.remote.top_scored(key, limit)
+
+    async def decay_scores(self, key: str, factor: float, keep: int) -> None:
+        await self.remote.decay_scores(key, factor, keep)
+
+    async def acquire_lock(self, key: str, ttl_ms: int) -> str | None:
+        return await self.remote.acquire_lock(key, ttl_ms)
+
+    async def release_lock(self, key: str, token: str) -> None:
+        await self.remote.release_lock(key, token)
+
+    def invalidate_local(self, key: str) -> None:
+        self._generation += 1
+        self._local.delete(key)
+
+    async def listen_for_invalidations(self) -> None:
+        """
+        Escuchar los borrados publicados por otros workers y aplicarlos en L1.
+
+        Pensado para ejecutarse como tarea de fondo durante toda la vida del
+        proceso; si la suscripción se cae, vacía L1 (pudo perder mensajes) y
+        vuelve a suscribirse.
+        """
+        while True:
+            try:
+                async for message in self.remote.subscribe(self.channel):
+                    for key in message.split("\n"):
+                        self.invalidations_received += 1
+                        self.invalidate_local(key)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener disconnected: {e}")
+
+            self._generation += 1
+            self._local.clear()
+            await asyncio.sleep(LISTENER_RETRY_DELAY)
+
+    def stats(self) -> dict[str, Any]:
+        return {**self._local.stats(), "invalidations_received": self.invalidations_received}
+
+    def _set_local(
+        self, key: str, value: Any, ttl: float | None, generation: int | None = None
+    ) -> None:
+        if generation is not None and generation != self._generation:
+            return
+        remote_deadline = time.monotonic() + ttl if ttl is not None else None
+        local_ttl = min(self.l1_ttl, ttl) if ttl is not None else self.l1_ttl
+        self._local.set(key, (value, remote_deadline), local_ttl)
+
+
+def _remaining(deadline: float | None) -> float | None:
+    return max(0.0, deadline - time.monotonic()) if deadline is not None else None
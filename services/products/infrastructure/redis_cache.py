@@ -1,39 +1,197 @@
+import asyncio
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any
+
 import redis.asyncio as redis
 
+from libs.common.logging import timed
 from services.products.domain.ports import CachePort
+from services.products.infrastructure.cache_codec import CacheCodec
+
+# Borra el lock solo si sigue siendo nuestro (otro proceso pudo tomarlo al expirar)
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
 
 
 class RedisCache(CachePort):
-    def __init__(self, redis_url: str) -> None:
+    def __init__(
+        self,
+        redis_url: str,
+        codec: CacheCodec | None = None,
+        max_connections: int = 50,
+        pool_timeout: float = 5,
+        health_check_interval: int = 30,
+    ) -> None:
+        """
+        Args:
+            redis_url: URL de Redis (rediss:// para Upstash)
+            codec: Codificación de los valores (ver CacheCodec)
+            max_connections: Tamaño máximo del pool de conexiones
+            pool_timeout: Segundos que se espera una conexión libre con el pool lleno
+            health_check_interval: Segundos de inactividad tras los que una conexión
+                se comprueba con PING antes de reutilizarse
+        """
         self.redis_url = redis_url
+        self.codec = codec or CacheCodec()
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self.health_check_interval = health_check_interval
         self._redis: redis.Redis | None = None
+        self._pool: redis.BlockingConnectionPool | None = None
+        self._init_lock = asyncio.Lock()
 
     async def _get_redis(self) -> redis.Redis:
-        if self._redis is None:
-            # Upstash Redis requires SSL
-            self._redis = await redis.from_url(
-                self.redis_url,
-                decode_responses=True,
-                ssl_cert_reqs=None,  # Disable SSL certificate verification for Upstash
-                socket_keepalive=True,
-                socket_connect_timeout=5,
-                retry_on_timeout=True
-            )
+        if self._redis is not None:
+            return self._redis
+
+        # Evita que varias peticiones simultáneas creen cada una su cliente
+        async with self._init_lock:
+            if self._redis is None:
+                # Con el pool lleno se espera a que quede una conexión libre
+                # en lugar de fallar con "Too many connections"
+                self._pool = redis.BlockingConnectionPool.from_url(
+                    self.redis_url,
+                    max_connections=self.max_connections,
+                    timeout=self.pool_timeout,
+                    health_check_interval=self.health_check_interval,
+                    # Los valores son binarios (ver CacheCodec)
+                    decode_responses=False,
+                    ssl_cert_reqs=None,  # Disable SSL certificate verification for Upstash
+                    socket_keepalive=True,
+                    socket_connect_timeout=5,
+                    retry_on_timeout=True,
+                )
+                self._redis = redis.Redis(connection_pool=self._pool)
         return self._redis
 
-    async def get(self, key: str) -> str | None:
+    @timed("cache")
+    async def get(self, key: str) -> Any | None:
+        client = await self._get_redis()
+        return self._decode(await client.get(key))
+
+    @timed("cache")
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        client = await self._get_redis()
+        await client.set(key, self.codec.encode(value), ex=ttl)
+
+    @timed("cache")
+    async def get_with_ttl(self, key: str) -> tuple[Any | None, float | None]:
         client = await self._get_redis()
-        return await client.get(key)
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.get(key)
+            pipe.pttl(key)
+            value, pttl = await pipe.execute()
+        # PTTL devuelve -2 si la clave no existe y -1 si no tiene expiración
+        return self._decode(value), pttl / 1000 if pttl >= 0 else None
 
-    async def set(self, key: str, value: str, ttl: int) -> None:
+    @timed("cache")
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        if not keys:
+            return []
         client = await self._get_redis()
-        await client.set(key, value, ex=ttl)
+        return [self._decode(value) for value in await client.mget(keys)]
 
+    @timed("cache")
+    async def set_many(self, items: dict[str, Any], ttl: int) -> None:
+        if not items:
+            return
+        client = await self._get_redis()
+        # MSET has no TTL, so pipeline SET EX commands into a single round trip
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, self.codec.encode(value), ex=ttl)
+            await pipe.execute()
+
+    @timed("cache")
+    async def set_many_if_absent(self, items: dict[str, Any], ttl: int) -> list[str]:
+        if not items:
+            return []
+        client = await self._get_redis()
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, self.codec.encode(value), ex=ttl, nx=True)
+            stored = await pipe.execute()
+        return [key for key, ok in zip(items, stored) if ok]
+
+    @timed("cache")
     async def delete(self, key: str) -> None:
         client = await self._get_redis()
         await client.delete(key)
 
+    @timed("cache")
+    async def delete_many(self, keys: list[str]) -> None:
+        if not keys:
+            return
+        client = await self._get_redis()
+        await client.delete(*keys)
+
+    @timed("cache")
+    async def incr(self, key: str) -> int:
+        # Se guarda como entero en texto plano; el codec lo lee como JSON heredado
+        client = await self._get_redis()
+        return await client.incr(key)
+
+    @timed("cache")
+    async def increment_score(self, key: str, member: str, amount: float = 1.0) -> None:
+        client = await self._get_redis()
+        await client.zincrby(key, amount, member)
+
+    @timed("cache")
+    async def top_scored(self, key: str, limit: int) -> list[str]:
+        client = await self._get_redis()
+        return [member.decode() for member in await client.zrevrange(key, 0, limit - 1)]
+
+    @timed("cache")
+    async def decay_scores(self, key: str, factor: float, keep: int) -> None:
+        client = await self._get_redis()
+        # ZUNIONSTORE de la clave consigo misma con peso = multiplicar todos los
+        # puntos en el servidor; MULTI para que nadie lea el ranking a medias
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.zunionstore(key, {key: factor})
+            pipe.zremrangebyrank(key, 0, -(keep + 1))
+            await pipe.execute()
+
+    @timed("cache")
+    async def acquire_lock(self, key: str, ttl_ms: int) -> str | None:
+        client = await self._get_redis()
+        token = uuid.uuid4().hex
+        acquired = await client.set(key, token, nx=True, px=ttl_ms)
+        return token if acquired else None
+
+    @timed("cache")
+    async def release_lock(self, key: str, token: str) -> None:
+        client = await self._get_redis()
+        await client.eval(RELEASE_LOCK_SCRIPT, 1, key, token)
+
+    @timed("cache")
+    async def publish(self, channel: str, message: str) -> None:
+        client = await self._get_redis()
+        await client.publish(channel, message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[str]:
+        """Yield the messages published on `channel` until the caller stops iterating."""
+        client = await self._get_redis()
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield message["data"].decode()
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.close()
+
+    def _decode(self, value: bytes | None) -> Any | None:
+        return self.codec.decode(value) if value is not None else None
+
     async def close(self) -> None:
         if self._redis:
             await self._redis.close()
+        if self._pool:
+            await self._pool.disconnect()
 
@@ -1,20 +1,72 @@
+import time
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import String, any_, bindparam, delete, func, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from libs.common.logging import timed
 from services.products.domain.entities import Product
 from services.products.domain.ports import ProductRepository
 from services.products.infrastructure.database.models import ProductModel
 
 
+# Below this many rows the planner estimate is too coarse and an exact count is cheap
+APPROXIMATE_COUNT_THRESHOLD = 10_000
+COUNT_MODES = ("exact", "approximate")
+
+
+class TotalCountCache:
+    """Short-lived, process-local cache for the products collection total."""
+
+    def __init__(self) -> None:
+        self._value: int | None = None
+        self._expires_at = 0.0
+
+    def get(self) -> int | None:
+        if self._value is not None and time.monotonic() < self._expires_at:
+            return self._value
+        return None
+
+    def set(self, value: int, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        self._value = value
+        self._expires_at = time.monotonic() + ttl
+
+    def invalidate(self) -> None:
+        self._value = None
+        self._expires_at = 0.0
+
+
+# Shared by every repository instance in the worker (repositories are per-session)
+total_count_cache = TotalCountCache()
+
+
 class SupabaseProductRepository(ProductRepository):
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        count_mode: str = "exact",
+        total_cache_ttl: float = 5.0,
+    ) -> None:
+        """
+        Args:
+            session: Sesión asíncrona de SQLAlchemy
+            count_mode: "exact" (SELECT count(*)) o "approximate" (pg_class.reltuples)
+            total_cache_ttl: Segundos que se reutiliza el total de la colección (0 = sin cache)
+        """
+        if count_mode not in COUNT_MODES:
+            raise ValueError(f"Unsupported products count mode: {count_mode}")
         self.session = session
+        self.count_mode = count_mode
+        self.total_cache_ttl = total_cache_ttl
 
+    @timed("db")
     async def create(self, product_data: dict[str, Any]) -> Product:
         product_id = str(uuid.uuid4())
         now = datetime.utcnow()
@@ -32,9 +84,11 @@ class SupabaseProductRepository(ProductRepository):
         self.session.add(product_model)
         await self.session.commit()
         await self.session.refresh(product_model)
+        total_count_cache.invalidate()
 
         return self._to_entity(product_model)
 
+    @timed("db")
     async def get_by_id(self, product_id: str) -> Product | None:
         result = await self.session.execute(
             select(ProductModel).where(ProductModel.id == product_id)
@@ -46,58 +100,135 @@ class SupabaseProductRepository(ProductRepository):
 
         return self._to_entity(product_model)
 
-    async def update(self, product_id: str, product_data: dict[str, Any]) -> Product | None:
+    @timed("db")
+    async def get_many(self, product_ids: list[str]) -> list[Product]:
+        if not product_ids:
+            return []
+
+        # A single array parameter (= ANY($1)) keeps one prepared statement for any batch size
+        ids_param = bindparam("product_ids", list(product_ids), type_=ARRAY(String))
         result = await self.session.execute(
-            select(ProductModel).where(ProductModel.id == product_id)
+            select(ProductModel).where(ProductModel.id == any_(ids_param))
         )
-        product_model = result.scalar_one_or_none()
+        return [self._to_entity(model) for model in result.scalars().all()]
 
-        if not product_model:
-            return None
-
-        if "name" in product_data:
-            product_model.name = product_data["name"]
-        if "description" in product_data:
-            product_model.description = product_data["description"]
+    @timed("db")
+    async def update(self, product_id: str, product_data: dict[str, Any]) -> Product | None:
+        values: dict[str, Any] = {
+            field: product_data[field]
+            for field in ("name", "description", "images")
+            if field in product_data
+        }
         if "price" in product_data:
-            product_model.price = Decimal(str(product_data["price"]))
-        if "images" in product_data:
-            product_model.images = product_data["images"]
-
-        product_model.updated_at = datetime.utcnow()
-
+            values["price"] = Decimal(str(product_data["price"]))
+        # Same clock as the naive UTC timestamps written by create()
+        values["updated_at"] = func.timezone("utc", func.now())
+
+        # One round trip: UPDATE ... RETURNING instead of SELECT + UPDATE + refresh
+        result = await self.session.scalars(
+            update(ProductModel)
+            .where(ProductModel.id == product_id)
+            .values(**values)
+            .returning(ProductModel),
+            execution_options={"synchronize_session": False, "populate_existing": True},
+        )
+        product_model = result.one_or_none()
         await self.session.commit()
-        await self.session.refresh(product_model)
 
+        if not product_model:
+            return None
         return self._to_entity(product_model)
 
+    @timed("db")
     async def delete(self, product_id: str) -> bool:
-        result = await self.session.execute(
-            select(ProductModel).where(ProductModel.id == product_id)
+        deleted_id = await self.session.scalar(
+            delete(ProductModel)
+            .where(ProductModel.id == product_id)
+            .returning(ProductModel.id),
+            execution_options={"synchronize_session": False},
         )
-        product_model = result.scalar_one_or_none()
+        await self.session.commit()
 
-        if not product_model:
+        if deleted_id is None:
             return False
-
-        await self.session.delete(product_model)
-        await self.session.commit()
+        total_count_cache.invalidate()
         return True
 
+    @timed("db")
     async def list_products(self, page: int, size: int) -> tuple[list[Product], int]:
         offset = (page - 1) * size
 
-        count_result = await self.session.execute(select(ProductModel))
-        total = len(count_result.scalars().all())
-
         result = await self.session.execute(
-            select(ProductModel).offset(offset).limit(size)
+            select(ProductModel)
+            .order_by(ProductModel.created_at, ProductModel.id)
+            .offset(offset)
+            .limit(size)
         )
         product_models = result.scalars().all()
 
+        # A short first page already tells us the total without counting
+        if offset == 0 and len(product_models) < size:
+            total = len(product_models)
+        else:
+            total = await self._count_products()
+
         products = [self._to_entity(model) for model in product_models]
         return products, total
 
+    @timed("db")
+    async def list_products_after(
+        self, after: tuple[datetime, str] | None, size: int
+    ) -> tuple[list[Product], bool]:
+        query = select(ProductModel).order_by(ProductModel.created_at, ProductModel.id)
+        if after is not None:
+            # Row comparison lets Postgres seek ix_products_created_at_id directly
+            query = query.where(tuple_(ProductModel.created_at, ProductModel.id) > tuple_(*after))
+
+        # Fetch one extra row to know whether there is a next page
+        result = await self.session.execute(query.limit(size + 1))
+        product_models = result.scalars().all()
+
+        has_more = len(product_models) > size
+        products = [self._to_entity(model) for model in product_models[:size]]
+        return products, has_more
+
+    async def stream_products(
+        self, chunk_size: int, after: tuple[datetime, str] | None = None
+    ) -> AsyncIterator[list[Product]]:
+        query = (
+            select(ProductModel)
+            .order_by(ProductModel.created_at, ProductModel.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        if after is not None:
+            query = query.where(tuple_(ProductModel.created_at, ProductModel.id) > tuple_(*after))
+
+        # Server-side cursor: rows are pulled from Postgres one chunk at a time
+        result = await self.session.stream_scalars(query)
+        async for partition in result.partitions():
+            yield [self._to_entity(model) for model in partition]
+
+    async def _count_products(self) -> int:
+        cached = total_count_cache.get()
+        if cached is not None:
+            return cached
+
+        total: int | None = None
+        if self.count_mode == "approximate":
+            estimate = await self.session.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+                {"table": ProductModel.__tablename__},
+            )
+            # reltuples is -1 (or 0) until the table has been vacuumed/analyzed
+            if estimate is not None and estimate >= APPROXIMATE_COUNT_THRESHOLD:
+                total = int(estimate)
+
+        if total is None:
+            total = await self.session.scalar(select(func.count()).select_from(ProductModel))
+
+        total_count_cache.set(total, self.total_cache_ttl)
+        return total
+
     def _to_entity(self, model: ProductModel) -> Product:
         return Product(
             id=model.id,
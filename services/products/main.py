@@ -2,22 +2,32 @@ import asyncio
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from libs.common.logging import setup_logging
-from libs.common.middleware import (
-    ErrorHandlerMiddleware,
-    RequestIDMiddleware,
-    RequestLoggingMiddleware,
+from libs.common.logging import logging_stats, setup_logging
+from libs.common.metrics import MetricsMiddleware, mark_worker_dead, render_metrics
+from libs.common.middleware import RequestContextMiddleware
+from services.products.api.dependencies import (
+    PRODUCTS_ACCESS_DECAY_INTERVAL,
+    PRODUCTS_ACCESS_SAMPLE_RATE,
+    PRODUCTS_CACHE_WARMUP_TIMEOUT,
+    PRODUCTS_NEGATIVE_CACHE_TTL,
+    async_session_maker,
+    build_product_repository,
+    decay_product_access_ranking,
+    engine,
+    product_cache,
+    redis_cache,
+    warm_product_cache,
 )
-from services.products.api.dependencies import async_session_maker, engine
 from services.products.api.routes_v1 import router as products_router_v1
+from services.products.application.get_product import product_cache_stats
 from services.products.infrastructure.database.models import Base
-from services.products.infrastructure.grpc.grpc_server import serve_grpc
-from services.products.infrastructure.supabase_repository import SupabaseProductRepository
+from services.products.infrastructure.grpc.grpc_server import grpc_cache_stats, serve_grpc
 
 # Load environment variables from .env file
 env_path = Path(__file__).resolve().parent.parent.parent / ".env"
@@ -25,18 +35,50 @@ load_dotenv(env_path, override=True)
 
 SERVICE_NAME = "products"
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# Logging asíncrono: los registros se escriben en un hilo aparte vía una cola acotada
+LOG_ASYNC = os.getenv("LOG_ASYNC", "false").lower() == "true"
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_QUEUE_POLICY = os.getenv("LOG_QUEUE_POLICY", "drop")
+# Muestreo de logs de peticiones: 1 de cada N correctas, más errores y peticiones lentas
+LOG_REQUEST_SAMPLE_EVERY = int(os.getenv("LOG_REQUEST_SAMPLE_EVERY", "1"))
+LOG_SLOW_REQUEST_MS = float(os.getenv("LOG_SLOW_REQUEST_MS", "500"))
+# Desglose de tiempos (BD, caché, gRPC) en la cabecera Server-Timing y en el log
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "false").lower() == "true"
+
+logger = setup_logging(
+    SERVICE_NAME,
+    LOG_LEVEL,
+    async_mode=LOG_ASYNC,
+    queue_size=LOG_QUEUE_SIZE,
+    queue_policy=LOG_QUEUE_POLICY,
+)
 
-logger = setup_logging(SERVICE_NAME, LOG_LEVEL)
+cache_warmup: dict[str, Any] = {"status": "pending", "warmed": 0}
 
 
 async def run_grpc_server() -> None:
     """Run gRPC server in background."""
     grpc_port = int(os.getenv("PRODUCTS_GRPC_PORT", 50051))
-    # Create a long-lived session for gRPC server
-    session = async_session_maker()
-    repository = SupabaseProductRepository(session)
     logger.info(f"Starting gRPC server on port {grpc_port}")
-    await serve_grpc(repository, grpc_port)
+    # Cada RPC abre su propia sesión del pool; la caché es la misma que usa HTTP
+    await serve_grpc(
+        async_session_maker,
+        build_product_repository,
+        grpc_port,
+        cache=product_cache,
+        negative_ttl=PRODUCTS_NEGATIVE_CACHE_TTL,
+        access_sample_rate=PRODUCTS_ACCESS_SAMPLE_RATE,
+    )
+
+
+async def run_access_ranking_decay() -> None:
+    """Envejecer el ranking de accesos cada PRODUCTS_ACCESS_DECAY_INTERVAL segundos."""
+    while True:
+        await asyncio.sleep(PRODUCTS_ACCESS_DECAY_INTERVAL)
+        try:
+            await decay_product_access_ranking()
+        except Exception as e:
+            logger.warning(f"Product access ranking decay failed: {e!r}")
 
 
 @asynccontextmanager
@@ -47,19 +89,37 @@ async def lifespan(_app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    # Warm-up de la caché antes de aceptar tráfico; si falla se arranca en frío
+    try:
+        cache_warmup["warmed"] = await asyncio.wait_for(
+            warm_product_cache(), timeout=PRODUCTS_CACHE_WARMUP_TIMEOUT
+        )
+        cache_warmup["status"] = "done"
+    except Exception as e:
+        cache_warmup["status"] = "failed"
+        logger.warning(f"Product cache warm-up failed, starting cold: {e!r}")
+
     # Start gRPC server in background
     grpc_task = asyncio.create_task(run_grpc_server())
+    # Invalidaciones de la caché L1 publicadas por otros workers
+    invalidation_task = asyncio.create_task(product_cache.listen_for_invalidations())
+    background_tasks = [grpc_task, invalidation_task]
+    if PRODUCTS_ACCESS_DECAY_INTERVAL > 0:
+        background_tasks.append(asyncio.create_task(run_access_ranking_decay()))
 
     yield
 
     # Shutdown
     logger.info(f"{SERVICE_NAME} service shutting down")
-    grpc_task.cancel()
-    try:
-        await grpc_task
-    except asyncio.CancelledError:
-        pass
+    for task in background_tasks:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    await redis_cache.close()
     await engine.dispose()
+    mark_worker_dead()
 
 
 app = FastAPI(
@@ -78,27 +138,44 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["X-Request-ID"],
+    expose_headers=["X-Request-ID", "Server-Timing"],
     max_age=3600,
 )
-app.add_middleware(RequestLoggingMiddleware)
-app.add_middleware(RequestIDMiddleware)
-app.add_middleware(ErrorHandlerMiddleware)
+app.add_middleware(
+    RequestContextMiddleware,
+    sample_every=LOG_REQUEST_SAMPLE_EVERY,
+    slow_request_ms=LOG_SLOW_REQUEST_MS,
+    server_timing=SERVER_TIMING_ENABLED,
+)
+# Por fuera de RequestContextMiddleware: registra el estado final de cada respuesta
+app.add_middleware(MetricsMiddleware)
 
 # API v1 routes
 app.include_router(products_router_v1)
 
 
 @app.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> dict[str, Any]:
     return {
         "status": "healthy",
         "service": SERVICE_NAME,
+        "logging": logging_stats(),
         "http_port": os.getenv("PRODUCTS_SERVICE_PORT", "8001"),
         "grpc_port": os.getenv("PRODUCTS_GRPC_PORT", "50051"),
+        "l1_cache": product_cache.stats(),
+        "product_cache": product_cache_stats.snapshot(),
+        "grpc_cache": {rpc: stats.snapshot() for rpc, stats in grpc_cache_stats.items()},
+        "cache_warmup": cache_warmup,
+        "db_pool": engine.pool.stats(),
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    payload, content_type = render_metrics()
+    return Response(payload, media_type=content_type)
+
+
 if __name__ == "__main__":
     import uvicorn
 
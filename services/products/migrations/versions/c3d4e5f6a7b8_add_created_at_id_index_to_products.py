@@ -0,0 +1,26 @@
+"""add (created_at, id) index to products for keyset pagination
+
+Revision ID: c3d4e5f6a7b8
+Revises: b1c2d3e4f5a6
+Create Date: 2025-11-10 09:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b8'
+down_revision: str | Sequence[str] | None = 'b1c2d3e4f5a6'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - composite index backing cursor pagination."""
+    op.create_index('ix_products_created_at_id', 'products', ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema - drop composite index."""
+    op.drop_index('ix_products_created_at_id', 'products')
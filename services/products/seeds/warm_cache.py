@@ -0,0 +1,47 @@
+"""
+Warm-up de la caché de productos en Redis.
+
+Precarga los productos más consultados (ranking que alimenta GetProduct) y los
+de PRODUCTS_CACHE_WARMUP_IDS. Útil tras un deploy o un flush de Redis.
+
+Usage:
+    poetry run python -m seeds.warm_cache
+    poetry run python -m seeds.warm_cache --top 500
+    poetry run python -m seeds.warm_cache --ids product-01,product-02
+"""
+import argparse
+import asyncio
+from pathlib import Path
+
+# Load environment variables from .env BEFORE importing dependencies
+from dotenv import load_dotenv
+
+env_path = Path(__file__).resolve().parents[3] / ".env"
+load_dotenv(env_path, override=True)
+
+from api.dependencies import PRODUCTS_CACHE_WARMUP_TOP_N, redis_cache, warm_product_cache
+
+
+async def warm_cache(top_n: int, product_ids: list[str] | None) -> None:
+    try:
+        warmed = await warm_product_cache(top_n=top_n, product_ids=product_ids)
+        print(f"✅ Cached {warmed} products")
+    finally:
+        await redis_cache.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Preload the products cache")
+    parser.add_argument(
+        "--top", type=int, default=PRODUCTS_CACHE_WARMUP_TOP_N,
+        help="Most read products to preload",
+    )
+    parser.add_argument(
+        "--ids", default=None,
+        help="Comma-separated product IDs (defaults to PRODUCTS_CACHE_WARMUP_IDS)",
+    )
+    args = parser.parse_args()
+
+    ids = [pid.strip() for pid in args.ids.split(",") if pid.strip()] if args.ids else None
+    print("🔥 Warming products cache...")
+    asyncio.run(warm_cache(args.top, ids))
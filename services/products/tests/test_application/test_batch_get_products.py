@@ -0,0 +1,93 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from libs.common.cache_stats import CacheStats
+from libs.common.errors import ValidationError
+from services.products.application.batch_get_products import MAX_BATCH_SIZE, BatchGetProducts
+from services.products.application.get_product import PRODUCT_NOT_FOUND_MARKER
+from services.products.domain.entities import Product
+
+
+@pytest.mark.asyncio
+async def test_batch_get_products_mixes_cache_and_repository(
+    mock_repository: AsyncMock, mock_cache: AsyncMock, sample_product: Product
+) -> None:
+    cached_product = Product(**{**sample_product.to_dict(), "id": "cached-1"})
+    mock_cache.get_many.return_value = [cached_product.to_dict(), None, None]
+    mock_repository.get_many.return_value = [sample_product]
+    use_case = BatchGetProducts(mock_repository, mock_cache)
+
+    result = await use_case.execute(["cached-1", "test-123", "missing", "test-123"])
+
+    assert [p.id for p in result] == ["cached-1", "test-123"]
+    mock_cache.get_many.assert_called_once_with(
+        ["product:cached-1", "product:test-123", "product:missing"]
+    )
+    mock_repository.get_many.assert_called_once_with(["test-123", "missing"])
+    written = mock_cache.set_many.call_args.args[0]
+    assert list(written) == ["product:test-123"]
+    tombstones = mock_cache.set_many_if_absent.call_args.args[0]
+    assert tombstones == {"product:missing": PRODUCT_NOT_FOUND_MARKER}
+
+
+@pytest.mark.asyncio
+async def test_batch_get_products_all_cached(
+    mock_repository: AsyncMock, mock_cache: AsyncMock, sample_product: Product
+) -> None:
+    mock_cache.get_many.return_value = [sample_product.to_dict()]
+    use_case = BatchGetProducts(mock_repository, mock_cache)
+
+    result = await use_case.execute(["test-123"])
+
+    assert result[0].id == sample_product.id
+    mock_repository.get_many.assert_not_called()
+    mock_cache.set_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_get_products_skips_tombstoned_ids(
+    mock_repository: AsyncMock, mock_cache: AsyncMock
+) -> None:
+    mock_cache.get_many.return_value = [PRODUCT_NOT_FOUND_MARKER]
+    use_case = BatchGetProducts(mock_repository, mock_cache)
+
+    assert await use_case.execute(["missing"]) == []
+    mock_repository.get_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_get_products_without_cache(
+    mock_repository: AsyncMock, sample_product: Product
+) -> None:
+    mock_repository.get_many.return_value = [sample_product]
+    use_case = BatchGetProducts(mock_repository)
+
+    result = await use_case.execute(["test-123"])
+
+    assert result[0].id == sample_product.id
+    mock_repository.get_many.assert_called_once_with(["test-123"])
+
+
+@pytest.mark.asyncio
+async def test_batch_get_products_too_many_ids(mock_repository: AsyncMock) -> None:
+    use_case = BatchGetProducts(mock_repository)
+
+    with pytest.raises(ValidationError):
+        await use_case.execute([f"id-{i}" for i in range(MAX_BATCH_SIZE + 1)])
+
+    mock_repository.get_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_get_products_records_cache_stats(
+    mock_repository: AsyncMock, mock_cache: AsyncMock, sample_product: Product
+) -> None:
+    stats = CacheStats()
+    mock_cache.get_many.return_value = [sample_product.to_dict(), PRODUCT_NOT_FOUND_MARKER, None]
+    mock_repository.get_many.return_value = []
+    use_case = BatchGetProducts(mock_repository, mock_cache, stats=stats)
+
+    await use_case.execute(["test-123", "gone", "missing"])
+
+    assert stats.snapshot() == {"hits": 1, "negative_hits": 1, "misses": 1, "hit_ratio": 0.6667}
@@ -3,6 +3,7 @@ from decimal import Decimal
 from unittest.mock import AsyncMock
 
 from services.products.application.create_product import CreateProduct
+from services.products.application.get_product import PRODUCT_CACHE_TTL
 from services.products.domain.entities import Product
 
 
@@ -23,3 +24,19 @@ async def test_create_product(mock_repository: AsyncMock, sample_product: Produc
     assert result.name == sample_product.name
     mock_repository.create.assert_called_once_with(product_data)
 
+
+@pytest.mark.asyncio
+async def test_create_product_clears_not_found_marker(
+    mock_repository: AsyncMock, mock_cache: AsyncMock, sample_product: Product
+) -> None:
+    mock_repository.create.return_value = sample_product
+    use_case = CreateProduct(mock_repository, mock_cache)
+
+    await use_case.execute({"name": "Test Product", "price": Decimal("99.99")})
+
+    mock_cache.delete.assert_called_once_with("product:test-123")
+    # Written after the delete, so a tombstone from a racing read cannot stay
+    mock_cache.set.assert_called_once_with(
+        "product:test-123", sample_product.to_cache_dict(), ttl=PRODUCT_CACHE_TTL
+    )
+    mock_cache.incr.assert_called_once_with("products:list:generation")
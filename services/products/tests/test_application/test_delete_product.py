@@ -14,6 +14,7 @@ async def test_delete_product(mock_repository: AsyncMock, mock_cache: AsyncMock)
 
     mock_repository.delete.assert_called_once_with("test-123")
     mock_cache.delete.assert_called_once_with("product:test-123")
+    mock_cache.incr.assert_called_once_with("products:list:generation")
 
 
 @pytest.mark.asyncio
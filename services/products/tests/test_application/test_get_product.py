@@ -1,9 +1,13 @@
 import pytest
-import json
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock
 
+from libs.common.cache_stats import CacheStats
 from libs.common.errors import NotFoundError
-from services.products.application.get_product import GetProduct
+from services.products.application import get_product
+from services.products.application.get_product import PRODUCT_NOT_FOUND_MARKER, GetProduct
 from services.products.domain.entities import Product
 
 
@@ -11,13 +15,13 @@ from services.products.domain.entities import Product
 async def test_get_product_from_cache(
     mock_repository: AsyncMock, mock_cache: AsyncMock, sample_product: Product
 ) -> None:
-    mock_cache.get.return_value = json.dumps(sample_product.to_dict())
+    mock_cache.get_with_ttl.return_value = (sample_product.to_dict(), 300.0)
     use_case = GetProduct(mock_repository, mock_cache)
 
     result = await use_case.execute("test-123")
 
     assert result.id == sample_product.id
-    mock_cache.get.assert_called_once_with("product:test-123")
+    mock_cache.get_with_ttl.assert_called_once_with("product:test-123")
     mock_repository.get_by_id.assert_not_called()
 
 
@@ -25,7 +29,8 @@ async def test_get_product_from_cache(
 async def test_get_product_from_repository(
     mock_repository: AsyncMock, mock_cache: AsyncMock, sample_product: Product
 ) -> None:
-    mock_cache.get.return_value = None
+    mock_cache.get_with_ttl.return_value = (None, None)
+    mock_cache.acquire_lock.return_value = "token"
     mock_repository.get_by_id.return_value = sample_product
     use_case = GetProduct(mock_repository, mock_cache)
 
@@ -34,16 +39,173 @@ async def test_get_product_from_repository(
     assert result.id == sample_product.id
     mock_repository.get_by_id.assert_called_once_with("test-123")
     mock_cache.set.assert_called_once()
+    mock_cache.release_lock.assert_called_once_with("lock:product:test-123", "token")
 
 
 @pytest.mark.asyncio
 async def test_get_product_not_found(
     mock_repository: AsyncMock, mock_cache: AsyncMock
 ) -> None:
-    mock_cache.get.return_value = None
+    mock_cache.get_with_ttl.return_value = (None, None)
+    mock_cache.acquire_lock.return_value = "token"
     mock_repository.get_by_id.return_value = None
     use_case = GetProduct(mock_repository, mock_cache)
 
     with pytest.raises(NotFoundError):
         await use_case.execute("non-existent")
 
+    mock_cache.set_many_if_absent.assert_called_once_with(
+        {"product:non-existent": PRODUCT_NOT_FOUND_MARKER}, ttl=use_case.negative_ttl
+    )
+    mock_cache.set.assert_not_called()
+    mock_cache.release_lock.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_product_negative_cache_hit(
+    mock_repository: AsyncMock, mock_cache: AsyncMock
+) -> None:
+    mock_cache.get_with_ttl.return_value = (PRODUCT_NOT_FOUND_MARKER, 20.0)
+    stats = CacheStats()
+    use_case = GetProduct(mock_repository, mock_cache, stats=stats)
+
+    with pytest.raises(NotFoundError):
+        await use_case.execute("non-existent")
+
+    mock_repository.get_by_id.assert_not_called()
+    assert stats.snapshot()["negative_hits"] == 1
+    assert stats.snapshot()["hits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_product_negative_cache_disabled(
+    mock_repository: AsyncMock, mock_cache: AsyncMock
+) -> None:
+    mock_cache.get_with_ttl.return_value = (None, None)
+    mock_cache.acquire_lock.return_value = "token"
+    mock_repository.get_by_id.return_value = None
+    use_case = GetProduct(mock_repository, mock_cache, negative_ttl=0)
+
+    with pytest.raises(NotFoundError):
+        await use_case.execute("non-existent")
+
+    mock_cache.set.assert_not_called()
+    mock_cache.set_many_if_absent.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_product_waits_for_lock_holder(
+    mock_repository: AsyncMock,
+    mock_cache: AsyncMock,
+    sample_product: Product,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(get_product, "LOCK_POLL_INTERVAL", 0)
+    mock_cache.get_with_ttl.return_value = (None, None)
+    mock_cache.acquire_lock.return_value = None
+    mock_cache.get.side_effect = [None, sample_product.to_dict()]
+    use_case = GetProduct(mock_repository, mock_cache)
+
+    result = await use_case.execute("test-123")
+
+    assert result.id == sample_product.id
+    mock_repository.get_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_product_concurrent_misses_load_once(
+    mock_repository: AsyncMock, mock_cache: AsyncMock, sample_product: Product
+) -> None:
+    async def slow_get_by_id(product_id: str) -> Product:
+        await asyncio.sleep(0.01)
+        return sample_product
+
+    mock_cache.get_with_ttl.return_value = (None, None)
+    mock_cache.acquire_lock.return_value = "token"
+    mock_repository.get_by_id.side_effect = slow_get_by_id
+
+    results = await asyncio.gather(
+        *(GetProduct(mock_repository, mock_cache).execute("test-123") for _ in range(5))
+    )
+
+    assert all(result.id == sample_product.id for result in results)
+    mock_repository.get_by_id.assert_called_once_with("test-123")
+
+
+@pytest.mark.asyncio
+async def test_get_product_shared_load_survives_cancelled_leader(
+    mock_cache: AsyncMock, sample_product: Product
+) -> None:
+    session = {"open": False}
+    load_started = asyncio.Event()
+    release_load = asyncio.Event()
+
+    async def get_by_id(product_id: str) -> Product:
+        load_started.set()
+        await release_load.wait()
+        assert session["open"], "shared load ran on a closed session"
+        return sample_product
+
+    shared_repository = AsyncMock()
+    shared_repository.get_by_id.side_effect = get_by_id
+
+    @asynccontextmanager
+    async def open_repository() -> AsyncIterator[AsyncMock]:
+        session["open"] = True
+        try:
+            yield shared_repository
+        finally:
+            session["open"] = False
+
+    mock_cache.get_with_ttl.return_value = (None, None)
+    mock_cache.acquire_lock.return_value = "token"
+    leader_repository, follower_repository = AsyncMock(), AsyncMock()
+
+    leader = asyncio.create_task(
+        GetProduct(leader_repository, mock_cache, open_repository=open_repository).execute(
+            "test-123"
+        )
+    )
+    await load_started.wait()
+    follower = asyncio.create_task(
+        GetProduct(follower_repository, mock_cache, open_repository=open_repository).execute(
+            "test-123"
+        )
+    )
+    await asyncio.sleep(0)
+    leader.cancel()
+    release_load.set()
+
+    assert (await follower).id == sample_product.id
+    assert leader.cancelled()
+    shared_repository.get_by_id.assert_called_once_with("test-123")
+    leader_repository.get_by_id.assert_not_called()
+    assert not session["open"]
+
+
+@pytest.mark.asyncio
+async def test_get_product_refreshes_expiring_key(
+    mock_repository: AsyncMock, mock_cache: AsyncMock, sample_product: Product
+) -> None:
+    mock_cache.get_with_ttl.return_value = (sample_product.to_dict(), 0.0)
+    mock_repository.get_by_id.return_value = sample_product
+    use_case = GetProduct(mock_repository, mock_cache)
+
+    await use_case.execute("test-123")
+
+    mock_repository.get_by_id.assert_called_once_with("test-123")
+    mock_cache.set.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_product_records_sampled_access(
+    mock_repository: AsyncMock, mock_cache: AsyncMock, sample_product: Product
+) -> None:
+    mock_cache.get_with_ttl.return_value = (sample_product.to_dict(), 300.0)
+    use_case = GetProduct(mock_repository, mock_cache, access_sample_rate=1.0)
+
+    await use_case.execute("test-123")
+
+    mock_cache.increment_score.assert_called_once_with(
+        get_product.PRODUCT_ACCESS_RANKING_KEY, "test-123", 1.0
+    )
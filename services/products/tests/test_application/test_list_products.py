@@ -1,8 +1,14 @@
 import pytest
+from datetime import datetime
 from unittest.mock import AsyncMock
 
-from services.products.application.list_products import ListProducts
+from libs.common.errors import ValidationError
+from services.products.application.list_products import (
+    PRODUCT_LIST_GENERATION_KEY,
+    ListProducts,
+)
 from services.products.domain.entities import Product
+from services.products.domain.pagination import decode_cursor, encode_cursor
 
 
 @pytest.mark.asyncio
@@ -17,3 +23,73 @@ async def test_list_products(mock_repository: AsyncMock, sample_product: Product
     assert products[0].id == sample_product.id
     mock_repository.list_products.assert_called_once_with(1, 10)
 
+
+@pytest.mark.asyncio
+async def test_list_products_cached_page(
+    mock_repository: AsyncMock, mock_cache: AsyncMock, sample_product: Product
+) -> None:
+    mock_cache.get.side_effect = [3, {"products": [sample_product.to_dict()], "total": 1}]
+    use_case = ListProducts(mock_repository, mock_cache)
+
+    products, total = await use_case.execute(page=2, size=10)
+
+    assert products[0].id == sample_product.id
+    assert total == 1
+    mock_cache.get.assert_any_call(PRODUCT_LIST_GENERATION_KEY)
+    mock_cache.get.assert_called_with("products:list:v3:offset:2:10")
+    mock_repository.list_products.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_products_caches_page_under_current_generation(
+    mock_repository: AsyncMock, mock_cache: AsyncMock, sample_product: Product
+) -> None:
+    mock_cache.get.return_value = None
+    mock_repository.list_products_after.return_value = ([sample_product], False)
+    use_case = ListProducts(mock_repository, mock_cache)
+
+    await use_case.execute_cursor(None, size=5)
+
+    key, value = mock_cache.set.call_args.args
+    assert key == "products:list:v0:cursor::5"
+    assert value == {"products": [sample_product.to_cache_dict()], "next_cursor": None}
+
+
+@pytest.mark.asyncio
+async def test_list_products_cursor_first_page(
+    mock_repository: AsyncMock, sample_product: Product
+) -> None:
+    mock_repository.list_products_after.return_value = ([sample_product], True)
+    use_case = ListProducts(mock_repository)
+
+    products, next_cursor = await use_case.execute_cursor(None, size=1)
+
+    assert products[0].id == sample_product.id
+    assert decode_cursor(next_cursor) == (sample_product.created_at, sample_product.id)
+    mock_repository.list_products_after.assert_called_once_with(None, 1)
+
+
+@pytest.mark.asyncio
+async def test_list_products_cursor_last_page(
+    mock_repository: AsyncMock, sample_product: Product
+) -> None:
+    mock_repository.list_products_after.return_value = ([sample_product], False)
+    use_case = ListProducts(mock_repository)
+    cursor = encode_cursor(datetime(2023, 12, 31), "prev-id")
+
+    _, next_cursor = await use_case.execute_cursor(cursor, size=10)
+
+    assert next_cursor is None
+    mock_repository.list_products_after.assert_called_once_with(
+        (datetime(2023, 12, 31), "prev-id"), 10
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_products_invalid_cursor(mock_repository: AsyncMock) -> None:
+    use_case = ListProducts(mock_repository)
+
+    with pytest.raises(ValidationError):
+        await use_case.execute_cursor("not-a-cursor", size=10)
+
+    mock_repository.list_products_after.assert_not_called()
@@ -0,0 +1,60 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from libs.common.errors import ValidationError
+from services.products.application.stream_products import DEFAULT_CHUNK_SIZE, StreamProducts
+from services.products.domain.entities import Product
+from services.products.domain.pagination import decode_cursor, encode_cursor
+
+
+def _chunks(*chunks: list[Product]) -> AsyncIterator[list[Product]]:
+    async def generator() -> AsyncIterator[list[Product]]:
+        for chunk in chunks:
+            yield chunk
+
+    return generator()
+
+
+@pytest.mark.asyncio
+async def test_stream_products_yields_chunks_with_resume_cursor(
+    mock_repository: AsyncMock, sample_product: Product
+) -> None:
+    mock_repository.stream_products = MagicMock(
+        return_value=_chunks([sample_product], [], [sample_product])
+    )
+    use_case = StreamProducts(mock_repository)
+
+    chunks = [chunk async for chunk in use_case.execute()]
+
+    assert len(chunks) == 2
+    products, cursor = chunks[0]
+    assert products[0].id == sample_product.id
+    assert decode_cursor(cursor) == (sample_product.created_at, sample_product.id)
+    mock_repository.stream_products.assert_called_once_with(DEFAULT_CHUNK_SIZE, None)
+
+
+@pytest.mark.asyncio
+async def test_stream_products_resumes_after_cursor(mock_repository: AsyncMock) -> None:
+    mock_repository.stream_products = MagicMock(return_value=_chunks())
+    use_case = StreamProducts(mock_repository)
+    cursor = encode_cursor(datetime(2024, 1, 1), "product-01")
+
+    assert [chunk async for chunk in use_case.execute(chunk_size=50, cursor=cursor)] == []
+    mock_repository.stream_products.assert_called_once_with(
+        50, (datetime(2024, 1, 1), "product-01")
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("chunk_size", "cursor"), [(5000, None), (10, "garbage")])
+async def test_stream_products_rejects_invalid_arguments(
+    mock_repository: AsyncMock, chunk_size: int, cursor: str | None
+) -> None:
+    use_case = StreamProducts(mock_repository)
+
+    with pytest.raises(ValidationError):
+        async for _ in use_case.execute(chunk_size=chunk_size, cursor=cursor):
+            pass
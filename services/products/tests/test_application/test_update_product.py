@@ -20,6 +20,7 @@ async def test_update_product(
     assert result.id == sample_product.id
     mock_repository.update.assert_called_once_with("test-123", update_data)
     mock_cache.delete.assert_called_once_with("product:test-123")
+    mock_cache.incr.assert_called_once_with("products:list:generation")
 
 
 @pytest.mark.asyncio
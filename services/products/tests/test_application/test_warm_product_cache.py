@@ -0,0 +1,62 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.products.application.get_product import PRODUCT_ACCESS_RANKING_KEY
+from services.products.application.warm_product_cache import (
+    PRODUCT_ACCESS_DECAY_LOCK_KEY,
+    DecayProductAccessRanking,
+    WarmProductCache,
+)
+from services.products.domain.entities import Product
+
+
+@pytest.mark.asyncio
+async def test_warm_product_cache_merges_configured_and_top_ids(
+    mock_repository: AsyncMock, mock_cache: AsyncMock, sample_product: Product
+) -> None:
+    mock_cache.top_scored.return_value = ["test-123", "gone"]
+    mock_repository.get_many.return_value = [sample_product]
+    use_case = WarmProductCache(mock_repository, mock_cache)
+
+    warmed = await use_case.execute(top_n=2, product_ids=["test-123"])
+
+    assert warmed == 1
+    mock_cache.top_scored.assert_called_once_with(PRODUCT_ACCESS_RANKING_KEY, 2)
+    mock_repository.get_many.assert_called_once_with(["test-123", "gone"])
+    written = mock_cache.set_many.call_args.args[0]
+    assert written == {"product:test-123": sample_product.to_cache_dict()}
+
+
+@pytest.mark.asyncio
+async def test_warm_product_cache_nothing_to_warm(
+    mock_repository: AsyncMock, mock_cache: AsyncMock
+) -> None:
+    use_case = WarmProductCache(mock_repository, mock_cache)
+
+    assert await use_case.execute(top_n=0) == 0
+    mock_cache.top_scored.assert_not_called()
+    mock_repository.get_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_decay_access_ranking_halves_and_trims(mock_cache: AsyncMock) -> None:
+    mock_cache.acquire_lock.return_value = "token"
+    use_case = DecayProductAccessRanking(mock_cache)
+
+    applied = await use_case.execute(3600, factor=0.5, keep=200)
+
+    assert applied is True
+    mock_cache.acquire_lock.assert_called_once_with(PRODUCT_ACCESS_DECAY_LOCK_KEY, 3_600_000)
+    mock_cache.decay_scores.assert_called_once_with(PRODUCT_ACCESS_RANKING_KEY, 0.5, 200)
+    # The lock is the "already decayed this interval" marker; it must expire, not be released
+    mock_cache.release_lock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_decay_access_ranking_once_per_interval(mock_cache: AsyncMock) -> None:
+    mock_cache.acquire_lock.return_value = None
+    use_case = DecayProductAccessRanking(mock_cache)
+
+    assert await use_case.execute(3600) is False
+    mock_cache.decay_scores.assert_not_called()
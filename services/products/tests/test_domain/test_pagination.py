@@ -0,0 +1,20 @@
+from datetime import datetime
+
+import pytest
+
+from services.products.domain.pagination import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2024, 1, 1, 12, 0, 0, 123456)
+
+    cursor = encode_cursor(created_at, "product-01")
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, "product-01")
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "bm9zZXBhcmF0b3I"])
+def test_decode_invalid_cursor(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
@@ -0,0 +1,83 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import msgpack
+import pytest
+
+from services.products.domain.entities import Product
+from services.products.infrastructure.cache_codec import (
+    FORMAT_MSGPACK,
+    FORMAT_TYPED,
+    FORMAT_TYPED_LZ4,
+    FORMAT_TYPED_ZLIB,
+    CacheCodec,
+)
+
+
+def test_cache_codec_round_trips_small_values_uncompressed(sample_product: Product) -> None:
+    codec = CacheCodec()
+
+    data = codec.encode(sample_product.to_cache_dict())
+
+    assert data[0] == FORMAT_TYPED
+    assert codec.decode(data) == sample_product.to_cache_dict()
+
+
+def test_cache_codec_keeps_decimal_and_datetime_types() -> None:
+    codec = CacheCodec()
+    value = {
+        "price": Decimal("1299.990"),
+        "naive": datetime(2024, 1, 1, 12, 0, 0, 123456),
+        "aware": datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+    }
+
+    decoded = codec.decode(codec.encode(value))
+
+    assert decoded == value
+    assert str(decoded["price"]) == "1299.990"
+    assert decoded["naive"].tzinfo is None
+    assert decoded["aware"].tzinfo == timezone.utc
+
+
+@pytest.mark.parametrize(
+    ("compression", "expected_format"),
+    [("zlib", FORMAT_TYPED_ZLIB), ("lz4", FORMAT_TYPED_LZ4)],
+)
+def test_cache_codec_compresses_large_values(
+    sample_product: Product, compression: str, expected_format: int
+) -> None:
+    value = {**sample_product.to_cache_dict(), "description": "long description " * 200}
+    codec = CacheCodec(compression=compression, compress_threshold=256)
+
+    data = codec.encode(value)
+
+    assert data[0] == expected_format
+    assert len(data) < len(json.dumps(value, default=str))
+    assert codec.decode(data) == value
+
+
+def test_cache_codec_defaults_to_lz4() -> None:
+    codec = CacheCodec(compress_threshold=256)
+
+    assert codec.decode(codec.encode("x" * 1024)) == "x" * 1024
+    assert codec.encode("x" * 1024)[0] == FORMAT_TYPED_LZ4
+
+
+def test_cache_codec_reads_untyped_msgpack_entries(sample_product: Product) -> None:
+    codec = CacheCodec()
+    data = bytes([FORMAT_MSGPACK]) + msgpack.packb(sample_product.to_dict(), use_bin_type=True)
+
+    assert Product.from_dict(codec.decode(data)).price == sample_product.price
+
+
+def test_cache_codec_reads_legacy_json_and_plain_text(sample_product: Product) -> None:
+    codec = CacheCodec()
+
+    assert codec.decode(json.dumps(sample_product.to_dict()).encode()) == sample_product.to_dict()
+    assert codec.decode(b"__not_found__") == "__not_found__"
+
+
+def test_cache_codec_rejects_unknown_compression() -> None:
+    with pytest.raises(ValueError):
+        CacheCodec(compression="brotli")
@@ -0,0 +1,76 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from services.products.infrastructure.database.pool import InstrumentedAsyncQueuePool
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_track_checkouts_and_utilization() -> None:
+    pool = InstrumentedAsyncQueuePool(MagicMock, pool_size=2, max_overflow=2)
+
+    first = await greenlet_spawn(pool.connect)
+    second = await greenlet_spawn(pool.connect)
+    first.close()
+
+    stats = pool.stats()
+    second.close()
+    assert stats["checkouts"] == 2
+    assert stats["checked_out"] == 1
+    assert stats["utilization"] == 0.25
+    assert stats["wait_max_ms"] >= stats["wait_avg_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_count_checkout_timeouts() -> None:
+    pool = InstrumentedAsyncQueuePool(MagicMock, pool_size=1, max_overflow=0, timeout=0.01)
+    held = await greenlet_spawn(pool.connect)
+
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    stats = pool.stats()
+    held.close()
+    assert stats["timeouts"] == 1
+    assert stats["checkouts"] == 2
+    # The failed checkout waited the whole pool_timeout
+    assert stats["wait_max_ms"] >= 10
+    assert stats["utilization"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_account_time_waiting_for_a_connection() -> None:
+    pool = InstrumentedAsyncQueuePool(MagicMock, pool_size=1, max_overflow=0, timeout=5)
+    held = await greenlet_spawn(pool.connect)
+
+    waiter = asyncio.create_task(greenlet_spawn(pool.connect))
+    await asyncio.sleep(0.05)
+    held.close()
+    second = await waiter
+
+    stats = pool.stats()
+    second.close()
+    assert stats["checkouts"] == 2
+    assert stats["wait_max_ms"] >= 40
+    assert stats["wait_avg_ms"] == pytest.approx(stats["wait_max_ms"] / 2, rel=0.2)
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_payload() -> None:
+    pool = InstrumentedAsyncQueuePool(MagicMock, pool_size=3, max_overflow=1, timeout=0.05)
+
+    assert pool.stats() == {
+        "size": 3,
+        "max_overflow": 1,
+        "checked_out": 0,
+        "checked_in": 0,
+        "overflow": 0,
+        "utilization": 0.0,
+        "checkouts": 0,
+        "timeouts": 0,
+        "wait_avg_ms": 0.0,
+        "wait_max_ms": 0.0,
+    }
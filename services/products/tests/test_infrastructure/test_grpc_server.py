@@ -0,0 +1,149 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.products.domain.entities import Product
+from services.products.domain.pagination import encode_cursor
+from services.products.infrastructure.grpc.grpc_server import ProductsServicer
+from services.products.infrastructure.grpc.products import products_pb2
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.open = False
+        self.closed = False
+
+    async def __aenter__(self) -> "FakeSession":
+        self.open = True
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.open = False
+        self.closed = True
+
+
+class FakeSessionFactory:
+    def __init__(self) -> None:
+        self.sessions: list[FakeSession] = []
+
+    def __call__(self) -> FakeSession:
+        self.sessions.append(FakeSession())
+        return self.sessions[-1]
+
+
+@pytest.fixture
+def session_factory() -> FakeSessionFactory:
+    return FakeSessionFactory()
+
+
+@pytest.fixture
+def servicer(session_factory: FakeSessionFactory, sample_product: Product) -> ProductsServicer:
+    def build_repository(session: FakeSession) -> AsyncMock:
+        return AsyncMock(get_by_id=AsyncMock(return_value=sample_product))
+
+    return ProductsServicer(session_factory, build_repository)
+
+
+@pytest.fixture
+def context() -> MagicMock:
+    context = MagicMock()
+    context.abort = AsyncMock()
+    return context
+
+
+@pytest.mark.asyncio
+async def test_each_rpc_opens_and_closes_its_own_session(
+    servicer: ProductsServicer, session_factory: FakeSessionFactory, context: MagicMock
+) -> None:
+    request = products_pb2.GetProductRequest(product_id="test-123")
+
+    first = await servicer.GetProduct(request, context)
+    await servicer.ProductExists(products_pb2.ProductExistsRequest(product_id="test-123"), context)
+
+    assert first.product.id == "test-123"
+    assert len(session_factory.sessions) == 2
+    assert all(session.closed for session in session_factory.sessions)
+    context.abort.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rpcs_do_not_share_a_session(
+    servicer: ProductsServicer,
+    session_factory: FakeSessionFactory,
+    sample_product: Product,
+    context: MagicMock,
+) -> None:
+    release = asyncio.Event()
+
+    async def slow_get_by_id(product_id: str) -> Product:
+        await release.wait()
+        return sample_product
+
+    servicer.build_repository = lambda session: AsyncMock(get_by_id=slow_get_by_id)
+    request = products_pb2.GetProductRequest(product_id="test-123")
+    calls = [asyncio.create_task(servicer.GetProduct(request, context)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    first, second = session_factory.sessions
+    assert first is not second
+    assert first.open and second.open
+
+    release.set()
+    await asyncio.gather(*calls)
+    assert first.closed and second.closed
+
+
+@pytest.mark.asyncio
+async def test_stream_products_keeps_one_session_for_the_whole_stream(
+    servicer: ProductsServicer,
+    session_factory: FakeSessionFactory,
+    sample_product: Product,
+    context: MagicMock,
+) -> None:
+    later = Product(
+        **{
+            **sample_product.to_cache_dict(),
+            "id": "test-456",
+            "created_at": sample_product.created_at + timedelta(days=1),
+        }
+    )
+
+    async def stream_products(
+        chunk_size: int, after: Any = None
+    ) -> AsyncIterator[list[Product]]:
+        yield [sample_product]
+        yield [later]
+
+    servicer.build_repository = lambda session: MagicMock(stream_products=stream_products)
+
+    responses = []
+    async for response in servicer.StreamProducts(
+        products_pb2.StreamProductsRequest(chunk_size=1), context
+    ):
+        responses.append(response)
+        assert session_factory.sessions[0].open
+
+    assert [[p.id for p in r.products] for r in responses] == [["test-123"], ["test-456"]]
+    assert responses[-1].cursor == encode_cursor(later.created_at, later.id)
+    assert len(session_factory.sessions) == 1
+    assert session_factory.sessions[0].closed
+
+
+@pytest.mark.asyncio
+async def test_stream_products_rejects_an_invalid_chunk_size(
+    servicer: ProductsServicer, session_factory: FakeSessionFactory, context: MagicMock
+) -> None:
+    responses = [
+        response
+        async for response in servicer.StreamProducts(
+            products_pb2.StreamProductsRequest(chunk_size=100_000), context
+        )
+    ]
+
+    assert responses == []
+    assert context.abort.await_args.args[0].name == "INVALID_ARGUMENT"
+    assert session_factory.sessions[0].closed
@@ -0,0 +1,96 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.products.infrastructure.layered_cache import INVALIDATION_CHANNEL, LayeredCache
+
+
+@pytest.mark.asyncio
+async def test_layered_cache_serves_repeated_reads_from_l1(mock_cache: AsyncMock) -> None:
+    mock_cache.get_with_ttl.return_value = ('{"id": "test-123"}', 120.0)
+    cache = LayeredCache(mock_cache)
+
+    assert await cache.get("product:test-123") == '{"id": "test-123"}'
+    value, ttl = await cache.get_with_ttl("product:test-123")
+
+    assert value == '{"id": "test-123"}'
+    assert 0 < ttl <= 120
+    mock_cache.get_with_ttl.assert_called_once_with("product:test-123")
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_layered_cache_does_not_cache_remote_misses(mock_cache: AsyncMock) -> None:
+    mock_cache.get_with_ttl.return_value = (None, None)
+    cache = LayeredCache(mock_cache)
+
+    assert await cache.get("product:missing") is None
+    assert await cache.get("product:missing") is None
+
+    assert mock_cache.get_with_ttl.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_layered_cache_delete_publishes_invalidation(mock_cache: AsyncMock) -> None:
+    cache = LayeredCache(mock_cache)
+    await cache.set("product:test-123", "cached", ttl=300)
+
+    await cache.delete("product:test-123")
+
+    mock_cache.delete.assert_called_once_with("product:test-123")
+    mock_cache.publish.assert_called_once_with(INVALIDATION_CHANNEL, "product:test-123")
+    mock_cache.get_with_ttl.return_value = (None, None)
+    assert await cache.get("product:test-123") is None
+
+
+@pytest.mark.asyncio
+async def test_layered_cache_delete_many_is_one_round_trip(mock_cache: AsyncMock) -> None:
+    cache = LayeredCache(mock_cache)
+    await cache.set("product:a", "a", ttl=300)
+
+    await cache.delete_many(["product:a", "product:b"])
+
+    mock_cache.delete_many.assert_called_once_with(["product:a", "product:b"])
+    mock_cache.publish.assert_called_once_with(INVALIDATION_CHANNEL, "product:a\nproduct:b")
+    assert len(cache._local) == 0
+
+
+@pytest.mark.asyncio
+async def test_layered_cache_get_many_only_fetches_l1_misses(mock_cache: AsyncMock) -> None:
+    cache = LayeredCache(mock_cache)
+    await cache.set("product:a", "a", ttl=300)
+    mock_cache.get_many.return_value = ["b", None]
+
+    values = await cache.get_many(["product:a", "product:b", "product:c"])
+
+    assert values == ["a", "b", None]
+    mock_cache.get_many.assert_called_once_with(["product:b", "product:c"])
+
+
+@pytest.mark.asyncio
+async def test_layered_cache_invalidation_during_remote_read_skips_l1(
+    mock_cache: AsyncMock,
+) -> None:
+    cache = LayeredCache(mock_cache)
+
+    async def remote_get(key: str) -> tuple[str, float]:
+        cache.invalidate_local(key)
+        return "stale", 60.0
+
+    mock_cache.get_with_ttl.side_effect = remote_get
+
+    assert await cache.get("product:test-123") == "stale"
+    assert len(cache._local) == 0
+
+
+@pytest.mark.asyncio
+async def test_layered_cache_set_if_absent_skips_l1(mock_cache: AsyncMock) -> None:
+    mock_cache.set_many_if_absent.return_value = ["product:missing"]
+    mock_cache.get_with_ttl.return_value = ({"id": "missing"}, 300.0)
+    cache = LayeredCache(mock_cache)
+
+    stored = await cache.set_many_if_absent({"product:missing": "__not_found__"}, ttl=30)
+
+    assert stored == ["product:missing"]
+    # Whatever Redis holds wins: a concurrent writer may have replaced the value
+    assert await cache.get("product:missing") == {"id": "missing"}
@@ -0,0 +1,174 @@
+from collections.abc import AsyncIterator, Iterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from services.products.domain.entities import Product
+from services.products.infrastructure import supabase_repository
+from services.products.infrastructure.database.models import ProductModel
+from services.products.infrastructure.supabase_repository import (
+    APPROXIMATE_COUNT_THRESHOLD,
+    SupabaseProductRepository,
+    TotalCountCache,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_total_count_cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(supabase_repository, "total_count_cache", TotalCountCache())
+    yield
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    session = MagicMock()
+    session.scalar = AsyncMock()
+    session.scalars = AsyncMock()
+    session.commit = AsyncMock()
+    return session
+
+
+def test_total_count_cache_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(supabase_repository.time, "monotonic", lambda: now[0])
+    cache = TotalCountCache()
+
+    cache.set(42, ttl=5)
+    assert cache.get() == 42
+
+    now[0] += 5
+    assert cache.get() is None
+
+
+def test_total_count_cache_ttl_zero_disables_caching() -> None:
+    cache = TotalCountCache()
+
+    cache.set(42, ttl=0)
+
+    assert cache.get() is None
+
+
+def test_unknown_count_mode_is_rejected(session: MagicMock) -> None:
+    with pytest.raises(ValueError, match="approx"):
+        SupabaseProductRepository(session, count_mode="approx")
+
+
+@pytest.mark.asyncio
+async def test_exact_count_is_cached(session: MagicMock) -> None:
+    session.scalar.return_value = 7
+    repository = SupabaseProductRepository(session, count_mode="exact", total_cache_ttl=5)
+
+    assert await repository._count_products() == 7
+    assert await repository._count_products() == 7
+    session.scalar.assert_awaited_once()
+    assert "count(*)" in str(session.scalar.await_args.args[0])
+
+
+@pytest.mark.asyncio
+async def test_approximate_count_uses_the_planner_estimate(session: MagicMock) -> None:
+    session.scalar.return_value = APPROXIMATE_COUNT_THRESHOLD * 5
+    repository = SupabaseProductRepository(session, count_mode="approximate")
+
+    assert await repository._count_products() == APPROXIMATE_COUNT_THRESHOLD * 5
+    assert "reltuples" in str(session.scalar.await_args.args[0])
+
+
+@pytest.mark.asyncio
+async def test_approximate_count_falls_back_to_exact_for_small_tables(
+    session: MagicMock,
+) -> None:
+    session.scalar.side_effect = [-1, 12]
+    repository = SupabaseProductRepository(session, count_mode="approximate")
+
+    assert await repository._count_products() == 12
+    assert session.scalar.await_count == 2
+
+
+def compiled(statement: object) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_update_is_a_single_update_returning(session: MagicMock) -> None:
+    result = MagicMock()
+    result.one_or_none.return_value = None
+    session.scalars.return_value = result
+    repository = SupabaseProductRepository(session)
+
+    assert await repository.update("missing", {"name": "New name"}) is None
+
+    session.scalars.assert_awaited_once()
+    sql = compiled(session.scalars.await_args.args[0])
+    assert sql.startswith("UPDATE products SET")
+    assert "RETURNING" in sql
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_returns_the_updated_row(session: MagicMock, sample_product: Product) -> None:
+    model = ProductModel(
+        id=sample_product.id,
+        name="New name",
+        description=sample_product.description,
+        price=sample_product.price,
+        images=sample_product.images,
+        created_at=sample_product.created_at,
+        updated_at=sample_product.updated_at,
+    )
+    result = MagicMock()
+    result.one_or_none.return_value = model
+    session.scalars.return_value = result
+    repository = SupabaseProductRepository(session)
+
+    product = await repository.update(sample_product.id, {"name": "New name"})
+
+    assert product.name == "New name"
+    assert product.id == sample_product.id
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("deleted_id", "deleted"), [("test-123", True), (None, False)])
+async def test_delete_is_a_single_delete_returning(
+    session: MagicMock, deleted_id: str | None, deleted: bool
+) -> None:
+    supabase_repository.total_count_cache.set(10, ttl=60)
+    session.scalar.return_value = deleted_id
+    repository = SupabaseProductRepository(session)
+
+    assert await repository.delete("test-123") is deleted
+
+    session.scalar.assert_awaited_once()
+    sql = compiled(session.scalar.await_args.args[0])
+    assert sql.startswith("DELETE FROM products")
+    assert sql.endswith("RETURNING products.id")
+    # Only a real delete changes the total
+    assert (supabase_repository.total_count_cache.get() is None) is deleted
+
+
+@pytest.mark.asyncio
+async def test_stream_products_reads_a_server_side_cursor_in_chunks(
+    session: MagicMock, sample_product: Product
+) -> None:
+    models = [
+        ProductModel(**{**sample_product.to_cache_dict(), "id": f"test-{i}"}) for i in range(3)
+    ]
+
+    async def partitions() -> AsyncIterator[list[ProductModel]]:
+        yield models[:2]
+        yield models[2:]
+
+    session.stream_scalars = AsyncMock(return_value=MagicMock(partitions=partitions))
+    repository = SupabaseProductRepository(session)
+
+    chunks = [
+        [p.id for p in chunk]
+        async for chunk in repository.stream_products(2, (sample_product.created_at, "test-0"))
+    ]
+
+    assert chunks == [["test-0", "test-1"], ["test-2"]]
+    query = session.stream_scalars.await_args.args[0]
+    assert query.get_execution_options()["yield_per"] == 2
+    sql = compiled(query)
+    assert "(products.created_at, products.id) > (" in sql
+    assert "ORDER BY products.created_at, products.id" in sql